@@ -0,0 +1,27 @@
+"""Fixtures shared by the test suites."""
+
+import numpy as np
+import pytest
+
+EPS = np.finfo(float).eps
+
+
+def _assert_close(actual, expected, ulps: float, scale: float = 1.0) -> None:
+    """Asserts the values agree to within a number of ULPs of their scale."""
+    actual = np.asarray(actual, dtype=float)
+    expected = np.asarray(expected, dtype=float)
+    magnitude = np.maximum(np.maximum(np.abs(actual), np.abs(expected)), scale)
+    error = np.abs(actual - expected)
+    budget = ulps * EPS * magnitude
+    assert np.all(error <= budget), (
+        f"error {float(np.max(error / magnitude / EPS)):.1f} ULPs "
+        f"exceeds the budget of {ulps} ULPs"
+    )
+
+
+@pytest.fixture(scope="session")
+def assert_close():
+    """Returns a function that asserts values agree to within a number of
+    ULPs of their scale, as ``assert_close(actual, expected, ulps, scale=1)``.
+    """
+    return _assert_close
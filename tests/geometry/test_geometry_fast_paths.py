@@ -0,0 +1,255 @@
+"""Differential tests of the vectorized geometry against the scalar classes.
+
+Each test generates random inputs, including values near the small angle
+thresholds of Pose2d.exp and Pose2d.log, and checks that the fast path
+agrees with the reference scalar code to within an explicit error budget,
+measured in units in the last place (ULPs) of the scale of the values.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from wpilib.geometry import (
+    Pose2d,
+    Pose2dArray,
+    Pose3d,
+    Pose3dArray,
+    Rotation2d,
+    Rotation2dArray,
+    Rotation3d,
+    Transform2d,
+    Translation2d,
+    Translation2dArray,
+    Twist2d,
+    Twist3d,
+    compose_scan,
+)
+
+
+@pytest.fixture(scope="session")
+def assert_poses_close(assert_close):
+    def assert_poses_close(actual: Pose2d, expected: Pose2d, ulps: float, scale: float):
+        assert_close(
+            (actual.translation.x, actual.translation.y),
+            (expected.translation.x, expected.translation.y),
+            ulps,
+            scale,
+        )
+        assert_close(
+            (actual.rotation.cos, actual.rotation.sin),
+            (expected.rotation.cos, expected.rotation.sin),
+            ulps,
+        )
+
+    return assert_poses_close
+
+
+coordinates = st.floats(-100, 100, allow_nan=False)
+angles = st.one_of(
+    st.floats(-math.pi, math.pi),
+    # Around the small angle threshold of Pose2d.exp.
+    st.floats(-2e-9, 2e-9),
+    st.sampled_from([1e-9, -1e-9, np.nextafter(1e-9, 0), np.nextafter(-1e-9, 0)]),
+    # Around the threshold of Pose2d.log, where 1 - cos(dtheta) < 1e-9.
+    st.floats(-1e-4, 1e-4),
+)
+twists = st.tuples(
+    st.floats(-1, 1, allow_nan=False), st.floats(-1, 1, allow_nan=False), angles
+)
+poses = st.builds(
+    lambda x, y, theta: Pose2d(x, y, Rotation2d(theta)),
+    coordinates,
+    coordinates,
+    st.floats(-math.pi, math.pi),
+)
+
+
+@given(st.lists(st.tuples(poses, twists), min_size=1, max_size=20))
+def test_pose_array_exp(assert_poses_close, cases):
+    starts = Pose2dArray.fromPoses(pose for pose, _ in cases)
+    results = starts.exp([twist for _, twist in cases])
+
+    for i, (pose, twist) in enumerate(cases):
+        assert_poses_close(results[i], pose.exp(Twist2d(*twist)), ulps=8, scale=100)
+
+
+@given(st.lists(st.tuples(poses, twists), min_size=1, max_size=20))
+def test_pose_array_log(assert_close, cases):
+    starts = Pose2dArray.fromPoses(pose for pose, _ in cases)
+    ends = Pose2dArray.fromPoses(pose.exp(Twist2d(*twist)) for pose, twist in cases)
+    results = starts.log(ends)
+
+    for i, (pose, _) in enumerate(cases):
+        expected = pose.log(ends[i])
+        assert_close(
+            results[i], (expected.dx, expected.dy, expected.dtheta), ulps=64, scale=100
+        )
+
+
+@given(poses, twists)
+def test_exp_log_round_trip(assert_poses_close, pose, twist):
+    end = pose.exp(Twist2d(*twist))
+    # log subtracts nearby poses far from the origin, which loses precision.
+    assert_poses_close(pose.exp(pose.log(end)), end, ulps=256, scale=100)
+
+
+@settings(deadline=None)
+@given(poses, st.lists(twists, min_size=1, max_size=300))
+def test_compose_scan(assert_poses_close, initial, steps):
+    transforms = Pose2dArray.fromTwists(steps)
+    results = compose_scan(transforms, initial)
+
+    # Rounding errors grow with the length of the chain in either order.
+    ulps = 16 * len(steps) + 64
+    scale = 100 + len(steps)
+    pose = initial
+    for i in range(len(steps)):
+        pose = pose + Transform2d(transforms.translation[i], transforms.rotation[i])
+        assert_poses_close(results[i], pose, ulps, scale)
+
+
+@given(
+    st.lists(st.tuples(st.floats(-10, 10), st.floats(-10, 10)), min_size=1, max_size=20)
+)
+def test_rotation_array_arithmetic(assert_close, pairs):
+    a = Rotation2dArray.fromRadians([first for first, _ in pairs])
+    b = Rotation2dArray.fromRadians([second for _, second in pairs])
+
+    for result, combine in (
+        (a + b, lambda x, y: x + y),
+        (a - b, lambda x, y: x - y),
+        (-a, lambda x, y: -x),
+    ):
+        for i, (first, second) in enumerate(pairs):
+            expected = combine(Rotation2d(first), Rotation2d(second))
+            assert_close(
+                (result.cos[i], result.sin[i]), (expected.cos, expected.sin), ulps=4
+            )
+
+
+@given(
+    st.lists(st.tuples(coordinates, coordinates), min_size=1, max_size=20),
+    poses,
+)
+def test_translation_array_transforms(assert_close, points, pose):
+    translations = Translation2dArray.fromTranslations(
+        Translation2d(x, y) for x, y in points
+    )
+    rotated = translations.rotateBy(pose.rotation)
+    relative = translations.relativeTo(pose)
+
+    for i, (x, y) in enumerate(points):
+        point = Translation2d(x, y)
+        expected = point.rotateBy(pose.rotation)
+        assert_close((rotated.x[i], rotated.y[i]), (expected.x, expected.y), 4, 100)
+        expected = Pose2d(point, Rotation2d()).relativeTo(pose).translation
+        assert_close((relative.x[i], relative.y[i]), (expected.x, expected.y), 8, 200)
+
+
+@given(st.lists(poses, min_size=1, max_size=20))
+def test_packing_round_trip(assert_poses_close, pose_list):
+    packed = Pose2dArray.fromPoses(pose_list).toPacked()
+
+    for i, pose in enumerate(pose_list):
+        unpacked = Pose2d.fromBytes(packed, i * Pose2d.packedSize)
+        assert unpacked.translation.x == pose.translation.x
+        assert unpacked.translation.y == pose.translation.y
+        assert_poses_close(unpacked, pose, ulps=2, scale=100)
+
+
+@pytest.fixture(scope="session")
+def assert_poses3d_close(assert_close):
+    def assert_poses3d_close(
+        actual: Pose3d, expected: Pose3d, ulps: float, scale: float
+    ):
+        translation = actual.translation
+        rotation = actual.rotation
+        assert_close(
+            (translation.x, translation.y, translation.z),
+            (expected.translation.x, expected.translation.y, expected.translation.z),
+            ulps,
+            scale,
+        )
+        assert_close(
+            (rotation.w, rotation.x, rotation.y, rotation.z),
+            (
+                expected.rotation.w,
+                expected.rotation.x,
+                expected.rotation.y,
+                expected.rotation.z,
+            ),
+            ulps,
+        )
+
+    return assert_poses3d_close
+
+
+poses3d = st.builds(
+    lambda x, y, z, roll, pitch, yaw: Pose3d(x, y, z, Rotation3d(roll, pitch, yaw)),
+    coordinates,
+    coordinates,
+    coordinates,
+    st.floats(-math.pi, math.pi),
+    st.floats(-math.pi, math.pi),
+    st.floats(-math.pi, math.pi),
+)
+rotation_angles = st.one_of(
+    st.floats(0, math.pi),
+    # Around the series threshold of Pose3d.exp and Pose3d.log.
+    st.floats(0, 2e-2),
+    st.sampled_from([1e-2, np.nextafter(1e-2, 0)]),
+    # Around the threshold of Rotation3d.fromRotationVector.
+    st.floats(0, 2e-9),
+)
+axes = st.tuples(st.floats(-1, 1), st.floats(-1, 1), st.floats(-1, 1)).filter(
+    lambda axis: np.linalg.norm(axis) > 0.1
+)
+twists3d = st.builds(
+    lambda u, axis, angle: u + tuple(np.multiply(axis, angle / np.linalg.norm(axis))),
+    st.tuples(*[st.floats(-1, 1, allow_nan=False)] * 3),
+    axes,
+    rotation_angles,
+)
+
+
+@given(st.lists(st.tuples(poses3d, twists3d), min_size=1, max_size=20))
+def test_pose3d_array_exp(assert_poses3d_close, cases):
+    starts = Pose3dArray.fromPoses(pose for pose, _ in cases)
+    results = starts.exp([twist for _, twist in cases])
+
+    for i, (pose, twist) in enumerate(cases):
+        assert_poses3d_close(results[i], pose.exp(Twist3d(*twist)), 16, scale=100)
+
+
+@given(st.lists(st.tuples(poses3d, twists3d), min_size=1, max_size=20))
+def test_pose3d_array_log(assert_close, cases):
+    starts = Pose3dArray.fromPoses(pose for pose, _ in cases)
+    ends = Pose3dArray.fromPoses(pose.exp(Twist3d(*twist)) for pose, twist in cases)
+    results = starts.log(ends)
+
+    for i, (pose, _) in enumerate(cases):
+        expected = pose.log(ends[i])
+        assert_close(
+            results[i],
+            (
+                expected.dx,
+                expected.dy,
+                expected.dz,
+                expected.rx,
+                expected.ry,
+                expected.rz,
+            ),
+            ulps=64,
+            scale=100,
+        )
+
+
+@given(poses3d, twists3d)
+def test_pose3d_exp_log_round_trip(assert_poses3d_close, pose, twist):
+    end = pose.exp(Twist3d(*twist))
+    # log subtracts nearby poses far from the origin, which loses precision.
+    assert_poses3d_close(pose.exp(pose.log(end)), end, ulps=256, scale=100)
@@ -48,3 +48,22 @@ def test_minus():
     assert math.isclose(transform.translation.x, 5 * math.sqrt(2))
     assert transform.translation.y == pytest.approx(0)
     assert math.isclose(transform.rotation.getDegrees(), 0)
+
+
+def test_default_pose_is_interned():
+    pose = Pose2d()
+    assert pose.translation is Translation2d()
+    assert pose.rotation is Rotation2d()
+    assert Pose2d(0, 0, Rotation2d()).translation is Translation2d()
+
+
+def test_pack():
+    pose = Pose2d(1, 2, Rotation2d.fromDegrees(45))
+    transform = Transform2d(Translation2d(3, 4), Rotation2d.fromDegrees(-30))
+    buffer = bytearray(Pose2d.packedSize + Transform2d.packedSize)
+    pose.packInto(buffer)
+    transform.packInto(buffer, Pose2d.packedSize)
+
+    assert Pose2d.fromBytes(pose.toBytes()) == pose
+    assert Pose2d.fromBytes(buffer) == pose
+    assert Transform2d.fromBytes(buffer, Pose2d.packedSize) == transform
@@ -0,0 +1,135 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import (
+    Pose2d,
+    Pose2dArray,
+    Rotation2d,
+    Transform2d,
+    Translation2d,
+    Twist2d,
+    compose_scan,
+)
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveDriveOdometry,
+    SwerveModulePosition,
+)
+
+
+def random_twists(num_twists):
+    rng = np.random.default_rng(39)
+    return np.column_stack(
+        (
+            rng.uniform(-0.05, 0.05, num_twists),
+            rng.uniform(-0.05, 0.05, num_twists),
+            rng.uniform(-0.2, 0.2, num_twists),
+        )
+    )
+
+
+def test_exp_matches_scalar():
+    twists = random_twists(5)
+    twists[0, 2] = 0
+    poses = Pose2dArray.fromPoses(
+        [Pose2d(i, -i, Rotation2d.fromDegrees(30 * i)) for i in range(5)]
+    )
+
+    result = poses.exp(twists)
+
+    for i in range(5):
+        assert result[i] == poses[i].exp(Twist2d(*twists[i]))
+
+
+def test_log_inverts_exp():
+    twists = random_twists(5)
+    twists[0, 2] = 0
+    poses = Pose2dArray.fromPoses(
+        [Pose2d(i, -i, Rotation2d.fromDegrees(30 * i)) for i in range(5)]
+    )
+
+    assert poses.log(poses.exp(twists)) == pytest.approx(twists)
+
+
+def test_add_transform():
+    poses = Pose2dArray.fromArray([(1, 2, math.pi / 2), (0, 0, 0)])
+    transform = Transform2d(Translation2d(1, 0), Rotation2d.fromDegrees(90))
+
+    assert (poses + transform).toArray() == pytest.approx(
+        np.array([(1, 3, math.pi), (1, 0, math.pi / 2)])
+    )
+
+
+def test_compose_scan_matches_sequential():
+    transforms = Pose2dArray.fromTwists(random_twists(1000))
+    initial = Pose2d(1, 2, Rotation2d.fromDegrees(60))
+
+    poses = compose_scan(transforms, initial)
+
+    pose = initial
+    for i in range(len(transforms)):
+        pose = pose + Transform2d(transforms.translation[i], transforms.rotation[i])
+        assert poses[i] == pose
+
+
+def test_compose_scan_matches_odometry():
+    kinematics = SwerveDriveKinematics(
+        Translation2d(+0.3, +0.3),
+        Translation2d(+0.3, -0.3),
+        Translation2d(-0.3, +0.3),
+        Translation2d(-0.3, -0.3),
+    )
+    rng = np.random.default_rng(39)
+    num_samples = 500
+    gyro = np.cumsum(rng.normal(0, 0.05, num_samples))
+    distances = np.cumsum(rng.uniform(0, 0.02, (num_samples, 4)), axis=0)
+    angles = np.cumsum(rng.normal(0, 0.1, (num_samples, 4)), axis=0)
+    initial = Pose2d(1, 2, Rotation2d(gyro[0]))
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d(gyro[0]), initial)
+
+    expected = []
+    twists = []
+    for i in range(num_samples):
+        positions = [
+            SwerveModulePosition(distances[i, j], Rotation2d(angles[i, j]))
+            for j in range(4)
+        ]
+        expected.append(odometry.updateWithPositions(Rotation2d(gyro[i]), *positions))
+        if i == 0:
+            twists.append((0, 0, 0))
+            continue
+        deltas = [
+            SwerveModulePosition(distances[i, j] - distances[i - 1, j], angle.angle)
+            for j, angle in enumerate(positions)
+        ]
+        twist = kinematics.toTwist2d(*deltas)
+        dtheta = (Rotation2d(gyro[i]) - Rotation2d(gyro[i - 1])).getRadians()
+        twists.append((twist.dx, twist.dy, dtheta))
+
+    poses = compose_scan(Pose2dArray.fromTwists(twists), initial)
+
+    assert poses.toArray() == pytest.approx(
+        np.array(
+            [(p.translation.x, p.translation.y, p.rotation.value) for p in expected]
+        )
+    )
+
+
+def test_packed_layout_matches_pose():
+    poses = Pose2dArray.fromArray(random_twists(4))
+    packed = poses.toPacked()
+
+    data = memoryview(packed).tobytes()
+    assert data == b"".join(poses[i].toBytes() for i in range(4))
+
+    unpacked = Pose2dArray.fromPacked(data)
+    assert unpacked.toArray() == pytest.approx(poses.toArray())
+
+
+def test_packed_matches_pose_outside_half_turn():
+    poses = [Pose2d(0, 0, Rotation2d(6.0)), Pose2d(1, 2, Rotation2d(-4.0))]
+    packed = Pose2dArray.fromPoses(poses).toPacked()
+
+    assert packed.tobytes() == b"".join(pose.toBytes() for pose in poses)
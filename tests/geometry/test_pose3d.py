@@ -0,0 +1,126 @@
+import math
+import pickle
+
+import pytest
+
+from wpilib.geometry import (
+    Pose2d,
+    Pose3d,
+    Rotation2d,
+    Rotation3d,
+    Transform3d,
+    Translation2d,
+    Translation3d,
+    Twist2d,
+    Twist3d,
+)
+
+
+def test_transform_by():
+    initial = Pose3d(1, 2, 0, Rotation3d(yaw=math.radians(45)))
+    transform = Transform3d(Translation3d(5, 0, 1), Rotation3d(yaw=math.radians(5)))
+
+    transformed = initial + transform
+
+    assert transformed == Pose3d(
+        1 + 5 / math.sqrt(2),
+        2 + 5 / math.sqrt(2),
+        1,
+        Rotation3d(yaw=math.radians(50)),
+    )
+
+
+def test_transform_translation_is_in_pose_frame():
+    pose = Pose3d(Translation3d(), Rotation3d(pitch=math.radians(90)))
+
+    transformed = pose + Transform3d(Translation3d(1, 0, 0), Rotation3d())
+
+    assert transformed.translation == Translation3d(0, 0, -1)
+
+
+def test_sub_inverts_add():
+    initial = Pose3d(1, 2, 3, Rotation3d(0.1, -0.5, 2))
+    final = Pose3d(-4, 0.5, 1, Rotation3d(1, 0.2, -1))
+
+    transform = final - initial
+
+    assert initial + transform == final
+    assert final.relativeTo(initial) == Pose3d(
+        transform.translation, transform.rotation
+    )
+
+
+def test_transform_inverse():
+    transform = Transform3d(Translation3d(1, -2, 3), Rotation3d(0.3, 0.2, 0.1))
+    pose = Pose3d(4, 5, 6, Rotation3d(-1, 0, 1))
+
+    assert pose + transform + transform.inverse() == pose
+
+
+def test_exp_planar_matches_pose2d():
+    twist = Twist3d(dx=1, dy=0.5, rz=math.radians(30))
+
+    pose = Pose3d().exp(twist)
+
+    expected = Pose2d().exp(Twist2d(1, 0.5, math.radians(30)))
+    assert pose.toPose2d() == expected
+    assert pose.translation.z == 0
+
+
+@pytest.mark.parametrize("angle", [0, 1e-12, 1e-3, 1e-2, 0.5, 3])
+def test_log_inverts_exp(angle):
+    start = Pose3d(1, -2, 0.5, Rotation3d(0.3, -0.1, 2))
+    twist = Twist3d(0.5, -0.2, 0.1, angle * 0.6, -angle * 0.8, 0)
+
+    end = start.exp(twist)
+
+    assert start.log(end) == twist
+
+
+def test_pose2d_conversion():
+    pose2d = Pose2d(Translation2d(1, 2), Rotation2d.fromDegrees(60))
+
+    pose = Pose3d.fromPose2d(pose2d)
+
+    assert pose == Pose3d(1, 2, 0, Rotation3d(yaw=math.radians(60)))
+    assert pose.toPose2d() == pose2d
+
+
+def test_translation_conversion():
+    translation = Translation3d(1, 2, 3)
+
+    assert translation.toTranslation2d() == Translation2d(1, 2)
+    assert Translation3d.fromTranslation2d(Translation2d(1, 2)) == Translation3d(
+        1, 2, 0
+    )
+    assert translation.norm() == pytest.approx(math.sqrt(14))
+    assert translation.getDistance(Translation3d()) == abs(translation)
+
+
+def test_packing_and_pickling():
+    pose = Pose3d(1, 2, 3, Rotation3d(0.1, 0.2, 0.3))
+    transform = Transform3d(pose.translation, pose.rotation)
+    twist = Twist3d(1, 2, 3, 4, 5, 6)
+
+    assert len(pose.toBytes()) == Pose3d.packedSize
+    assert Pose3d.fromBytes(pose.toBytes()) == pose
+    assert Transform3d.fromBytes(transform.toBytes()) == transform
+    assert Twist3d.fromBytes(twist.toBytes()) == twist
+    assert pickle.loads(pickle.dumps(pose)) == pose
+    assert hash(Pose3d.fromBytes(pose.toBytes()).translation) == hash(pose.translation)
+
+
+def test_equality_is_within_tolerance():
+    # Either side of the edge of a 1e-9 grid.
+    assert Translation3d(2.5e-9 * (1 - 1e-12), 0, 0) == Translation3d(
+        2.5e-9 * (1 + 1e-12), 0, 0
+    )
+    assert Translation3d(1e-17, 0, 0) == Translation3d()
+    assert Translation3d(1000, 0, 0) == Translation3d(1000 + 1e-8, 0, 0)
+    assert Translation3d(1e-8, 0, 0) != Translation3d()
+
+
+def test_mutable_types_are_unhashable():
+    for value in (Pose3d(), Transform3d(), Twist3d()):
+        with pytest.raises(TypeError):
+            hash(value)
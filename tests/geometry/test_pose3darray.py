@@ -0,0 +1,177 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import (
+    Pose2d,
+    Pose2dArray,
+    Pose3d,
+    Pose3dArray,
+    Rotation2d,
+    Rotation3d,
+    Rotation3dArray,
+    Transform3d,
+    Translation3d,
+    Translation3dArray,
+    Twist3d,
+)
+
+
+def random_poses(num_poses, seed=49):
+    rng = np.random.default_rng(seed)
+    return [
+        Pose3d(*rng.uniform(-5, 5, 3), Rotation3d(*rng.uniform(-math.pi, math.pi, 3)))
+        for _ in range(num_poses)
+    ]
+
+
+def random_twists(num_twists):
+    rng = np.random.default_rng(39)
+    twists = rng.uniform(-0.5, 0.5, (num_twists, 6))
+    twists[0, 3:] = 0
+    twists[1, 3:] = 1e-10
+    twists[2, 3:] = (1e-2, 0, 0)
+    return twists
+
+
+def test_add_matches_scalar():
+    poses = random_poses(5)
+    transforms = random_poses(5, seed=50)
+    transform = Transform3d(transforms[0].translation, transforms[0].rotation)
+
+    composed = Pose3dArray.fromPoses(poses) + Pose3dArray.fromPoses(transforms)
+    broadcast = Pose3dArray.fromPoses(poses) + transform
+
+    for i in range(5):
+        assert composed[i] == poses[i] + Transform3d(
+            transforms[i].translation, transforms[i].rotation
+        )
+        assert broadcast[i] == poses[i] + transform
+
+
+def test_radd_applies_transforms_to_single_pose():
+    pose = random_poses(1)[0]
+    transforms = random_poses(5, seed=50)
+
+    composed = pose + Pose3dArray.fromPoses(transforms)
+
+    for i in range(5):
+        assert composed[i] == pose + Transform3d(
+            transforms[i].translation, transforms[i].rotation
+        )
+
+
+def test_sub_matches_scalar():
+    poses = random_poses(5)
+    origins = random_poses(5, seed=50)
+
+    transforms = Pose3dArray.fromPoses(poses) - Pose3dArray.fromPoses(origins)
+    relative = Pose3dArray.fromPoses(poses).relativeTo(origins[0])
+
+    for i in range(5):
+        assert transforms[i] == poses[i].relativeTo(origins[i])
+        assert relative[i] == poses[i].relativeTo(origins[0])
+
+
+def test_apriltag_transform_chain():
+    # field -> tag, camera -> tag and robot -> camera, for each detection.
+    tags = random_poses(8)
+    detections = random_poses(8, seed=50)
+    robot_to_camera = Transform3d(
+        Translation3d(0.3, 0, 0.5), Rotation3d(pitch=math.radians(-20))
+    )
+
+    field_to_camera = (
+        Pose3dArray.fromPoses(tags) + Pose3dArray.fromPoses(detections).inverse()
+    )
+    robot_poses = (field_to_camera + robot_to_camera.inverse()).toPose2dArray()
+
+    for i in range(8):
+        camera_to_tag = Transform3d(detections[i].translation, detections[i].rotation)
+        expected = tags[i] + camera_to_tag.inverse() + robot_to_camera.inverse()
+        assert robot_poses[i] == expected.toPose2d()
+
+
+def test_exp_matches_scalar():
+    twists = random_twists(6)
+    poses = random_poses(6)
+
+    result = Pose3dArray.fromPoses(poses).exp(twists)
+
+    for i in range(6):
+        assert result[i] == poses[i].exp(Twist3d(*twists[i]))
+
+
+def test_log_matches_scalar():
+    twists = random_twists(6)
+    starts = Pose3dArray.fromPoses(random_poses(6))
+    ends = starts.exp(twists)
+
+    result = starts.log(ends)
+
+    assert result == pytest.approx(twists, abs=1e-12)
+    for i in range(6):
+        assert Twist3d(*result[i]) == starts[i].log(ends[i])
+
+
+def test_rotation_array_matches_scalar():
+    rng = np.random.default_rng(49)
+    angles = rng.uniform(-math.pi, math.pi, (5, 3))
+    # Keep the pitch within the range returned by getY.
+    angles[:, 1] /= 2
+    rotations = Rotation3dArray.fromEulerAngles(*angles.T)
+    other = Rotation3d(0.3, 0.2, 0.1)
+
+    sums = rotations + other
+    differences = other - rotations
+    matrices = rotations.toMatrices()
+    vectors = rotations.toRotationVectors()
+
+    for i in range(5):
+        rotation = Rotation3d(*angles[i])
+        assert rotations[i] == rotation
+        assert sums[i] == rotation + other
+        assert differences[i] == other - rotation
+        assert matrices[i] == pytest.approx(rotation.toMatrix())
+        assert vectors[i] == pytest.approx(rotation.toRotationVector())
+        assert Rotation3dArray.fromRotationVectors(vectors)[i] == rotation
+    assert rotations.getX() == pytest.approx(angles[:, 0])
+    assert rotations.getY() == pytest.approx(angles[:, 1])
+    assert rotations.getZ() == pytest.approx(angles[:, 2])
+
+
+def test_translation_array_rotate_by():
+    rng = np.random.default_rng(49)
+    points = rng.uniform(-5, 5, (5, 3))
+    rotation = Rotation3d(0.3, 0.2, 0.1)
+
+    rotated = Translation3dArray.fromArray(points).rotateBy(rotation)
+
+    assert rotated.toArray() == pytest.approx(points @ rotation.toMatrix().T)
+
+
+def test_pose2d_conversion():
+    poses2d = Pose2dArray.fromPoses(
+        [Pose2d(i, -i, Rotation2d.fromDegrees(40 * i)) for i in range(5)]
+    )
+
+    poses = Pose3dArray.fromPose2dArray(poses2d)
+
+    for i in range(5):
+        assert poses[i] == Pose3d.fromPose2d(poses2d[i])
+        assert poses.toPose2dArray()[i] == poses2d[i]
+
+
+def test_packing_round_trip():
+    poses = Pose3dArray.fromPoses(random_poses(5))
+
+    packed = poses.toPacked()
+    unpacked = Pose3dArray.fromPacked(packed.tobytes())
+
+    assert packed.itemsize == Pose3d.packedSize
+    assert Pose3d.fromBytes(packed[2].tobytes()) == poses[2]
+    assert unpacked.toArray() == pytest.approx(poses.toArray())
+    assert Pose3dArray.fromArray(poses.toArray()).toArray() == pytest.approx(
+        poses.toArray()
+    )
@@ -1,4 +1,6 @@
+import copy
 import math
+import pickle
 
 from wpilib.geometry import Rotation2d
 
@@ -35,6 +37,14 @@ def test_minus():
     assert math.isclose((one - two).getDegrees(), 40)
 
 
+def test_zero_operands_wrap_result():
+    unwrapped = Rotation2d.fromDegrees(720)
+
+    assert math.isclose((unwrapped + Rotation2d()).getDegrees(), 0, abs_tol=1e-9)
+    assert math.isclose((Rotation2d() + unwrapped).getDegrees(), 0, abs_tol=1e-9)
+    assert math.isclose((unwrapped - Rotation2d()).getDegrees(), 0, abs_tol=1e-9)
+
+
 def test_equality():
     one = Rotation2d.fromDegrees(43.0)
     two = Rotation2d.fromDegrees(43)
@@ -47,3 +57,34 @@ def test_inequality():
     two = Rotation2d.fromDegrees(43.5)
 
     assert one != two
+
+
+def test_interned_zero():
+    assert Rotation2d() is Rotation2d()
+    assert -Rotation2d() is Rotation2d()
+    assert Rotation2d.fromDegrees(0) is Rotation2d()
+
+
+def test_interned_cardinals():
+    assert Rotation2d.fromDegrees(90) is Rotation2d.fromDegrees(90.0)
+    assert -Rotation2d.fromDegrees(90) is Rotation2d.fromDegrees(-90)
+    assert Rotation2d.fromDegrees(-90).value == Rotation2d(-math.pi / 2).value
+
+
+def test_copy():
+    rot = Rotation2d.fromDegrees(30)
+    assert copy.copy(rot) == rot
+    assert pickle.loads(pickle.dumps(rot)).sin == rot.sin
+    assert pickle.loads(pickle.dumps(Rotation2d())) is Rotation2d()
+
+
+def test_pack():
+    rotation = Rotation2d.fromDegrees(30)
+    data = rotation.toBytes()
+    assert len(data) == Rotation2d.packedSize
+
+    buffer = bytearray(2 * Rotation2d.packedSize)
+    rotation.packInto(buffer, Rotation2d.packedSize)
+
+    assert Rotation2d.fromBytes(data) == rotation
+    assert Rotation2d.fromBytes(buffer, Rotation2d.packedSize) == rotation
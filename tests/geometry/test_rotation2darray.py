@@ -0,0 +1,80 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import Rotation2d, Rotation2dArray
+
+DEGREES = np.array([-170.0, -45.0, 0.0, 30.0, 90.0, 175.0])
+
+
+def test_matches_scalar():
+    rotations = Rotation2dArray.fromDegrees(DEGREES)
+    other = Rotation2dArray.fromDegrees(DEGREES[::-1])
+
+    sums = rotations + other
+    differences = rotations - other
+    negated = -rotations
+    scaled = rotations * 0.5
+
+    for i, degrees in enumerate(DEGREES):
+        a = Rotation2d.fromDegrees(degrees)
+        b = Rotation2d.fromDegrees(DEGREES[::-1][i])
+        assert sums[i] == a + b
+        assert differences[i] == a - b
+        assert negated[i] == -a
+        assert scaled[i] == a * 0.5
+
+
+def test_wrapping():
+    rotations = Rotation2dArray.fromDegrees([170, 190, 250, 370])
+    assert rotations.getDegrees() == pytest.approx([170, 190, 250, 370])
+    assert rotations[3] == Rotation2d.fromDegrees(370)
+    assert (rotations + Rotation2d()).getDegrees() == pytest.approx(
+        [170, -170, -110, 10]
+    )
+
+
+def test_scaling_matches_scalar():
+    rotations = Rotation2dArray.fromDegrees([270, -270])
+    assert (rotations * 0.5).getDegrees() == pytest.approx([135, -135])
+    assert (-rotations).getDegrees() == pytest.approx([-270, 270])
+    assert (Rotation2dArray.fromRotations([Rotation2d(6.0)]) * 0.5)[0] == Rotation2d(
+        6.0
+    ) * 0.5
+
+    headings = Rotation2dArray.fromDegrees([170, 190, 250])
+    assert headings.getUnwrappedRadians() == pytest.approx(np.radians([170, 190, 250]))
+
+
+def test_interpolate_shortest_path():
+    start = Rotation2dArray.fromDegrees([170, 0])
+    end = Rotation2dArray.fromDegrees([-170, 90])
+
+    assert start.interpolate(end, 0.5).getDegrees() == pytest.approx([180, 45])
+
+
+def test_diff():
+    rotations = Rotation2dArray.fromDegrees([0, 10, 30, 60])
+    assert rotations.diff().getDegrees() == pytest.approx([10, 20, 30])
+
+
+def test_components_and_scalars():
+    rotations = Rotation2dArray.fromComponents([1, 0, 0], [1, 2, 0])
+    assert rotations.getDegrees() == pytest.approx([45, 90, 0])
+
+    shifted = rotations + Rotation2d.fromDegrees(90)
+    assert shifted.getDegrees() == pytest.approx([135, 180, 90])
+
+    from_rotations = Rotation2dArray.fromRotations([Rotation2d(1), Rotation2d(2)])
+    assert from_rotations.getRadians() == pytest.approx([1, 2])
+    assert math.isclose(from_rotations[1].getRadians(), 2)
+    assert len(from_rotations[:1]) == 1
+
+
+def test_packed():
+    rotations = Rotation2dArray.fromDegrees(DEGREES)
+    data = rotations.toPacked().tobytes()
+
+    assert Rotation2dArray.fromPacked(data).getDegrees() == pytest.approx(DEGREES)
+    assert Rotation2d.fromBytes(data, 8) == rotations[1]
@@ -0,0 +1,119 @@
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import Rotation2d, Rotation3d, Translation3d
+
+
+def test_euler_angles_round_trip():
+    rotation = Rotation3d(0.1, -0.2, 2.5)
+
+    assert rotation.getX() == pytest.approx(0.1)
+    assert rotation.getY() == pytest.approx(-0.2)
+    assert rotation.getZ() == pytest.approx(2.5)
+
+
+def test_euler_angles_are_extrinsic_xyz():
+    roll = Rotation3d(roll=0.3)
+    pitch = Rotation3d(pitch=-0.4)
+    yaw = Rotation3d(yaw=1.2)
+
+    assert Rotation3d(0.3, -0.4, 1.2) == roll + pitch + yaw
+
+
+def test_rotate_translation():
+    rotation = Rotation3d.fromAxisAngle((0, 0, 1), math.pi / 2)
+
+    assert Translation3d(1, 0, 2).rotateBy(rotation) == Translation3d(0, 1, 2)
+    assert Translation3d(1, 2, 3).rotateBy(rotation) == Translation3d(
+        *(rotation.toMatrix() @ (1, 2, 3))
+    )
+
+
+def test_add_applies_other_rotation_after():
+    a = Rotation3d.fromAxisAngle((1, 0, 0), math.pi / 2)
+    b = Rotation3d.fromAxisAngle((0, 0, 1), math.pi / 2)
+    point = Translation3d(0, 1, 0)
+
+    assert point.rotateBy(a + b) == point.rotateBy(a).rotateBy(b)
+    assert point.rotateBy(a + b) == Translation3d(0, 0, 1)
+    assert (b - a) + a == b
+
+
+def test_neg_is_inverse():
+    rotation = Rotation3d(0.5, 1, -2)
+
+    assert rotation + -rotation == Rotation3d()
+
+
+def test_quaternion_sign_is_ignored():
+    rotation = Rotation3d(0.5, 1, -2)
+    negated = Rotation3d.fromQuaternion(
+        -rotation.w, -rotation.x, -rotation.y, -rotation.z
+    )
+
+    assert negated == rotation
+    assert hash(negated) == hash(rotation)
+
+
+def test_rotation_vector_round_trip():
+    vector = (0.3, -1.2, 0.8)
+    rotation = Rotation3d.fromRotationVector(vector)
+
+    assert rotation.toRotationVector() == pytest.approx(vector)
+    assert rotation.getAngle() == pytest.approx(np.linalg.norm(vector))
+    assert rotation == Rotation3d.fromAxisAngle(vector, np.linalg.norm(vector))
+
+
+def test_small_rotation_vector():
+    vector = (1e-12, -2e-12, 0)
+
+    rotation = Rotation3d.fromRotationVector(vector)
+
+    assert rotation.toRotationVector() == pytest.approx(vector, rel=1e-9)
+
+
+def test_mul_scales_angle():
+    rotation = Rotation3d.fromAxisAngle((1, 1, 0), 0.6)
+
+    assert rotation * 0.5 == Rotation3d.fromAxisAngle((1, 1, 0), 0.3)
+    assert 2 * rotation == rotation + rotation
+
+
+def test_matrix_round_trip():
+    for rotation in (
+        Rotation3d(0.1, 0.2, 0.3),
+        Rotation3d.fromAxisAngle((1, 0, 0), math.pi),
+        Rotation3d.fromAxisAngle((0, 1, 0), math.pi),
+        Rotation3d.fromAxisAngle((0, 0, 1), math.pi),
+    ):
+        matrix = rotation.toMatrix()
+        assert matrix @ matrix.T == pytest.approx(np.eye(3))
+        assert Rotation3d.fromMatrix(matrix) == rotation
+
+
+def test_matrix_is_cached_and_read_only():
+    rotation = Rotation3d(0.1, 0.2, 0.3)
+
+    matrix = rotation.toMatrix()
+
+    assert rotation.toMatrix() is matrix
+    with pytest.raises(ValueError):
+        matrix[0, 0] = 2
+
+
+def test_rotation2d_conversion():
+    rotation = Rotation3d.fromRotation2d(Rotation2d.fromDegrees(120))
+
+    assert rotation == Rotation3d(yaw=math.radians(120))
+    assert rotation.toRotation2d() == Rotation2d.fromDegrees(120)
+
+
+def test_packing_and_pickling():
+    rotation = Rotation3d(0.1, 0.2, 0.3)
+
+    assert len(rotation.toBytes()) == Rotation3d.packedSize
+    assert Rotation3d.fromBytes(rotation.toBytes()) == rotation
+    assert pickle.loads(pickle.dumps(rotation)) == rotation
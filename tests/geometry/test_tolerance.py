@@ -0,0 +1,93 @@
+import math
+
+import pytest
+
+from wpilib.geometry import (
+    Pose2d,
+    Rotation2d,
+    Transform2d,
+    Translation2d,
+    Twist2d,
+    get_tolerance,
+    memoize,
+    set_tolerance,
+)
+
+
+@pytest.fixture
+def restore_tolerance():
+    tolerance = get_tolerance()
+    yield
+    set_tolerance(tolerance)
+
+
+def test_equality_is_relative():
+    assert Translation2d(1000, 0) == Translation2d(1000 + 1e-8, 0)
+    # Either side of the edge of a 1e-9 grid.
+    assert Translation2d(2.5e-9 * (1 - 1e-12), 0) == Translation2d(
+        2.5e-9 * (1 + 1e-12), 0
+    )
+    assert Twist2d(0.1 + 0.2, 0, 0) == Twist2d(0.3, 0, 0)
+    assert Rotation2d.fromDegrees(90) == Rotation2d(0, 2)
+    assert Rotation2d(0) != Rotation2d(math.tau)
+
+
+def test_equality_ignores_tolerance(restore_tolerance):
+    set_tolerance(0.01)
+    assert Translation2d(1, 2) != Translation2d(1.001, 2)
+
+
+def test_frozen_types_hash_exactly():
+    assert hash(Translation2d(0.3, 0)) == hash(Translation2d(0.3, 0))
+    assert hash(Rotation2d(0, 2)) == hash(Rotation2d(0, 1))
+    assert len({Translation2d(1, 2), Translation2d(1, 2)}) == 1
+
+
+def test_mutable_types_are_unhashable():
+    for value in (Twist2d(), Pose2d(), Transform2d()):
+        with pytest.raises(TypeError):
+            hash(value)
+
+
+def test_infinite_components():
+    assert Translation2d(math.inf, 0) == Translation2d(math.inf, 0)
+    assert Translation2d(math.inf, 0) != Translation2d(-math.inf, 0)
+
+
+def test_memoize(restore_tolerance):
+    calls = []
+
+    @memoize()
+    def distance(a, b):
+        calls.append((a, b))
+        return a.getDistance(b)
+
+    assert distance(Translation2d(0, 0), Translation2d(3, 4)) == 5
+    assert distance(Translation2d(0, 0), Translation2d(3, 4 + 1e-12)) == 5
+    assert len(calls) == 1
+
+    set_tolerance(1e-6)
+    distance(Translation2d(0, 0), Translation2d(3, 4))
+    assert len(calls) == 2
+
+
+def test_memoize_mutable_arguments():
+    calls = []
+
+    @memoize()
+    def total(poses, twist=None):
+        calls.append(poses)
+        return sum(pose.translation.x for pose in poses)
+
+    waypoints = (Pose2d(1, 0, Rotation2d(0)), Pose2d(2, 0, Rotation2d(1)))
+    assert total(waypoints, twist=Twist2d()) == 3
+    assert (
+        total(
+            [Pose2d(1, 0, Rotation2d(0)), Pose2d(2, 0, Rotation2d(1 + 1e-12))],
+            twist=Twist2d(),
+        )
+        == 3
+    )
+    assert total(waypoints, twist=Twist2d(dx=1)) == 3
+    assert total(waypoints[:1]) == 1
+    assert len(calls) == 3
@@ -1,4 +1,6 @@
+import copy
 import math
+import pickle
 
 import pytest
 
@@ -89,3 +91,25 @@ def test_inequality():
     one = Translation2d(9.0, 5.5)
     two = Translation2d(9, 5.7)
     assert one != two
+
+
+def test_interned_zero():
+    zero = Translation2d()
+    assert Translation2d(0, 0) is zero
+    assert Translation2d(0.0, -0.0) is zero
+    assert -zero is zero
+
+
+def test_copy():
+    original = Translation2d(3, 5)
+    assert copy.copy(original) == original
+    assert pickle.loads(pickle.dumps(Translation2d())) is Translation2d()
+
+
+def test_pack():
+    translation = Translation2d(1.5, -2)
+    buffer = bytearray(8 + Translation2d.packedSize)
+    translation.packInto(buffer, 8)
+
+    assert Translation2d.fromBytes(translation.toBytes()) == translation
+    assert Translation2d.fromBytes(buffer, 8) == translation
@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import (
+    Pose2d,
+    Rotation2d,
+    Rotation2dArray,
+    Translation2d,
+    Translation2dArray,
+    Translation2dGrid,
+)
+
+
+def test_rotate_by_matches_scalar():
+    points = Translation2dArray([3, 1, -2], [0, 2, 5])
+    rotations = Rotation2dArray.fromDegrees([90, 30, -45])
+
+    rotated = points.rotateBy(rotations)
+    rotated_all = points.rotateBy(Rotation2d.fromDegrees(90))
+
+    for i in range(len(points)):
+        assert rotated[i] == points[i].rotateBy(rotations[i])
+        assert rotated_all[i] == points[i].rotateBy(Rotation2d.fromDegrees(90))
+
+
+def test_arithmetic():
+    points = Translation2dArray([1, 2], [3, 4])
+
+    assert (points + Translation2d(1, 1)).toArray().tolist() == [[2, 4], [3, 5]]
+    assert (points - points).norm().tolist() == [0, 0]
+    assert (-points * 2).toArray().tolist() == [[-2, -6], [-4, -8]]
+    assert (points / 2)[1] == Translation2d(1, 2)
+    assert points.norm() == pytest.approx([math.hypot(1, 3), math.hypot(2, 4)])
+
+
+def test_relative_to():
+    landmarks = Translation2dArray([5, 0], [5, 2])
+    pose = Pose2d(0, 0, Rotation2d.fromDegrees(45))
+
+    robot_relative = landmarks.relativeTo(pose)
+
+    for i in range(len(landmarks)):
+        expected = Pose2d(landmarks[i], Rotation2d()).relativeTo(pose).translation
+        assert robot_relative[i] == expected
+
+
+def test_pairwise_distances():
+    a = Translation2dArray([0, 1], [0, 1])
+    b = Translation2dArray([3, 0, 1], [4, 0, 1])
+
+    expected = [[5, 0, math.sqrt(2)], [math.hypot(2, 3), math.sqrt(2), 0]]
+    assert a.getPairwiseDistances(b) == pytest.approx(np.array(expected))
+
+
+def test_grid_matches_brute_force():
+    rng = np.random.default_rng(42)
+    points = Translation2dArray.fromArray(rng.uniform(-10, 10, (500, 2)))
+    grid = Translation2dGrid(points, 1.0)
+
+    for query in rng.uniform(-15, 15, (50, 2)):
+        point = Translation2d(*query)
+        assert grid.nearest(point) == points.nearest(point)
+
+        expected = np.flatnonzero(points.getDistance(point) <= 2.5)
+        assert grid.withinRadius(point, 2.5).tolist() == expected.tolist()
+
+
+def test_grid_nearest_outside_grid(monkeypatch):
+    rng = np.random.default_rng(42)
+    points = Translation2dArray.fromArray(rng.uniform(-10, 10, (2000, 2)))
+    grid = Translation2dGrid(points, 0.1)
+
+    def ring(*args):
+        raise AssertionError("searched the rings around a point outside the grid")
+
+    monkeypatch.setattr(Translation2dGrid, "_ring", ring)
+    for point in (Translation2d(40, 40), Translation2d(-10.5, 0)):
+        assert grid.nearest(point) == points.nearest(point)
+
+
+def test_packed():
+    translations = Translation2dArray([1, 2, 3], [4, 5, 6])
+    packed = translations.toPacked()
+
+    unpacked = Translation2dArray.fromPacked(packed)
+    assert np.shares_memory(unpacked.x, packed)
+    assert unpacked.toArray() == pytest.approx(translations.toArray())
+    assert unpacked[1] == Translation2d.fromBytes(packed, Translation2d.packedSize)
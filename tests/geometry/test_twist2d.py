@@ -53,3 +53,9 @@ def test_pose2d_log():
     assert math.isclose(twist.dx, 5 / 2 * math.pi)
     assert math.isclose(twist.dy, 0)
     assert math.isclose(twist.dtheta, math.pi / 2)
+
+
+def test_pack():
+    twist = Twist2d(1, 2, 0.5)
+    assert len(twist.toBytes()) == Twist2d.packedSize
+    assert Twist2d.fromBytes(twist.toBytes()) == twist
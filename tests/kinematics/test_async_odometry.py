@@ -0,0 +1,101 @@
+import asyncio
+import math
+
+import pytest
+
+from wpilib.geometry import Rotation2d, Translation2d
+from wpilib.kinematics.asyncodometry import AsyncSwerveDriveOdometry
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveDriveOdometry,
+    SwerveModuleState,
+)
+
+kinematics = SwerveDriveKinematics(
+    Translation2d(+12, +12),
+    Translation2d(+12, -12),
+    Translation2d(-12, +12),
+    Translation2d(-12, -12),
+)
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_ingests_bursts():
+    async def main():
+        service = AsyncSwerveDriveOdometry(
+            SwerveDriveOdometry(kinematics, Rotation2d())
+        )
+        task = asyncio.ensure_future(service.run())
+
+        state = SwerveModuleState(5, Rotation2d())
+        for i in range(11):
+            service.moduleQueue.put_nowait((i * 0.01, (state,) * 4))
+        service.gyroQueue.put_nowait((0.0, Rotation2d()))
+        service.gyroQueue.put_nowait((0.1, Rotation2d()))
+
+        pose = await asyncio.wait_for(service.poseAt(0.1), 1)
+        halfway = service.getPoseAt(0.055)
+        task.cancel()
+        return pose, halfway
+
+    pose, halfway = run(main())
+
+    assert math.isclose(pose.translation.x, 0.5)
+    assert halfway.translation.x == pytest.approx(0.275)
+
+
+def test_bursts_larger_than_sample_buffer():
+    async def main():
+        odometry = SwerveDriveOdometry(kinematics, Rotation2d(), sampleBufferSize=4)
+        service = AsyncSwerveDriveOdometry(odometry)
+        task = asyncio.ensure_future(service.run())
+
+        state = SwerveModuleState(5, Rotation2d())
+        for i in range(20):
+            service.moduleQueue.put_nowait((i * 0.01, (state,) * 4))
+        # Let the service take as much of the burst as it can.
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert not service.moduleQueue.empty()
+
+        service.gyroQueue.put_nowait((0.0, Rotation2d()))
+        service.gyroQueue.put_nowait((0.2, Rotation2d()))
+        pose = await asyncio.wait_for(service.poseAt(0.19), 1)
+        task.cancel()
+        return odometry, pose
+
+    odometry, pose = run(main())
+
+    assert odometry.getDroppedModuleSamples() == 0
+    assert pose.translation.x == pytest.approx(5 * 0.19)
+
+
+def test_next_pose():
+    async def main():
+        service = AsyncSwerveDriveOdometry(
+            SwerveDriveOdometry(kinematics, Rotation2d())
+        )
+        task = asyncio.ensure_future(service.run())
+
+        waiter = asyncio.ensure_future(service.nextPose())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        zero = SwerveModuleState()
+        await service.gyroQueue.put((0.0, Rotation2d.fromDegrees(90)))
+        await service.moduleQueue.put((0.0, (zero,) * 4))
+
+        pose = await asyncio.wait_for(waiter, 1)
+        task.cancel()
+        return pose
+
+    pose = run(main())
+    assert math.isclose(pose.rotation.getDegrees(), 90)
+    assert pose.translation.x == 0
@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import Pose2d, Pose2dArray, Rotation2d, Translation2d, compose_scan
+from wpilib.kinematics.calibration import calibrate_kinematics
+from wpilib.kinematics.replay import replay_positions
+from wpilib.kinematics.swerve import SwerveDriveKinematics
+
+TRUE_MODULES = np.array([(0.31, 0.29), (0.3, -0.3), (-0.28, 0.3), (-0.3, -0.31)])
+TRUE_SCALES = np.array([1.0, 0.97, 1.02, 0.99])
+
+
+def simulate_log(num_samples=2000, noise=0.0):
+    """Simulates a robot driving at a random velocity for each step."""
+    rng = np.random.default_rng(47)
+    twists = np.column_stack(
+        (
+            rng.uniform(-0.05, 0.05, num_samples - 1),
+            rng.uniform(-0.05, 0.05, num_samples - 1),
+            rng.uniform(-0.1, 0.1, num_samples - 1),
+        )
+    )
+    start = Pose2d(1, 2, Rotation2d(0.5))
+    poses = compose_scan(Pose2dArray.fromTwists(twists), start).toArray()
+    poses = np.vstack(((1, 2, 0.5), poses))
+
+    # Each module moves in a constant direction in the robot's frame.
+    vx = twists[:, 0, None] - twists[:, 2, None] * TRUE_MODULES[:, 1]
+    vy = twists[:, 1, None] + twists[:, 2, None] * TRUE_MODULES[:, 0]
+    steps = np.hypot(vx, vy) / TRUE_SCALES
+    steps += rng.normal(0, noise, steps.shape)
+    distances = np.vstack((np.zeros(4), np.cumsum(steps, axis=0)))
+    angles = np.vstack((np.zeros(4), np.arctan2(vy, vx)))
+    return poses[:, 2], distances, angles, poses
+
+
+def module_locations(kinematics):
+    return np.array([(module.x, module.y) for module in kinematics.modules])
+
+
+def test_recovers_exact_geometry():
+    gyro, distances, angles, poses = simulate_log()
+
+    result = calibrate_kinematics(gyro, distances, angles, poses, iterations=0)
+
+    assert module_locations(result.kinematics) == pytest.approx(TRUE_MODULES)
+    assert result.scales == pytest.approx(TRUE_SCALES)
+    assert result.error == pytest.approx(0, abs=1e-9)
+
+
+def step_error(kinematics, scales, log):
+    """The RMS error of the odometry's motion between consecutive samples."""
+    gyro, distances, angles, poses = log
+    replayed = replay_positions(
+        kinematics, gyro, distances * scales, angles, Pose2d(1, 2, Rotation2d(0.5))
+    )
+    errors = np.diff(replayed[:, :2] - poses[:, :2], axis=0)
+    return math.sqrt(np.mean(errors ** 2))
+
+
+def test_noisy_log_improves_on_cad():
+    log = simulate_log(noise=0.002)
+    cad = SwerveDriveKinematics(
+        *(
+            Translation2d(math.copysign(0.3, x), math.copysign(0.3, y))
+            for x, y in TRUE_MODULES
+        )
+    )
+
+    result = calibrate_kinematics(*log)
+
+    assert module_locations(result.kinematics) == pytest.approx(TRUE_MODULES, abs=0.005)
+    assert result.scales == pytest.approx(TRUE_SCALES, abs=0.005)
+    assert step_error(result.kinematics, result.scales, log) < step_error(
+        cad, np.ones(4), log
+    )
+
+
+def test_requires_turning():
+    gyro, distances, angles, poses = simulate_log()
+    poses[:, 2] = gyro = np.zeros(len(gyro))
+
+    with pytest.raises(AssertionError):
+        calibrate_kinematics(gyro, distances, angles, poses)
@@ -1,9 +1,15 @@
 import math
 
+import numpy as np
 import pytest
 
-from wpilib.geometry import Rotation2d
-from wpilib.kinematics import ChassisSpeeds
+from wpilib.geometry import Rotation2d, Rotation2dArray, Translation2d
+from wpilib.kinematics import (
+    ChassisSpeeds,
+    field_to_robot_speeds,
+    robot_to_field_speeds,
+)
+from wpilib.kinematics.swerve import SwerveDriveKinematics
 
 
 def test_field_relative_construction():
@@ -14,3 +20,81 @@ def test_field_relative_construction():
     assert chassis_speeds.vx == pytest.approx(0)
     assert math.isclose(1, chassis_speeds.vy)
     assert math.isclose(0.5, chassis_speeds.omega)
+
+
+def test_pack():
+    speeds = ChassisSpeeds(1, -2, 0.5)
+    packed = np.frombuffer(speeds.toBytes() * 2, dtype=ChassisSpeeds.dtype)
+
+    assert ChassisSpeeds.fromBytes(speeds.toBytes()) == speeds
+    assert packed["vy"] == pytest.approx([-2, -2])
+
+
+def random_speeds(num_speeds):
+    rng = np.random.default_rng(50)
+    return rng.uniform(-3, 3, (num_speeds, 3)), rng.uniform(-4, 4, num_speeds)
+
+
+def test_field_to_robot_matches_scalar():
+    speeds, angles = random_speeds(10)
+
+    from_radians = field_to_robot_speeds(speeds, angles)
+    from_rotations = field_to_robot_speeds(speeds, Rotation2dArray.fromRadians(angles))
+
+    for i in range(10):
+        expected = ChassisSpeeds.fromFieldRelativeSpeeds(
+            *speeds[i], Rotation2d(angles[i])
+        )
+        assert from_radians[i] == pytest.approx(expected)
+        assert from_rotations[i] == pytest.approx(expected)
+
+
+def test_single_heading():
+    speeds, _ = random_speeds(10)
+    heading = Rotation2d.fromDegrees(30)
+
+    converted = field_to_robot_speeds(speeds, heading)
+
+    assert converted == pytest.approx(
+        field_to_robot_speeds(speeds, np.full(10, heading.value))
+    )
+
+
+def test_robot_to_field_inverts_field_to_robot():
+    speeds, angles = random_speeds(10)
+    headings = Rotation2dArray.fromRadians(angles)
+
+    round_trip = robot_to_field_speeds(
+        field_to_robot_speeds(speeds, headings), headings
+    )
+
+    assert round_trip == pytest.approx(speeds)
+
+
+def test_convert_in_place():
+    speeds, angles = random_speeds(10)
+    expected = field_to_robot_speeds(speeds, angles)
+
+    result = field_to_robot_speeds(speeds, angles, out=speeds)
+
+    assert result is speeds
+    assert speeds == pytest.approx(expected)
+
+
+def test_feeds_inverse_kinematics():
+    kinematics = SwerveDriveKinematics(
+        Translation2d(1, 1),
+        Translation2d(1, -1),
+        Translation2d(-1, 1),
+        Translation2d(-1, -1),
+    )
+    speeds, angles = random_speeds(10)
+
+    velocities = kinematics.toModuleVelocities(field_to_robot_speeds(speeds, angles))
+
+    for i in range(10):
+        states = kinematics.toSwerveModuleStates(
+            ChassisSpeeds.fromFieldRelativeSpeeds(*speeds[i], Rotation2d(angles[i]))
+        )
+        for j, state in enumerate(states):
+            assert np.hypot(*velocities[i, j]) == pytest.approx(state.speed)
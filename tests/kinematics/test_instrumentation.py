@@ -0,0 +1,112 @@
+import tracemalloc
+
+import pytest
+
+from wpilib.geometry import Rotation2d, Translation2d
+from wpilib.kinematics import ChassisSpeeds
+from wpilib.kinematics.instrumentation import CallStats, Instrumentation
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveDriveOdometry,
+    SwerveModulePosition,
+    SwerveModuleState,
+)
+
+kinematics = SwerveDriveKinematics(
+    Translation2d(+12, +12),
+    Translation2d(+12, -12),
+    Translation2d(-12, +12),
+    Translation2d(-12, -12),
+)
+
+
+def test_disabled_restores_methods():
+    original = SwerveDriveOdometry.updateWithTime
+    with Instrumentation():
+        assert SwerveDriveOdometry.updateWithTime is not original
+    assert SwerveDriveOdometry.updateWithTime is original
+
+
+def test_counts_calls():
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d())
+    state = SwerveModuleState(5, Rotation2d())
+
+    with Instrumentation(traceAllocations=True) as instrumentation:
+        for i in range(10):
+            odometry.updateWithTime(i * 0.02, Rotation2d(), state, state, state, state)
+        kinematics.toSwerveModuleStates(ChassisSpeeds(1, 0, 0))
+
+    stats = instrumentation.stats["SwerveDriveOdometry.updateWithTime"]
+    assert stats.count == 10
+    assert sum(stats.counts) == 10
+    assert stats.alloc_bytes > 0
+    assert instrumentation.stats["SwerveDriveKinematics.toChassisSpeeds"].count == 10
+    assert (
+        instrumentation.stats["SwerveDriveKinematics.toSwerveModuleStates"].count == 1
+    )
+
+    flat = instrumentation.flatten("odometry/")
+    assert flat["odometry/SwerveDriveOdometry.updateWithTime/count"] == 10
+    assert not instrumentation.isOverBudget("SwerveDriveOdometry.updateWithTime", 1)
+
+    instrumentation.reset()
+    assert instrumentation.stats["SwerveDriveOdometry.updateWithTime"].count == 0
+
+
+def test_counts_position_and_sample_updates():
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d())
+    position = SwerveModulePosition()
+    state = SwerveModuleState(5, Rotation2d())
+
+    with Instrumentation() as instrumentation:
+        odometry.updateWithPositions(
+            Rotation2d(), position, position, position, position
+        )
+        odometry.addModuleSample(0.02, state, state, state, state)
+        odometry.addGyroSample(0.02, Rotation2d())
+
+    for name in ("updateWithPositions", "addModuleSample", "addGyroSample"):
+        assert instrumentation.stats["SwerveDriveOdometry." + name].count == 1
+
+
+@pytest.mark.skipif(
+    not hasattr(tracemalloc, "reset_peak"), reason="requires tracemalloc.reset_peak"
+)
+def test_nested_calls_keep_outer_peak():
+    instrumentation = Instrumentation(traceAllocations=True)
+    outer_stats = CallStats()
+    inner_stats = CallStats()
+    inner = instrumentation._wrap(lambda: None, inner_stats)
+
+    def outer():
+        buffer = bytearray(1_000_000)
+        del buffer
+        inner()
+
+    tracemalloc.start()
+    try:
+        instrumentation._wrap(outer, outer_stats)()
+    finally:
+        tracemalloc.stop()
+
+    assert outer_stats.alloc_bytes >= 1_000_000
+    assert inner_stats.alloc_bytes < 1_000_000
+    assert not instrumentation._peaks
+
+
+def test_only_one_enabled():
+    with Instrumentation():
+        with pytest.raises(RuntimeError):
+            Instrumentation().enable()
+
+
+def test_call_stats_histogram():
+    stats = CallStats(buckets=(1e-3, 2e-3))
+    stats.record(0.5e-3)
+    stats.record(1.5e-3)
+    stats.record(5e-3)
+
+    assert stats.counts == [1, 1, 1]
+    assert stats.percentile(50) == 2e-3
+    assert stats.percentile(100) == 5e-3
+    assert stats.asDict()["overflow"] == 1
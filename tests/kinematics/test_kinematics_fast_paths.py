@@ -0,0 +1,254 @@
+"""Differential tests of the fast kinematics paths against the scalar code.
+
+Each test generates random module layouts, centers of rotation and long
+odometry logs, and checks that the in-place, batched and compiled paths
+agree with the reference scalar code to within an explicit error budget,
+measured in units in the last place (ULPs) of the scale of the values.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from wpilib.geometry import Pose2d, Rotation2d, Translation2d
+from wpilib.kinematics import replay
+from wpilib.kinematics.chassisspeeds import ChassisSpeeds
+from wpilib.kinematics.replay import replay_positions
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveDriveOdometry,
+    SwerveModulePosition,
+    SwerveModuleState,
+    SwerveModuleStates,
+)
+
+
+def module_velocity(speeds, module: Translation2d, center: Translation2d):
+    """The reference velocity of a module, from the rigid body equation."""
+    vx, vy, omega = speeds
+    return (
+        vx - omega * (module.y - center.y),
+        vy + omega * (module.x - center.x),
+    )
+
+
+def state_vectors(states):
+    return np.array(
+        [
+            (state.speed * state.angle.cos, state.speed * state.angle.sin)
+            for state in states
+        ]
+    )
+
+
+module_coordinates = st.floats(-1, 1, allow_nan=False)
+layouts = st.lists(
+    st.builds(Translation2d, module_coordinates, module_coordinates),
+    min_size=2,
+    max_size=6,
+    unique_by=lambda module: (module.x, module.y),
+)
+# A small pool of centers, so that sequences switch between cached centers,
+# and more of them than the kinematics caches.
+centers = st.sampled_from(
+    [Translation2d()]
+    + [Translation2d(0.25 * i, -0.5 + 0.125 * i) for i in range(1, 12)]
+)
+velocities = st.floats(-5, 5, allow_nan=False)
+chassis_speeds = st.tuples(velocities, velocities, st.floats(-10, 10, allow_nan=False))
+small_angles = st.one_of(
+    st.floats(-0.2, 0.2),
+    # Around the small angle threshold of Pose2d.exp.
+    st.floats(-2e-9, 2e-9),
+    st.sampled_from([1e-9, -1e-9, np.nextafter(1e-9, 0), np.nextafter(-1e-9, 0)]),
+    st.floats(-1e-4, 1e-4),
+)
+
+
+@given(layouts, st.lists(st.tuples(chassis_speeds, centers), min_size=1, max_size=20))
+def test_inverse_kinematics_paths(assert_close, modules, commands):
+    kinematics = SwerveDriveKinematics(*modules)
+    out = SwerveModuleStates(len(modules))
+
+    for speeds, center in commands:
+        expected = np.array(
+            [module_velocity(speeds, module, center) for module in modules]
+        )
+
+        batched = kinematics.toModuleVelocities([speeds, speeds], center)
+        assert_close(batched[0], expected, ulps=8, scale=20)
+        assert_close(batched[1], expected, ulps=8, scale=20)
+
+        states = kinematics.toSwerveModuleStates(ChassisSpeeds(*speeds), center)
+        kinematics.toSwerveModuleStates(ChassisSpeeds(*speeds), center, out)
+        speeds_list = [state.speed for state in states]
+        assert_close(out.speeds, speeds_list, ulps=8, scale=20)
+
+        # Modules slower than 1e-6 face forward, so only compare the
+        # directions of modules clear of that threshold.
+        moving = np.hypot(expected[:, 0], expected[:, 1]) > 2e-6
+        assert_close(state_vectors(states)[moving], expected[moving], 8, 20)
+        assert_close(out.toVectors()[moving], expected[moving], 8, 20)
+
+
+@given(layouts, st.data())
+def test_forward_kinematics_paths(assert_close, modules, data):
+    kinematics = SwerveDriveKinematics(*modules)
+    states = [
+        SwerveModuleState(speed, Rotation2d(angle))
+        for speed, angle in data.draw(
+            st.lists(
+                st.tuples(velocities, st.floats(-math.pi, math.pi)),
+                min_size=len(modules),
+                max_size=len(modules),
+            )
+        )
+    ]
+
+    expected = kinematics.toChassisSpeeds(*states)
+    actual = kinematics.toChassisSpeeds(SwerveModuleStates.fromStates(*states))
+
+    assert_close(
+        (actual.vx, actual.vy, actual.omega),
+        (expected.vx, expected.vy, expected.omega),
+        ulps=8,
+        scale=50,
+    )
+
+
+def make_log(seed: int, num_modules: int, num_samples: int):
+    """Generates a random log of gyro angles and module distances and angles.
+
+    Logs are too long to draw every value with hypothesis, so it draws the
+    seed instead. The turns between samples mix large turns with turns
+    around the small angle thresholds.
+    """
+    rng = np.random.default_rng(seed)
+    thresholds = np.array([1e-9, np.nextafter(1e-9, 0)])
+    turns = np.choose(
+        rng.integers(0, 4, num_samples),
+        (
+            rng.uniform(-0.2, 0.2, num_samples),
+            rng.uniform(-2e-9, 2e-9, num_samples),
+            rng.choice(thresholds, num_samples) * rng.choice((-1, 1), num_samples),
+            rng.uniform(-1e-4, 1e-4, num_samples),
+        ),
+    )
+    gyro = 1.0 + np.cumsum(turns)
+    steps = rng.uniform(-0.05, 0.05, (num_samples, num_modules))
+    angles = rng.uniform(-math.pi, math.pi, (num_samples, num_modules))
+    return gyro, np.cumsum(steps, axis=0), angles
+
+
+def reference_poses(kinematics, gyro, distances, angles, initial_pose):
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d(gyro[0]), initial_pose)
+    poses = []
+    for i, gyro_angle in enumerate(gyro):
+        pose = odometry.updateWithPositions(
+            Rotation2d(gyro_angle),
+            *(
+                SwerveModulePosition(distances[i, j], Rotation2d(angles[i, j]))
+                for j in range(kinematics.num_modules)
+            ),
+        )
+        poses.append((pose.translation.x, pose.translation.y, pose.rotation.value))
+    return np.array(poses)
+
+
+def integrate_loop(kinematics, gyro, distances, angles, initial_pose):
+    headings = gyro - gyro[0] + initial_pose.rotation.value
+    out_x = np.empty(len(gyro))
+    out_y = np.empty(len(gyro))
+    replay._integrate_loop(
+        kinematics.forward_kinematics,
+        headings,
+        distances,
+        np.cos(angles),
+        np.sin(angles),
+        initial_pose.translation.x,
+        initial_pose.translation.y,
+        out_x,
+        out_y,
+    )
+    return np.column_stack((out_x, out_y))
+
+
+replay_paths = [
+    pytest.param(lambda *args: replay_positions(*args, compiled=False), id="numpy"),
+    pytest.param(
+        lambda *args: replay_positions(*args, compiled=True),
+        id="numba",
+        marks=pytest.mark.skipif(
+            not replay.NUMBA_AVAILABLE, reason="numba is not installed"
+        ),
+    ),
+    pytest.param(integrate_loop, id="loop"),
+]
+
+
+@pytest.mark.parametrize("replay_path", replay_paths)
+@settings(deadline=None, max_examples=50)
+@given(
+    layouts,
+    st.integers(1, 500),
+    st.tuples(module_coordinates, module_coordinates, st.floats(-math.pi, math.pi)),
+    st.integers(0, 2 ** 32 - 1),
+)
+def test_replay_matches_odometry(
+    assert_close, replay_path, modules, num_samples, start, seed
+):
+    kinematics = SwerveDriveKinematics(*modules)
+    gyro, distances, angles = make_log(seed, len(modules), num_samples)
+    initial_pose = Pose2d(start[0], start[1], Rotation2d(start[2]))
+
+    expected = reference_poses(kinematics, gyro, distances, angles, initial_pose)
+    actual = replay_path(kinematics, gyro, distances, angles, initial_pose)
+
+    # Rounding errors accumulate along the log, relative to the distance
+    # travelled, which the pseudo-inverse can amplify for narrow layouts.
+    gain = np.abs(kinematics.forward_kinematics[:2]).sum()
+    scale = 1 + gain * np.abs(np.diff(distances, axis=0)).sum()
+    ulps = 16 * num_samples + 64
+    assert_close(actual[:, :2], expected[:, :2], ulps, scale)
+    if actual.shape[1] == 3:
+        assert_close(np.cos(actual[:, 2]), np.cos(expected[:, 2]), ulps, scale)
+        assert_close(np.sin(actual[:, 2]), np.sin(expected[:, 2]), ulps, scale)
+
+
+@given(
+    layouts,
+    st.lists(
+        st.tuples(
+            st.floats(0.001, 0.1),
+            small_angles,
+            st.lists(st.tuples(velocities, st.floats(-math.pi, math.pi)), min_size=6),
+        ),
+        min_size=1,
+        max_size=50,
+    ),
+)
+def test_timestamped_updates_match_timed_updates(modules, steps):
+    kinematics = SwerveDriveKinematics(*modules)
+    timed = SwerveDriveOdometry(kinematics, Rotation2d())
+    timestamped = SwerveDriveOdometry(kinematics, Rotation2d())
+
+    time = 0.0
+    angle = 0.0
+    for period, turn, samples in steps:
+        time += period
+        angle += turn
+        states = [
+            SwerveModuleState(speed, Rotation2d(module_angle))
+            for speed, module_angle in samples[: len(modules)]
+        ]
+        expected = timed.updateWithTime(time, Rotation2d(angle), *states)
+        actual = timestamped.updateWithTimestamps(
+            time, Rotation2d(angle), time, *states
+        )
+        # Samples at the same time take exactly the same path.
+        assert actual.translation.x == expected.translation.x
+        assert actual.translation.y == expected.translation.y
+        assert actual.rotation == expected.rotation
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from wpilib.geometry import Pose2d, Rotation2d, Translation2d
+from wpilib.kinematics import replay
+from wpilib.kinematics.replay import replay_positions
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveDriveOdometry,
+    SwerveModulePosition,
+)
+
+kinematics = SwerveDriveKinematics(
+    Translation2d(+0.3, +0.3),
+    Translation2d(+0.3, -0.3),
+    Translation2d(-0.3, +0.3),
+    Translation2d(-0.3, -0.3),
+)
+
+
+def make_log(num_samples=300):
+    rng = np.random.default_rng(38)
+    gyro = np.cumsum(rng.normal(0, 0.05, num_samples)) + 3
+    distances = np.cumsum(rng.uniform(0, 0.02, (num_samples, 4)), axis=0)
+    angles = np.cumsum(rng.normal(0, 0.1, (num_samples, 4)), axis=0)
+    return gyro, distances, angles
+
+
+def reference_poses(gyro, distances, angles, initial_pose):
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d(gyro[0]), initial_pose)
+    poses = []
+    for i, gyro_angle in enumerate(gyro):
+        pose = odometry.updateWithPositions(
+            Rotation2d(gyro_angle),
+            *(
+                SwerveModulePosition(distances[i, j], Rotation2d(angles[i, j]))
+                for j in range(4)
+            )
+        )
+        poses.append((pose.translation.x, pose.translation.y, pose.rotation.value))
+    return np.array(poses)
+
+
+def test_matches_odometry():
+    gyro, distances, angles = make_log()
+    initial_pose = Pose2d(1, 2, Rotation2d.fromDegrees(30))
+    expected = reference_poses(gyro, distances, angles, initial_pose)
+
+    poses = replay_positions(
+        kinematics, gyro, distances, angles, initial_pose, compiled=False
+    )
+
+    assert poses == pytest.approx(expected)
+
+
+def test_sequential_kernel_matches_vectorized():
+    gyro, distances, angles = make_log()
+    headings = gyro - gyro[0]
+    outputs = []
+    for integrate in (replay._integrate_loop, replay._integrate_vectorized):
+        out_x = np.empty(len(gyro))
+        out_y = np.empty(len(gyro))
+        integrate(
+            kinematics.forward_kinematics,
+            headings,
+            distances,
+            np.cos(angles),
+            np.sin(angles),
+            1.0,
+            -1.0,
+            out_x,
+            out_y,
+        )
+        outputs.append(np.column_stack((out_x, out_y)))
+
+    assert outputs[0] == pytest.approx(outputs[1])
+
+
+@pytest.mark.skipif(replay.NUMBA_AVAILABLE, reason="numba is installed")
+def test_compiled_requires_numba():
+    gyro, distances, angles = make_log(2)
+    with pytest.raises(ImportError):
+        replay_positions(kinematics, gyro, distances, angles, compiled=True)
+
+
+@pytest.mark.skipif(not replay.NUMBA_AVAILABLE, reason="numba is not installed")
+def test_compiled_matches_vectorized():
+    gyro, distances, angles = make_log()
+
+    compiled = replay_positions(kinematics, gyro, distances, angles, compiled=True)
+    vectorized = replay_positions(kinematics, gyro, distances, angles, compiled=False)
+
+    assert compiled == pytest.approx(vectorized)
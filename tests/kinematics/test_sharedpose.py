@@ -0,0 +1,127 @@
+import threading
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import Pose2d, Rotation2d, Translation2d
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveDriveOdometry,
+    SwerveModulePosition,
+    SwerveModuleState,
+)
+
+sharedpose = pytest.importorskip("wpilib.kinematics.sharedpose")
+if sharedpose.shared_memory is None:  # pragma: no cover
+    pytest.skip("shared memory is not available", allow_module_level=True)
+
+
+@pytest.fixture
+def writer():
+    with sharedpose.SharedPoseWriter(historySize=4) as writer:
+        yield writer
+
+
+def test_latest_and_history(writer):
+    with sharedpose.SharedPoseReader(writer.name) as reader:
+        assert reader.getLatest() is None
+        assert len(reader.getHistory()[0]) == 0
+
+        for i in range(6):
+            writer.publish(i * 0.02, Pose2d(i, -i, Rotation2d(i * 0.1)))
+
+        timestamp, pose = reader.getLatest()
+        assert timestamp == pytest.approx(0.1)
+        assert pose == Pose2d(5, -5, Rotation2d(0.5))
+
+        timestamps, poses = reader.getHistory()
+        assert timestamps == pytest.approx([0.04, 0.06, 0.08, 0.1])
+        assert poses.translation.x == pytest.approx([2, 3, 4, 5])
+
+
+def test_odometry_listener(writer):
+    kinematics = SwerveDriveKinematics(
+        Translation2d(1, 1),
+        Translation2d(1, -1),
+        Translation2d(-1, 1),
+        Translation2d(-1, -1),
+    )
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d())
+    odometry.addListener(writer.publish)
+    state = SwerveModuleState(1, Rotation2d())
+
+    with sharedpose.SharedPoseReader(writer.name) as reader:
+        odometry.updateWithTime(0, Rotation2d(), *[state] * 4)
+        pose = odometry.updateWithTime(0.5, Rotation2d(), *[state] * 4)
+
+        assert reader.getLatest() == (0.5, pose)
+
+        odometry.removeListener(writer.publish)
+        odometry.updateWithTime(1, Rotation2d(), *[state] * 4)
+        assert reader.getLatest() == (0.5, pose)
+
+
+def test_positions_and_reset_publish(writer):
+    kinematics = SwerveDriveKinematics(
+        Translation2d(1, 1),
+        Translation2d(1, -1),
+        Translation2d(-1, 1),
+        Translation2d(-1, -1),
+    )
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d())
+    odometry.addListener(writer.publish)
+
+    with sharedpose.SharedPoseReader(writer.name) as reader:
+        odometry.updateWithPositions(
+            Rotation2d(), *[SwerveModulePosition(0, Rotation2d())] * 4, timestamp=1
+        )
+        pose = odometry.updateWithPositions(
+            Rotation2d(), *[SwerveModulePosition(2, Rotation2d())] * 4, timestamp=2
+        )
+
+        assert pose.translation.x == pytest.approx(2)
+        assert reader.getLatest() == (2, pose)
+
+        reset = Pose2d(5, 5, Rotation2d())
+        odometry.resetPosition(reset, Rotation2d(), timestamp=3)
+        assert reader.getLatest() == (3, reset)
+
+        pose = odometry.updateWithPositions(
+            Rotation2d(), *[SwerveModulePosition(3, Rotation2d())] * 4, timestamp=4
+        )
+        assert reader.getLatest() == (4, pose)
+        assert reader.getHistory()[0] == pytest.approx([1, 2, 3, 4])
+
+        # Listeners can't be given a time from an unknown clock.
+        with pytest.raises(AssertionError):
+            odometry.updateWithPositions(
+                Rotation2d(), *[SwerveModulePosition(4, Rotation2d())] * 4
+            )
+        with pytest.raises(AssertionError):
+            odometry.resetPosition(Pose2d(), Rotation2d())
+        assert odometry.getPose() == pose
+
+
+def test_reads_are_never_torn(writer):
+    done = threading.Event()
+
+    def write():
+        i = 0
+        while not done.is_set():
+            i += 1
+            writer.publish(i, Pose2d(i, i, Rotation2d()))
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    try:
+        with sharedpose.SharedPoseReader(writer.name) as reader:
+            for _ in range(2000):
+                latest = reader.getLatest()
+                if latest is not None:
+                    timestamp, pose = latest
+                    assert pose.translation.x == timestamp
+                timestamps, poses = reader.getHistory()
+                assert np.array_equal(timestamps, poses.translation.y)
+    finally:
+        done.set()
+        thread.join()
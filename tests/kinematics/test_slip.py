@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from wpilib.geometry import Rotation2d, Translation2d
+from wpilib.kinematics import ChassisSpeeds
+from wpilib.kinematics.slip import SlipDetector
+from wpilib.kinematics.swerve import SwerveDriveKinematics, SwerveModuleState
+
+kinematics = SwerveDriveKinematics(
+    Translation2d(+0.3, +0.3),
+    Translation2d(+0.3, -0.3),
+    Translation2d(-0.3, +0.3),
+    Translation2d(-0.3, -0.3),
+)
+
+
+def test_consistent_states_have_no_residual():
+    states = kinematics.toSwerveModuleStates(ChassisSpeeds(1, -2, 3))
+
+    speeds, residual = kinematics.toChassisSpeedsWithResidual(*states)
+
+    assert speeds == pytest.approx((1, -2, 3))
+    assert residual == pytest.approx(np.zeros((4, 2)))
+
+
+def test_slipping_module_has_largest_residual():
+    state = SwerveModuleState(2, Rotation2d())
+    slipping = SwerveModuleState(3, Rotation2d())
+
+    _, residual = kinematics.toChassisSpeedsWithResidual(state, state, slipping, state)
+
+    magnitudes = np.hypot(residual[:, 0], residual[:, 1])
+    assert np.argmax(magnitudes) == 2
+    # The fit spreads the disagreement, so the residuals sum to zero.
+    assert residual.sum(axis=0) == pytest.approx((0, 0))
+
+
+def test_detector_flags_spike():
+    rng = np.random.default_rng(46)
+    detector = SlipDetector(4)
+    for _ in range(200):
+        slipping = detector.update(rng.normal(0, 0.01, (4, 2)))
+        assert not slipping.any()
+    baseline = detector.getBaseline()
+
+    residual = rng.normal(0, 0.01, (4, 2))
+    residual[1] = (0.5, 0.2)
+    slipping = detector.update(residual)
+
+    assert list(slipping) == [False, True, False, False]
+    assert detector.isSlipping()
+    assert detector.getWeights() == pytest.approx([1, 0.01, 1, 1])
+    # The slipping sample is not added to the baseline.
+    assert detector.getBaseline()[1] == pytest.approx(baseline[1])
+
+
+def test_detector_reset():
+    detector = SlipDetector(2)
+    detector.update([(1, 0), (0, 0)])
+    assert detector.isSlipping()
+
+    detector.reset()
+
+    assert not detector.isSlipping()
+    assert detector.getBaseline() == pytest.approx(np.zeros((2, 2)))
@@ -1,10 +1,16 @@
 import math
 
+import numpy as np
 import pytest
 
 from wpilib.geometry import Translation2d, Rotation2d
 from wpilib.kinematics import ChassisSpeeds
-from wpilib.kinematics.swerve import SwerveDriveKinematics, SwerveModuleState
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveModulePosition,
+    SwerveModuleState,
+    SwerveModuleStates,
+)
 
 FL = Translation2d(+12, +12)
 FR = Translation2d(+12, -12)
@@ -161,3 +167,212 @@ def test_normalize():
     assert math.isclose(states[1].speed, 6 * factor)
     assert math.isclose(states[2].speed, 4 * factor)
     assert math.isclose(states[3].speed, 7 * factor)
+
+
+def test_module_states_out_matches_list():
+    speeds = ChassisSpeeds(0, 3.0, 1.5)
+    cor = Translation2d(24, 0)
+    expected = kinematics.toSwerveModuleStates(speeds, cor)
+
+    out = SwerveModuleStates(4)
+    result = kinematics.toSwerveModuleStates(speeds, cor, out=out)
+
+    assert result is out
+    for i, state in enumerate(expected):
+        assert math.isclose(out.speeds[i], state.speed)
+        assert out[i].angle == state.angle
+
+
+def test_module_states_stationary_faces_forward():
+    out = SwerveModuleStates(4)
+    out.sin[:] = 1
+    kinematics.toSwerveModuleStates(ChassisSpeeds(), out=out)
+
+    assert list(out.speeds) == [0, 0, 0, 0]
+    assert list(out.cos) == [1, 1, 1, 1]
+    assert list(out.sin) == [0, 0, 0, 0]
+
+
+def test_module_states_forward():
+    fl = SwerveModuleState(23.43, Rotation2d.fromDegrees(-140.19))
+    fr = SwerveModuleState(23.43, Rotation2d.fromDegrees(-39.81))
+    bl = SwerveModuleState(54.08, Rotation2d.fromDegrees(-109.44))
+    br = SwerveModuleState(54.08, Rotation2d.fromDegrees(-70.56))
+
+    expected = kinematics.toChassisSpeeds(fl, fr, bl, br)
+    chassis_speeds = kinematics.toChassisSpeeds(
+        SwerveModuleStates.fromStates(fl, fr, bl, br)
+    )
+
+    assert chassis_speeds == pytest.approx(expected)
+
+
+def test_normalize_module_states():
+    states = SwerveModuleStates.fromStates(
+        SwerveModuleState(5, Rotation2d()),
+        SwerveModuleState(6, Rotation2d()),
+        SwerveModuleState(4, Rotation2d()),
+        SwerveModuleState(7, Rotation2d()),
+    )
+    SwerveDriveKinematics.normalizeWheelSpeeds(states, 5.5)
+
+    factor = 5.5 / 7
+
+    assert states.speeds == pytest.approx([5 * factor, 6 * factor, 4 * factor, 5.5])
+
+
+def test_module_deltas_to_twist():
+    fl = SwerveModulePosition(0, Rotation2d(0))
+    fr = SwerveModulePosition(150.796, Rotation2d(0))
+    bl = SwerveModulePosition(150.796, Rotation2d.fromDegrees(-90))
+    br = SwerveModulePosition(213.258, Rotation2d.fromDegrees(-45))
+
+    twist = kinematics.toTwist2d(fl, fr, bl, br)
+
+    assert math.isclose(twist.dx, 75.398, abs_tol=0.001)
+    assert math.isclose(twist.dy, -75.398, abs_tol=0.001)
+    assert math.isclose(twist.dtheta, math.tau, abs_tol=0.001)
+
+
+def test_switching_centre_of_rotation_reuses_matrices():
+    kinematics = SwerveDriveKinematics(FL, FR, BL, BR)
+    speeds = ChassisSpeeds(0, 0, math.tau)
+
+    kinematics.toSwerveModuleStates(speeds, FL)
+    first = kinematics._inverse_kinematics
+    kinematics.toSwerveModuleStates(speeds)
+    fl, fr, bl, br = kinematics.toSwerveModuleStates(speeds, Translation2d(12, 12))
+
+    assert kinematics._inverse_kinematics is first
+    assert math.isclose(fl.speed, 0)
+    assert math.isclose(br.speed, 213.258, abs_tol=0.001)
+
+
+def test_module_velocities_matches_module_states():
+    speeds = [ChassisSpeeds(1, 2, 3), ChassisSpeeds(-1, 0, 0.5)]
+
+    velocities = kinematics.toModuleVelocities(speeds, FL)
+
+    for i, chassis_speeds in enumerate(speeds):
+        states = kinematics.toSwerveModuleStates(chassis_speeds, FL)
+        for j, state in enumerate(states):
+            assert math.isclose(velocities[i, j, 0], state.speed * state.angle.cos)
+            assert math.isclose(velocities[i, j, 1], state.speed * state.angle.sin)
+
+
+def test_pack_module_states():
+    state = SwerveModuleState(2, Rotation2d.fromDegrees(30))
+    position = SwerveModulePosition(1, Rotation2d.fromDegrees(-60))
+    assert SwerveModuleState.fromBytes(state.toBytes()) == state
+    assert SwerveModulePosition.fromBytes(position.toBytes()) == position
+
+    states = SwerveModuleStates.fromStates(state, SwerveModuleState())
+    data = states.toPacked().tobytes()
+    assert data == state.toBytes() + SwerveModuleState().toBytes()
+
+    unpacked = SwerveModuleStates.fromPacked(data)
+    assert unpacked[0] == state
+    assert unpacked[1] == SwerveModuleState()
+
+
+def test_equal_weights_match_unweighted():
+    states = (
+        SwerveModuleState(1, Rotation2d.fromDegrees(10)),
+        SwerveModuleState(2, Rotation2d.fromDegrees(-40)),
+        SwerveModuleState(3, Rotation2d.fromDegrees(100)),
+        SwerveModuleState(4, Rotation2d.fromDegrees(180)),
+    )
+
+    weighted = kinematics.toChassisSpeeds(*states, weights=[2, 2, 2, 2])
+
+    assert weighted == pytest.approx(kinematics.toChassisSpeeds(*states))
+
+
+def test_zero_weight_ignores_slipping_module():
+    state = SwerveModuleState(5, Rotation2d())
+    slipping = SwerveModuleState(9, Rotation2d.fromDegrees(30))
+
+    chassis_speeds = kinematics.toChassisSpeeds(
+        slipping, state, state, state, weights=[0, 1, 1, 1]
+    )
+
+    assert chassis_speeds == pytest.approx((5, 0, 0))
+
+
+def test_weights_solve_weighted_least_squares():
+    kinematics = SwerveDriveKinematics(FL, FR, BL, BR)
+    states = SwerveModuleStates.fromStates(
+        SwerveModuleState(1, Rotation2d.fromDegrees(10)),
+        SwerveModuleState(2, Rotation2d.fromDegrees(-40)),
+        SwerveModuleState(3, Rotation2d.fromDegrees(100)),
+        SwerveModuleState(4, Rotation2d.fromDegrees(180)),
+    )
+    weights = np.array([0.5, 1, 2, 0.1])
+
+    # Scaling each row by the square root of its weight gives the same solution.
+    row_scale = np.sqrt(np.repeat(weights, 2))
+    expected, *_ = np.linalg.lstsq(
+        kinematics._inverse_kinematics * row_scale[:, None],
+        states.toVectors().reshape(-1) * row_scale,
+        rcond=None,
+    )
+
+    chassis_speeds = kinematics.toChassisSpeeds(states, weights=weights)
+
+    assert chassis_speeds == pytest.approx(expected)
+
+
+def test_disabled_module_is_ignored():
+    kinematics = SwerveDriveKinematics(FL, FR, BL, BR)
+    state = SwerveModuleState(5, Rotation2d())
+    failed = SwerveModuleState(9, Rotation2d.fromDegrees(30))
+
+    kinematics.setModuleEnabled(0, False)
+
+    assert kinematics.getEnabledModules() == (False, True, True, True)
+    assert kinematics.toChassisSpeeds(failed, state, state, state) == pytest.approx(
+        (5, 0, 0)
+    )
+    three_modules = SwerveDriveKinematics(FR, BL, BR)
+    assert kinematics.forward_kinematics[:, 2:] == pytest.approx(
+        three_modules.forward_kinematics
+    )
+
+    kinematics.setModuleEnabled(0, True)
+    assert kinematics.forward_kinematics == pytest.approx(
+        np.linalg.pinv(kinematics._inverse_kinematics)
+    )
+
+
+def test_precomputed_subsets_are_reused():
+    kinematics = SwerveDriveKinematics(FL, FR, BL, BR)
+    kinematics.precomputeSubsets()
+    assert len(kinematics._subset_matrices) == 11
+
+    kinematics.setEnabledModules([True, False, True, False])
+    first = kinematics.forward_kinematics
+    kinematics.setEnabledModules([True, True, True, True])
+    kinematics.setEnabledModules([True, False, True, False])
+
+    assert kinematics.forward_kinematics is first
+    with pytest.raises(AssertionError):
+        kinematics.setEnabledModules([True, False, False, False])
+
+
+def test_move_module():
+    kinematics = SwerveDriveKinematics(FL, FR, BL, BR)
+    kinematics.setModuleEnabled(3, False)
+    kinematics.toSwerveModuleStates(ChassisSpeeds(0, 0, 1), FL)
+
+    moved = Translation2d(-6, -12)
+    kinematics.moveModule(1, moved)
+    expected = SwerveDriveKinematics(FL, moved, BL, BR)
+
+    assert kinematics.modules == (FL, moved, BL, BR)
+    speeds = ChassisSpeeds(1, 2, 3)
+    actual = kinematics.toSwerveModuleStates(speeds, FL)
+    for i, state in enumerate(expected.toSwerveModuleStates(speeds, FL)):
+        assert actual[i].speed == pytest.approx(state.speed)
+        assert actual[i].angle == state.angle
+    kinematics.setModuleEnabled(3, True)
+    assert kinematics.forward_kinematics == pytest.approx(expected.forward_kinematics)
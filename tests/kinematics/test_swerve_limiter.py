@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import Rotation2d, Translation2d
+from wpilib.kinematics import ChassisSpeeds
+from wpilib.kinematics.swerve import SwerveDriveKinematics, SwerveModuleStates
+from wpilib.kinematics.swervelimiter import SwerveChassisSpeedsLimiter
+
+kinematics = SwerveDriveKinematics(
+    Translation2d(+0.3, +0.3),
+    Translation2d(+0.3, -0.3),
+    Translation2d(-0.3, +0.3),
+    Translation2d(-0.3, -0.3),
+)
+
+
+def module_vectors(speeds):
+    states = kinematics.toSwerveModuleStates(speeds, out=SwerveModuleStates(4))
+    return states.toVectors().copy()
+
+
+def test_within_limits_unchanged():
+    limiter = SwerveChassisSpeedsLimiter(kinematics, 10, 10)
+    assert limiter.calculate(ChassisSpeeds(0.1, 0, 0), 0.02) == pytest.approx(
+        (0.1, 0, 0)
+    )
+
+
+def test_acceleration_limited():
+    limiter = SwerveChassisSpeedsLimiter(kinematics, 4)
+    dt = 0.02
+    previous = ChassisSpeeds()
+    for _ in range(20):
+        speeds = limiter.calculate(ChassisSpeeds(3, 0, 2), dt)
+        change = module_vectors(speeds) - module_vectors(previous)
+        assert np.hypot(change[:, 0], change[:, 1]).max() <= 4 * dt + 1e-9
+        # The direction of the chassis motion is preserved.
+        assert speeds.omega / speeds.vx == pytest.approx(2 / 3)
+        previous = speeds
+
+
+def test_steering_rate_limited():
+    limiter = SwerveChassisSpeedsLimiter(kinematics, 100, math.pi)
+    limiter.reset(ChassisSpeeds(1, 0, 0))
+
+    speeds = limiter.calculate(ChassisSpeeds(1, 1, 0), 0.02)
+
+    angle = Rotation2d(speeds.vx, speeds.vy)
+    assert 0 < angle.getRadians() <= math.pi * 0.02 + 1e-9
+    assert angle.getRadians() > math.pi * 0.02 * 0.99
+
+
+def test_reversing_does_not_steer():
+    limiter = SwerveChassisSpeedsLimiter(kinematics, 100, math.pi)
+    limiter.reset(ChassisSpeeds(1, 0, 0))
+
+    assert limiter.calculate(ChassisSpeeds(-1, 0, 0), 0.02) == pytest.approx((-1, 0, 0))
+
+
+def test_uses_current_module_locations():
+    kinematics = SwerveDriveKinematics(Translation2d(1, 0), Translation2d(-1, 0))
+    limiter = SwerveChassisSpeedsLimiter(kinematics, 1)
+    assert limiter.calculate(ChassisSpeeds(0, 0, 10), 1) == pytest.approx((0, 0, 1))
+
+    limiter.reset()
+    kinematics.moveModule(0, Translation2d(2, 0))
+    assert limiter.calculate(ChassisSpeeds(0, 0, 10), 1) == pytest.approx((0, 0, 0.5))
+
+
+def test_center_of_rotation():
+    limiter = SwerveChassisSpeedsLimiter(kinematics, 1)
+    corner = Translation2d(0.3, 0.3)
+
+    speeds = limiter.calculate(ChassisSpeeds(0, 0, 10), 1, corner)
+
+    states = kinematics.toSwerveModuleStates(speeds, corner)
+    assert max(state.speed for state in states) == pytest.approx(1)
@@ -3,10 +3,13 @@ import math
 import pytest
 
 from wpilib.geometry import Pose2d, Rotation2d, Translation2d
+from wpilib.kinematics import ChassisSpeeds
 from wpilib.kinematics.swerve import (
     SwerveDriveKinematics,
     SwerveDriveOdometry,
+    SwerveModulePosition,
     SwerveModuleState,
+    SwerveModuleStates,
 )
 
 FL = Translation2d(+12, +12)
@@ -70,3 +73,147 @@ def test_gyro_angle_reset(odometry: SwerveDriveOdometry):
     assert math.isclose(pose.translation.x, 0.5)
     assert math.isclose(pose.translation.y, 0)
     assert math.isclose(pose.rotation.getRadians(), 0)
+
+
+def test_heading_wraps(odometry: SwerveDriveOdometry):
+    state = SwerveModuleState()
+    odometry.updateWithTime(0, Rotation2d(), state, state, state, state)
+
+    pose = odometry.updateWithTime(
+        0.1, Rotation2d.fromDegrees(370), state, state, state, state
+    )
+
+    assert math.isclose(pose.rotation.getDegrees(), 10)
+
+
+def test_module_states_array(odometry: SwerveDriveOdometry):
+    states = SwerveModuleStates(4)
+    odometry.updateWithTime(0, Rotation2d(), states)
+
+    kinematics.toSwerveModuleStates(ChassisSpeeds(5, 0, 0), out=states)
+    pose = odometry.updateWithTime(0.1, Rotation2d(), states)
+
+    assert math.isclose(pose.translation.x, 0.5)
+    assert math.isclose(pose.translation.y, 0)
+    assert math.isclose(pose.rotation.getRadians(), 0)
+
+
+def test_stale_gyro_interpolated(odometry: SwerveDriveOdometry):
+    zero = SwerveModuleState()
+    state = SwerveModuleState(5, Rotation2d())
+
+    odometry.addGyroSample(0, Rotation2d())
+    odometry.addModuleSample(0, zero, zero, zero, zero)
+
+    # The module sample waits for a gyro sample at least as new.
+    pose = odometry.addModuleSample(0.1, state, state, state, state)
+    assert pose.translation.x == 0
+
+    odometry.addGyroSample(0.05, Rotation2d.fromDegrees(10))
+    pose = odometry.addGyroSample(0.15, Rotation2d.fromDegrees(30))
+
+    reference = SwerveDriveOdometry(kinematics, Rotation2d())
+    reference.updateWithTime(0, Rotation2d(), zero, zero, zero, zero)
+    expected = reference.updateWithTime(
+        0.1, Rotation2d.fromDegrees(20), state, state, state, state
+    )
+
+    assert math.isclose(pose.rotation.getDegrees(), 20)
+    assert pose == expected
+
+
+def test_update_with_timestamps_matches_synchronised(odometry: SwerveDriveOdometry):
+    state = SwerveModuleState(5, Rotation2d())
+    reference = SwerveDriveOdometry(kinematics, Rotation2d())
+
+    for i in range(5):
+        t = i * 0.02
+        angle = Rotation2d(t)
+        expected = reference.updateWithTime(t, angle, state, state, state, state)
+        pose = odometry.updateWithTimestamps(t, angle, t, state, state, state, state)
+
+        assert pose == expected
+
+
+def test_dropped_samples_are_counted():
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d(), sampleBufferSize=2)
+    state = SwerveModuleState(5, Rotation2d())
+
+    # The gyro lags, so the oldest module samples are discarded.
+    for i in range(3):
+        odometry.addModuleSample(i * 0.02, state, state, state, state)
+    assert odometry.getDroppedModuleSamples() == 1
+
+    odometry.addGyroSample(0.04, Rotation2d())
+    assert odometry.getTimestamp() == 0.04
+
+    # A module sample older than the last integrated one is discarded.
+    odometry.addModuleSample(0.03, state, state, state, state)
+    odometry.addGyroSample(0.05, Rotation2d())
+    assert odometry.getDroppedModuleSamples() == 2
+    assert odometry.getTimestamp() == 0.04
+
+    # The gyro runs ahead, so the oldest gyro sample is discarded.
+    assert odometry.getDroppedGyroSamples() == 0
+    odometry.addGyroSample(0.06, Rotation2d())
+    assert odometry.getDroppedGyroSamples() == 1
+
+
+def test_positions_90deg_turn(odometry: SwerveDriveOdometry):
+    zero = SwerveModulePosition()
+    odometry.resetPosition(Pose2d(), Rotation2d(), zero, zero, zero, zero)
+
+    positions = (
+        SwerveModulePosition(18.85, Rotation2d.fromDegrees(90.0)),
+        SwerveModulePosition(42.15, Rotation2d.fromDegrees(26.565)),
+        SwerveModulePosition(18.85, Rotation2d.fromDegrees(-90)),
+        SwerveModulePosition(42.15, Rotation2d.fromDegrees(-26.565)),
+    )
+    pose = odometry.updateWithPositions(Rotation2d.fromDegrees(90.0), *positions)
+
+    assert math.isclose(pose.translation.x, 12.0, abs_tol=0.01)
+    assert math.isclose(pose.translation.y, 12.0, abs_tol=0.01)
+    assert math.isclose(pose.rotation.getDegrees(), 90.0)
+
+
+def test_positions_independent_of_period(odometry: SwerveDriveOdometry):
+    angle = Rotation2d()
+    for distance in (0, 0.1, 0.35, 0.4, 1.0):
+        position = SwerveModulePosition(distance, angle)
+        pose = odometry.updateWithPositions(
+            angle, position, position, position, position
+        )
+
+    assert math.isclose(pose.translation.x, 1.0)
+    assert pose.translation.y == pytest.approx(0)
+
+
+def test_positions_weighted(odometry: SwerveDriveOdometry):
+    angle = Rotation2d()
+    stuck = SwerveModulePosition(0, angle)
+    odometry.updateWithPositions(angle, stuck, stuck, stuck, stuck)
+
+    position = SwerveModulePosition(1, angle)
+    pose = odometry.updateWithPositions(
+        angle, stuck, position, position, position, weights=[0, 1, 1, 1]
+    )
+
+    assert math.isclose(pose.translation.x, 1.0)
+    assert pose.translation.y == pytest.approx(0)
+
+
+def test_disabling_module_keeps_pose():
+    kinematics = SwerveDriveKinematics(FL, FR, BL, BR)
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d())
+    angle = Rotation2d()
+    for distance in (0, 1):
+        position = SwerveModulePosition(distance, angle)
+        odometry.updateWithPositions(angle, position, position, position, position)
+
+    kinematics.setModuleEnabled(2, False)
+    position = SwerveModulePosition(2, angle)
+    failed = SwerveModulePosition(5, Rotation2d.fromDegrees(90))
+    pose = odometry.updateWithPositions(angle, position, position, failed, position)
+
+    assert math.isclose(pose.translation.x, 2.0)
+    assert pose.translation.y == pytest.approx(0)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from wpilib.geometry import (
+    Pose2d,
+    Rotation2d,
+    Transform2d,
+    Translation2d,
+    Translation2dArray,
+)
+from wpilib.kinematics.swerve import (
+    SwerveDriveKinematics,
+    SwerveDriveOdometry,
+    SwerveModuleState,
+)
+from wpilib.kinematics.vision import CameraTransformCache
+
+kinematics = SwerveDriveKinematics(
+    Translation2d(+0.3, +0.3),
+    Translation2d(+0.3, -0.3),
+    Translation2d(-0.3, +0.3),
+    Translation2d(-0.3, -0.3),
+)
+cameras = (
+    Transform2d(Translation2d(0.3, 0), Rotation2d()),
+    Transform2d(Translation2d(-0.3, 0.1), Rotation2d.fromDegrees(180)),
+)
+
+
+def expected_field_positions(pose, camera, detections):
+    camera_pose = pose + cameras[camera]
+    return [
+        (camera_pose + Transform2d(detection, Rotation2d())).translation
+        for detection in detections
+    ]
+
+
+def test_to_field_matches_pose_composition():
+    odometry = SwerveDriveOdometry(
+        kinematics, Rotation2d(), Pose2d(1, 2, Rotation2d.fromDegrees(30))
+    )
+    cache = CameraTransformCache(odometry, *cameras)
+    detections = Translation2dArray([1, 2, 3], [0, -1, 0.5])
+
+    for camera in range(len(cameras)):
+        field = cache.toField(camera, detections)
+        for i, expected in enumerate(
+            expected_field_positions(odometry.getPose(), camera, detections)
+        ):
+            assert field[i] == expected
+
+
+def test_cache_follows_odometry_updates():
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d())
+    cache = CameraTransformCache(odometry, *cameras)
+    assert cache.getCameraPose(1) == Pose2d(-0.3, 0.1, Rotation2d.fromDegrees(180))
+
+    state = SwerveModuleState(1, Rotation2d())
+    odometry.updateWithTime(0, Rotation2d(), *[state] * 4)
+    odometry.updateWithTime(1, Rotation2d.fromDegrees(90), *[state] * 4)
+
+    pose = odometry.getPose()
+    assert cache.getCameraPose(0) == pose + cameras[0]
+    assert cache.getCameraPose(1) == pose + cameras[1]
+
+
+def test_camera_per_detection():
+    odometry = SwerveDriveOdometry(kinematics, Rotation2d())
+    cache = CameraTransformCache(odometry, *cameras)
+    detections = Translation2dArray([1, 1], [0, 0])
+
+    field = cache.toField(np.array([0, 1]), detections)
+
+    assert field.toArray() == pytest.approx(np.array([(1.3, 0), (-1.3, 0.1)]))
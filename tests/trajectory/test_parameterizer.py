@@ -0,0 +1,87 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import Pose2dArray, Translation2d
+from wpilib.kinematics.swerve import SwerveDriveKinematics
+from wpilib.trajectory import (
+    CentripetalAccelerationConstraint,
+    MaxVelocityConstraint,
+    RectangularRegionConstraint,
+    SwerveDriveKinematicsConstraint,
+    TrapezoidProfile,
+    time_parameterize,
+)
+
+kinematics = SwerveDriveKinematics(
+    Translation2d(+0.3, +0.3),
+    Translation2d(+0.3, -0.3),
+    Translation2d(-0.3, +0.3),
+    Translation2d(-0.3, -0.3),
+)
+
+
+def straight_line(length, num_samples=1001):
+    x = np.linspace(0, length, num_samples)
+    return Pose2dArray.fromArray(np.column_stack((x, np.zeros_like(x), x * 0)))
+
+
+def circle(radius, num_samples=1001):
+    angles = np.linspace(0, math.pi, num_samples)
+    poses = Pose2dArray.fromArray(
+        np.column_stack(
+            (radius * np.sin(angles), radius * (1 - np.cos(angles)), angles)
+        )
+    )
+    return poses, np.full(num_samples, 1 / radius)
+
+
+def test_straight_line_matches_trapezoid_profile():
+    samples = time_parameterize(straight_line(3), np.zeros(1001), [], 0, 0, 1.75, 0.75)
+    profile = TrapezoidProfile(
+        TrapezoidProfile.Constraints(1.75, 0.75), TrapezoidProfile.State(3, 0)
+    )
+
+    assert samples.times[-1] == pytest.approx(profile.totalTime(), rel=1e-3)
+    assert samples.velocities == pytest.approx(
+        profile.calculate(samples.times).velocity, abs=0.02
+    )
+    assert np.abs(samples.accelerations).max() <= 0.75 + 1e-9
+
+
+def test_centripetal_acceleration():
+    poses, curvatures = circle(2)
+    constraint = CentripetalAccelerationConstraint(0.5)
+
+    samples = time_parameterize(poses, curvatures, [constraint], 0, 0, 5, 10)
+
+    assert samples.velocities.max() == pytest.approx(1)
+    assert samples.velocities[0] == samples.velocities[-1] == 0
+
+
+def test_swerve_module_speeds():
+    poses, curvatures = circle(1)
+    constraint = SwerveDriveKinematicsConstraint(kinematics, 2)
+
+    samples = time_parameterize(poses, curvatures, [constraint], 0, 0, 5, 10)
+
+    speeds = np.column_stack(
+        (samples.velocities, np.zeros(1001), samples.velocities * curvatures)
+    )
+    vectors = kinematics.toModuleVelocities(speeds)
+    module_speeds = np.hypot(vectors[..., 0], vectors[..., 1])
+    assert module_speeds.max() == pytest.approx(2)
+
+
+def test_region():
+    constraint = RectangularRegionConstraint(
+        Translation2d(4, -1), Translation2d(6, 1), MaxVelocityConstraint(0.5)
+    )
+    poses = straight_line(20)
+
+    samples = time_parameterize(poses, np.zeros(1001), [constraint], 0, 0, 3, 2)
+
+    inside = constraint.isInRegion(poses)
+    assert samples.velocities[inside].max() == pytest.approx(0.5)
+    assert samples.velocities[~inside].max() == pytest.approx(3)
@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import (
+    Pose2d,
+    Rotation2d,
+    Translation2d,
+    Translation2dArray,
+    Twist2d,
+)
+from wpilib.trajectory import IndexedPath, PurePursuitController
+
+
+def test_path_sample():
+    path = IndexedPath.fromWaypoints(
+        [Translation2d(0, 0), Translation2d(3, 0), Translation2d(3, 4)]
+    )
+
+    assert path.getTotalDistance() == 7
+    assert path.sample(1.5) == Translation2d(1.5, 0)
+    assert path.sample(5) == Translation2d(3, 2)
+    assert path.sample(100) == Translation2d(3, 4)
+
+
+def simulate(controller, pose, dt=0.02, steps=2000):
+    for _ in range(steps):
+        speeds = controller.calculate(pose)
+        pose = pose.exp(Twist2d(speeds.vx * dt, speeds.vy * dt, speeds.omega * dt))
+        if controller.isFinished(0.05):
+            break
+    return pose
+
+
+def test_holonomic_follows_dense_path():
+    t = np.linspace(0, math.pi, 5000)
+    path = IndexedPath(Translation2dArray(5 * np.sin(t), 5 - 5 * np.cos(t)))
+    controller = PurePursuitController(path, lookaheadDistance=0.5, speed=2)
+
+    pose = simulate(controller, Pose2d())
+
+    assert controller.isFinished(0.05)
+    assert pose.translation.getDistance(Translation2d(0, 10)) < 0.1
+
+
+def test_differential_follows_path():
+    path = IndexedPath.fromWaypoints(
+        [Translation2d(0, 0), Translation2d(4, 0), Translation2d(4, 4)]
+    )
+    controller = PurePursuitController(
+        path, lookaheadDistance=0.75, speed=1.5, holonomic=False
+    )
+
+    pose = simulate(controller, Pose2d())
+
+    assert controller.isFinished(0.05)
+    assert pose.translation.getDistance(Translation2d(4, 4)) < 0.2
+    assert math.isclose(pose.rotation.getDegrees(), 90, abs_tol=10)
+
+
+def test_turns_towards_headings():
+    path = IndexedPath.fromWaypoints(
+        [Pose2d(0, 0, Rotation2d()), Pose2d(4, 0, Rotation2d.fromDegrees(90))]
+    )
+    controller = PurePursuitController(
+        path, lookaheadDistance=0.5, speed=1, headingGain=3
+    )
+
+    pose = simulate(controller, Pose2d())
+
+    assert math.isclose(pose.rotation.getDegrees(), 90, abs_tol=5)
+
+
+def test_progress_is_monotonic():
+    path = IndexedPath.fromWaypoints(
+        [Translation2d(0, 0), Translation2d(2, 0), Translation2d(0, 0.1)]
+    )
+    controller = PurePursuitController(path, lookaheadDistance=0.5, speed=1)
+
+    controller.calculate(Pose2d(1.9, 0, Rotation2d()))
+    progress = controller.getProgress()
+    controller.calculate(Pose2d(0, 0, Rotation2d()))
+
+    assert controller.getProgress() >= progress
+    assert progress == pytest.approx(1.9)
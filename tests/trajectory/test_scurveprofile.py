@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from wpilib.trajectory import SCurveProfile
+
+
+@pytest.mark.parametrize(
+    "constraints, goal",
+    [
+        (SCurveProfile.Constraints(1, 1, 2), 3),
+        (SCurveProfile.Constraints(3, 1, 2), 2),
+        (SCurveProfile.Constraints(10, 5, 2), 0.2),
+        (SCurveProfile.Constraints(2, 1, 4), -3),
+    ],
+)
+def test_respects_constraints(constraints, goal):
+    profile = SCurveProfile(constraints, goal, 0.5)
+    times, states = profile.sample(0.001)
+
+    assert states.position[0] == 0.5
+    assert states.position[-1] == goal
+    assert np.all(np.abs(states.velocity) <= constraints.maxVelocity + 1e-9)
+    assert np.all(np.abs(states.acceleration) <= constraints.maxAcceleration + 1e-9)
+
+    jerk = np.diff(states.acceleration) / np.diff(times)
+    assert np.all(np.abs(jerk) <= constraints.maxJerk + 1e-6)
+
+    # Velocity is the derivative of position.
+    velocity = np.gradient(states.position, times)
+    assert velocity[1:-1] == pytest.approx(states.velocity[1:-1], abs=1e-3)
+
+
+def test_scalar_matches_array():
+    profile = SCurveProfile(SCurveProfile.Constraints(1, 1, 2), 3)
+    times = np.linspace(0, profile.totalTime(), 11)
+    states = profile.calculate(times)
+
+    for i, t in enumerate(times):
+        state = profile.calculate(float(t))
+        assert state.position == pytest.approx(states.position[i])
+        assert state.velocity == pytest.approx(states.velocity[i])
+    assert profile.isFinished(profile.totalTime())
@@ -0,0 +1,69 @@
+import math
+
+import numpy as np
+import pytest
+
+from wpilib.geometry import Rotation2d, Translation2d
+from wpilib.kinematics.swerve import SwerveDriveKinematics, SwerveModuleStates
+from wpilib.trajectory import TrapezoidProfile
+from wpilib.trajectory.motionprofile import MotionProfile
+
+constraints = TrapezoidProfile.Constraints(1.75, 0.75)
+
+
+def test_reaches_goal():
+    goal = TrapezoidProfile.State(3, 0)
+    state = TrapezoidProfile.State()
+
+    for _ in range(450):
+        profile = TrapezoidProfile(constraints, goal, state)
+        state = profile.calculate(0.01)
+
+    assert state.position == pytest.approx(goal.position)
+    assert state.velocity == pytest.approx(goal.velocity)
+
+
+def test_backwards():
+    goal = TrapezoidProfile.State(-2, 0)
+    profile = TrapezoidProfile(constraints, goal)
+
+    assert profile.calculate(profile.totalTime()) == goal
+    assert profile.calculate(1).velocity == pytest.approx(-0.75)
+
+
+def test_array_matches_scalar():
+    profile = TrapezoidProfile(
+        constraints, TrapezoidProfile.State(5, 0.5), TrapezoidProfile.State(1, 0.25)
+    )
+    times, states = profile.sample(0.02)
+
+    assert times[-1] >= profile.totalTime()
+    for i in range(0, len(times), 7):
+        expected = profile.calculate(float(times[i]))
+        assert states.position[i] == pytest.approx(expected.position)
+        assert states.velocity[i] == pytest.approx(expected.velocity)
+    assert np.all(np.abs(states.velocity) <= constraints.maxVelocity + 1e-9)
+
+
+def test_chassis_speeds_drive_modules():
+    kinematics = SwerveDriveKinematics(
+        Translation2d(1, 1), Translation2d(1, -1), Translation2d(-1, 1)
+    )
+    profile = TrapezoidProfile(constraints, TrapezoidProfile.State(3, 0))
+    direction = Rotation2d.fromDegrees(90)
+
+    states = kinematics.toSwerveModuleStates(
+        profile.getChassisSpeeds(1, direction), out=SwerveModuleStates(3)
+    )
+    assert states.speeds == pytest.approx([0.75] * 3)
+    assert states[0].angle == direction
+
+    speeds = profile.getChassisSpeeds(np.array([0, 1, 2]), direction)
+    assert speeds.shape == (3, 3)
+    assert speeds[:, 1] == pytest.approx([0, 0.75, 1.5])
+    assert math.isclose(speeds[1, 0], 0, abs_tol=1e-12)
+
+
+def test_motion_profile_is_abstract():
+    with pytest.raises(TypeError):
+        MotionProfile()
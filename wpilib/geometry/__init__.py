@@ -1,15 +1,38 @@
 import math
+import struct
 from dataclasses import dataclass
 from typing import overload
 
-from .rotation2d import Rotation2d
-from .translation2d import Translation2d
+from .rotation2d import Rotation2d, _zero_rotation
+from .rotation2darray import Rotation2dArray
+from .translation2d import Translation2d, _identity_translation
+from .translation2darray import Translation2dArray, Translation2dGrid
+from .tolerance import get_tolerance, memoize, set_tolerance
 from .twist2d import Twist2d
 
-__all__ = ("Rotation2d", "Translation2d", "Twist2d", "Transform2d", "Pose2d")
-
-_identity_translation = Translation2d()
-_zero_rotation = Rotation2d()
+__all__ = (
+    "Rotation2d",
+    "Rotation2dArray",
+    "Translation2d",
+    "Translation2dArray",
+    "Translation2dGrid",
+    "Twist2d",
+    "Transform2d",
+    "Pose2d",
+    "Pose2dArray",
+    "compose_scan",
+    "Rotation3d",
+    "Rotation3dArray",
+    "Translation3d",
+    "Translation3dArray",
+    "Twist3d",
+    "Transform3d",
+    "Pose3d",
+    "Pose3dArray",
+    "get_tolerance",
+    "set_tolerance",
+    "memoize",
+)
 
 
 @dataclass
@@ -21,6 +44,11 @@ class Transform2d:
 
     __slots__ = ("translation", "rotation")
 
+    #: The binary layout of a packed transform: x, y and rotation in radians.
+    _packer = struct.Struct("<3d")
+    #: The size of a packed transform in bytes.
+    packedSize = _packer.size
+
     def __init__(
         self,
         translation: Translation2d = _identity_translation,
@@ -37,6 +65,30 @@ class Transform2d:
 
     __rmul__ = __mul__
 
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return self.translation._key() + self.rotation._key()
+
+    def toBytes(self) -> bytes:
+        """Packs the transform into :attr:`packedSize` bytes."""
+        translation = self.translation
+        return self._packer.pack(translation.x, translation.y, self.rotation.value)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the transform into a writable buffer at the given offset."""
+        translation = self.translation
+        self._packer.pack_into(
+            buffer, offset, translation.x, translation.y, self.rotation.value
+        )
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Transform2d":
+        """Unpacks a transform packed by :meth:`toBytes` or :meth:`packInto`."""
+        x, y, theta = cls._packer.unpack_from(buffer, offset)
+        return cls(Translation2d(x, y), Rotation2d(theta))
+
 
 @dataclass
 class Pose2d:
@@ -47,6 +99,12 @@ class Pose2d:
 
     __slots__ = ("translation", "rotation")
 
+    #: The binary layout of a packed pose: x, y and rotation in radians.
+    #: This is the same as an element of :attr:`Pose2dArray.dtype`.
+    _packer = struct.Struct("<3d")
+    #: The size of a packed pose in bytes.
+    packedSize = _packer.size
+
     @overload
     def __init__(self):
         """Constructs a pose at the origin facing toward the positive X axis."""
@@ -71,12 +129,38 @@ class Pose2d:
         if len(args) == 1:
             translation = args[0]
             assert isinstance(translation, Translation2d)
+        elif not args:
+            translation = _identity_translation
         else:
             translation = Translation2d(*args)
 
         self.translation = translation
         self.rotation = rotation
 
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return self.translation._key() + self.rotation._key()
+
+    def toBytes(self) -> bytes:
+        """Packs the pose into :attr:`packedSize` bytes."""
+        translation = self.translation
+        return self._packer.pack(translation.x, translation.y, self.rotation.value)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the pose into a writable buffer at the given offset."""
+        translation = self.translation
+        self._packer.pack_into(
+            buffer, offset, translation.x, translation.y, self.rotation.value
+        )
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Pose2d":
+        """Unpacks a pose packed by :meth:`toBytes` or :meth:`packInto`."""
+        x, y, theta = cls._packer.unpack_from(buffer, offset)
+        return cls(x, y, Rotation2d(theta))
+
     def __add__(self, other: "Transform2d") -> "Pose2d":
         """Transforms the pose by the given transformation.
 
@@ -162,7 +246,9 @@ class Pose2d:
             c = 0.5 * dtheta
         else:
             s = sin_theta / dtheta
-            c = (1.0 - cos_theta) / dtheta
+            # 1 - cos(dtheta) = 2 sin^2(dtheta / 2), which doesn't lose
+            # precision to cancellation for small angles.
+            c = 2.0 * math.sin(0.5 * dtheta) ** 2 / dtheta
 
         transform = Transform2d(
             Translation2d(dx * s - dy * c, dx * c + dy * s),
@@ -188,11 +274,24 @@ class Pose2d:
         if abs(cos_minus_one) < 1e-9:
             half_theta_by_tan_half_dtheta = 1.0 - 1 / 12 * dtheta ** 2
         else:
-            half_theta_by_tan_half_dtheta = (
-                -(half_dtheta * transform.rotation.sin) / cos_minus_one
-            )
+            # Equal to -(half_dtheta * sin) / (cos - 1), without the
+            # cancellation in cos - 1 for small angles.
+            half_theta_by_tan_half_dtheta = half_dtheta / math.tan(half_dtheta)
 
         translation_part = transform.translation.rotateBy(
             Rotation2d(half_theta_by_tan_half_dtheta, -half_dtheta)
         ) * math.hypot(half_theta_by_tan_half_dtheta, half_dtheta)
         return Twist2d(translation_part.x, translation_part.y, dtheta)
+
+
+# Imported last, as the array module uses Pose2d and Transform2d.
+from .pose2darray import Pose2dArray, compose_scan  # noqa: E402
+
+# The 3d types, which build on the 2d types they convert to and from.
+from .rotation3d import Rotation3d  # noqa: E402
+from .rotation3darray import Rotation3dArray  # noqa: E402
+from .translation3d import Translation3d  # noqa: E402
+from .translation3darray import Translation3dArray  # noqa: E402
+from .twist3d import Twist3d  # noqa: E402
+from .pose3d import Pose3d, Transform3d  # noqa: E402
+from .pose3darray import Pose3dArray  # noqa: E402
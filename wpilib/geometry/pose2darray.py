@@ -0,0 +1,259 @@
+from typing import Iterable, Optional, Union, overload
+
+import numpy as np
+
+from . import Pose2d, Transform2d
+from .rotation2darray import Rotation2dArray
+from .translation2darray import Translation2dArray
+
+
+class Pose2dArray:
+    """An array of 2d poses.
+
+    This stores the translations and rotations of the poses as a
+    Translation2dArray and a Rotation2dArray, and performs the same
+    operations as Pose2d on every pose at once.
+
+    A pose is also a rigid transform, so a Pose2dArray can equally hold
+    a sequence of transforms, such as the changes in pose between
+    odometry updates.
+    """
+
+    __slots__ = ("translation", "rotation")
+
+    #: The NumPy dtype of packed arrays of poses, with the same
+    #: layout as :meth:`Pose2d.toBytes`.
+    dtype = np.dtype([("x", "<f8"), ("y", "<f8"), ("theta", "<f8")])
+
+    def __init__(self, translation: Translation2dArray, rotation: Rotation2dArray):
+        #: The translations of the poses.
+        self.translation = translation
+        #: The rotations of the poses.
+        self.rotation = rotation
+
+    @classmethod
+    def fromPoses(cls, poses: Iterable[Pose2d]) -> "Pose2dArray":
+        """Creates an array from individual poses."""
+        components = np.array(
+            [
+                (
+                    pose.translation.x,
+                    pose.translation.y,
+                    pose.rotation.cos,
+                    pose.rotation.sin,
+                    pose.rotation.value,
+                )
+                for pose in poses
+            ],
+            dtype=float,
+        ).reshape(-1, 5)
+        return cls(
+            Translation2dArray(components[:, 0], components[:, 1]),
+            Rotation2dArray(components[:, 2], components[:, 3], components[:, 4]),
+        )
+
+    @classmethod
+    def fromArray(cls, poses: np.ndarray) -> "Pose2dArray":
+        """Creates an array from an (n, 3) array of x, y and heading in radians."""
+        poses = np.asarray(poses, dtype=float)
+        return cls(
+            Translation2dArray(poses[:, 0], poses[:, 1]),
+            Rotation2dArray.fromRadians(poses[:, 2]),
+        )
+
+    @classmethod
+    def fromTwists(cls, twists: np.ndarray) -> "Pose2dArray":
+        """Creates the transforms that each twist applies to a pose.
+
+        This is the array equivalent of ``Pose2d().exp(twist)``.
+
+        :param twists: An (n, 3) array of the dx, dy and dtheta of each twist.
+        """
+        twists = np.asarray(twists, dtype=float)
+        dx = twists[:, 0]
+        dy = twists[:, 1]
+        dtheta = twists[:, 2]
+
+        sin_theta = np.sin(dtheta)
+        cos_theta = np.cos(dtheta)
+        small = np.abs(dtheta) < 1e-9
+        safe_dtheta = np.where(small, 1.0, dtheta)
+        s = np.where(small, 1.0 - 1 / 6 * dtheta ** 2, sin_theta / safe_dtheta)
+        c = np.where(small, 0.5 * dtheta, 2.0 * np.sin(0.5 * dtheta) ** 2 / safe_dtheta)
+
+        return cls(
+            Translation2dArray(dx * s - dy * c, dx * c + dy * s),
+            Rotation2dArray(cos_theta, sin_theta),
+        )
+
+    def toArray(self) -> np.ndarray:
+        """Returns the poses as an (n, 3) array of x, y and heading in radians."""
+        translation = self.translation
+        return np.column_stack(
+            (translation.x, translation.y, self.rotation.getRadians())
+        )
+
+    def toPacked(self) -> np.ndarray:
+        """Packs the poses into a structured array of :attr:`dtype`.
+
+        The result supports the buffer protocol, so it can be written
+        directly to shared memory or a socket.
+        """
+        translation = self.translation
+        packed = np.empty(len(translation), dtype=self.dtype)
+        packed["x"] = translation.x
+        packed["y"] = translation.y
+        packed["theta"] = self.rotation.getRadians()
+        return packed
+
+    @classmethod
+    def fromPacked(cls, buffer) -> "Pose2dArray":
+        """Unpacks poses from a buffer packed by :meth:`toPacked`.
+
+        The translation components are views of the buffer rather than copies.
+        """
+        packed = np.frombuffer(buffer, dtype=cls.dtype)
+        return cls(
+            Translation2dArray(packed["x"], packed["y"]),
+            Rotation2dArray.fromRadians(packed["theta"]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.translation)
+
+    @overload
+    def __getitem__(self, index: int) -> Pose2d:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "Pose2dArray":
+        ...
+
+    def __getitem__(self, index):
+        """Returns a single Pose2d, or an array for slices and index arrays."""
+        translation = self.translation[index]
+        rotation = self.rotation[index]
+        if isinstance(translation, Translation2dArray):
+            return Pose2dArray(translation, rotation)
+        return Pose2d(translation, rotation)
+
+    def __repr__(self) -> str:
+        return f"Pose2dArray({self.toArray()!r})"
+
+    def __add__(self, other: Union["Pose2dArray", Transform2d]) -> "Pose2dArray":
+        """Transforms every pose by the given transformation,
+        or element-wise by an array of transforms.
+
+        See :meth:`Pose2d.__add__`.
+        """
+        if not isinstance(other, (Pose2dArray, Transform2d)):
+            return NotImplemented
+        rotation = self.rotation
+        cos = rotation.cos
+        sin = rotation.sin
+        x = other.translation.x
+        y = other.translation.y
+        return Pose2dArray(
+            self.translation + Translation2dArray(x * cos - y * sin, x * sin + y * cos),
+            rotation + other.rotation,
+        )
+
+    def exp(self, twists: np.ndarray) -> "Pose2dArray":
+        """Applies a twist to every pose element-wise.
+
+        See :meth:`Pose2d.exp`.
+
+        :param twists: An (n, 3) array of the dx, dy and dtheta of each twist.
+        """
+        return self + Pose2dArray.fromTwists(twists)
+
+    def log(self, end: "Pose2dArray") -> np.ndarray:
+        """Returns the twists that map each pose to the corresponding end pose.
+
+        See :meth:`Pose2d.log`.
+
+        :returns: An (n, 3) array of the dx, dy and dtheta of each twist.
+        """
+        rotation = self.rotation
+        cos = rotation.cos
+        sin = rotation.sin
+        delta_x = end.translation.x - self.translation.x
+        delta_y = end.translation.y - self.translation.y
+        # The translation of end - self, in the frame of each pose.
+        tx = cos * delta_x + sin * delta_y
+        ty = cos * delta_y - sin * delta_x
+
+        relative = end.rotation - rotation
+        dtheta = relative.getRadians()
+        half_dtheta = 0.5 * dtheta
+        small = np.abs(relative.cos - 1.0) < 1e-9
+        safe_half_dtheta = np.where(small, 1.0, half_dtheta)
+        half_theta_by_tan_half_dtheta = np.where(
+            small,
+            1.0 - 1 / 12 * dtheta ** 2,
+            safe_half_dtheta / np.tan(safe_half_dtheta),
+        )
+        return np.column_stack(
+            (
+                half_theta_by_tan_half_dtheta * tx + half_dtheta * ty,
+                half_theta_by_tan_half_dtheta * ty - half_dtheta * tx,
+                dtheta,
+            )
+        )
+
+
+def compose_scan(
+    transforms: Pose2dArray, initialPose: Optional[Pose2d] = None
+) -> Pose2dArray:
+    """Composes a sequence of transforms, returning every intermediate pose.
+
+    The result is the same as applying each transform in turn::
+
+        pose = initialPose
+        for transform in transforms:
+            pose = pose + transform
+            poses.append(pose)
+
+    but as composition is associative, this is computed as a parallel
+    prefix scan. Each of the log2(n) passes composes every pose with the
+    pose a doubling distance before it in a single vectorized operation,
+    so long chains such as a whole odometry log are fast to integrate.
+
+    :param transforms: The transforms to apply, in order.
+    :param initialPose: The pose the first transform is applied to.
+                        Defaults to the origin.
+
+    :returns: The pose after each transform.
+    """
+    x = transforms.translation.x.copy()
+    y = transforms.translation.y.copy()
+    cos = transforms.rotation.cos.copy()
+    sin = transforms.rotation.sin.copy()
+
+    num_transforms = len(x)
+    offset = 1
+    while offset < num_transforms:
+        px = x[:-offset]
+        py = y[:-offset]
+        pc = cos[:-offset]
+        ps = sin[:-offset]
+        qx = x[offset:]
+        qy = y[offset:]
+        qc = cos[offset:]
+        qs = sin[offset:]
+        # Compute every composition before writing any of them back.
+        x[offset:], y[offset:], cos[offset:], sin[offset:] = (
+            px + pc * qx - ps * qy,
+            py + ps * qx + pc * qy,
+            pc * qc - ps * qs,
+            pc * qs + ps * qc,
+        )
+        offset *= 2
+
+    poses = Pose2dArray(Translation2dArray(x, y), Rotation2dArray(cos, sin))
+    if initialPose is None:
+        return poses
+    return Pose2dArray(
+        initialPose.translation + poses.translation.rotateBy(initialPose.rotation),
+        initialPose.rotation + poses.rotation,
+    )
@@ -0,0 +1,289 @@
+import math
+import struct
+from dataclasses import dataclass
+from typing import overload
+
+from . import Pose2d, Rotation2d, Translation2d
+from .rotation3d import Rotation3d, _from_quaternion
+from .translation3d import Translation3d
+from .twist3d import Twist3d
+
+_zero_rotation = _from_quaternion(1.0, 0.0, 0.0, 0.0)
+_identity_translation = Translation3d()
+
+
+@dataclass
+class Transform3d:
+    """Represents a transformation for a Pose3d."""
+
+    translation: Translation3d
+    rotation: Rotation3d
+
+    __slots__ = ("translation", "rotation")
+
+    #: The binary layout of a packed transform: x, y, z and the rotation
+    #: quaternion's w, x, y and z.
+    _packer = struct.Struct("<7d")
+    #: The size of a packed transform in bytes.
+    packedSize = _packer.size
+
+    def __init__(
+        self,
+        translation: Translation3d = _identity_translation,
+        rotation: Rotation3d = _zero_rotation,
+    ):
+        self.translation = translation
+        self.rotation = rotation
+
+    def inverse(self) -> "Transform3d":
+        """Returns the transform that undoes this one."""
+        rotation = -self.rotation
+        return Transform3d(-self.translation.rotateBy(rotation), rotation)
+
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return self.translation._key() + self.rotation._key()
+
+    def toBytes(self) -> bytes:
+        """Packs the transform into :attr:`packedSize` bytes."""
+        return self._packer.pack(*_components(self.translation, self.rotation))
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the transform into a writable buffer at the given offset."""
+        self._packer.pack_into(
+            buffer, offset, *_components(self.translation, self.rotation)
+        )
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Transform3d":
+        """Unpacks a transform packed by :meth:`toBytes` or :meth:`packInto`."""
+        x, y, z, qw, qx, qy, qz = cls._packer.unpack_from(buffer, offset)
+        return cls(Translation3d(x, y, z), _from_quaternion(qw, qx, qy, qz))
+
+
+@dataclass
+class Pose3d:
+    """Represents a 3d pose containing translational and rotational elements."""
+
+    translation: Translation3d
+    rotation: Rotation3d
+
+    __slots__ = ("translation", "rotation")
+
+    #: The binary layout of a packed pose: x, y, z and the rotation
+    #: quaternion's w, x, y and z.
+    #: This is the same as an element of :attr:`Pose3dArray.dtype`.
+    _packer = struct.Struct("<7d")
+    #: The size of a packed pose in bytes.
+    packedSize = _packer.size
+
+    @overload
+    def __init__(self):
+        """Constructs a pose at the origin facing toward the positive X axis."""
+
+    @overload
+    def __init__(self, translation: Translation3d, rotation: Rotation3d):
+        """Constructs a pose with the specified translation and rotation."""
+
+    @overload
+    def __init__(self, x: float, y: float, z: float, rotation: Rotation3d):
+        """Convenience constructor that takes x, y and z values directly
+        instead of requiring a Translation3d.
+        """
+
+    def __init__(self, *args, rotation=None):
+        if rotation is None:
+            if args:
+                *args, rotation = args
+            else:
+                rotation = _zero_rotation
+
+        if len(args) == 1:
+            translation = args[0]
+            assert isinstance(translation, Translation3d)
+        elif not args:
+            translation = _identity_translation
+        else:
+            translation = Translation3d(*args)
+
+        self.translation = translation
+        self.rotation = rotation
+
+    @classmethod
+    def fromPose2d(cls, pose: Pose2d) -> "Pose3d":
+        """Creates a pose in the XY plane from a 2d pose."""
+        return cls(
+            Translation3d.fromTranslation2d(pose.translation),
+            Rotation3d.fromRotation2d(pose.rotation),
+        )
+
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return self.translation._key() + self.rotation._key()
+
+    def toBytes(self) -> bytes:
+        """Packs the pose into :attr:`packedSize` bytes."""
+        return self._packer.pack(*_components(self.translation, self.rotation))
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the pose into a writable buffer at the given offset."""
+        self._packer.pack_into(
+            buffer, offset, *_components(self.translation, self.rotation)
+        )
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Pose3d":
+        """Unpacks a pose packed by :meth:`toBytes` or :meth:`packInto`."""
+        x, y, z, qw, qx, qy, qz = cls._packer.unpack_from(buffer, offset)
+        return cls(x, y, z, _from_quaternion(qw, qx, qy, qz))
+
+    def toPose2d(self) -> Pose2d:
+        """Returns the projection of the pose onto the XY plane, with the
+        rotation about the Z axis (yaw) as its heading.
+        """
+        translation = self.translation
+        return Pose2d(
+            Translation2d(translation.x, translation.y),
+            Rotation2d(self.rotation.getZ()),
+        )
+
+    def __add__(self, other: Transform3d) -> "Pose3d":
+        """Transforms the pose by the given transformation.
+
+        The translation of the transform is in the frame of the pose.
+
+        :param other: The transform to transform the pose by.
+
+        :returns: The transformed pose.
+        """
+        if not isinstance(other, Transform3d):
+            return NotImplemented
+        return Pose3d(
+            self.translation + other.translation.rotateBy(self.rotation),
+            other.rotation + self.rotation,
+        )
+
+    def __sub__(self, other: "Pose3d") -> Transform3d:
+        """Returns the Transform3d that maps the other pose to self.
+
+        :param other: The initial pose of the transformation.
+
+        :returns: The transform that maps the other pose to the current pose.
+        """
+        if not isinstance(other, Pose3d):
+            return NotImplemented
+        translation = (self.translation - other.translation).rotateBy(-other.rotation)
+        rotation = self.rotation - other.rotation
+        return Transform3d(translation, rotation)
+
+    def relativeTo(self, other: "Pose3d") -> "Pose3d":
+        """Returns the current pose relative to the other pose.
+
+        :param other: The pose that is the origin of the new coordinate
+                      frame that the current pose will be converted into.
+
+        :returns: The current pose relative to the new origin pose.
+        """
+        transform = self - other
+        return Pose3d(transform.translation, transform.rotation)
+
+    def exp(self, twist: Twist3d) -> "Pose3d":
+        """Obtain a new Pose3d from a constant velocity screw motion.
+
+        This is the 3d equivalent of :meth:`Pose2d.exp`. The twist is
+        a change in pose in the robot's coordinate frame since the
+        previous pose update.
+
+        :param twist: The change in pose in the robot's coordinate frame
+             since the previous pose update.
+
+        :returns: The new pose of the robot.
+        """
+        rx = twist.rx
+        ry = twist.ry
+        rz = twist.rz
+        _, b, c = _exp_coefficients(math.sqrt(rx * rx + ry * ry + rz * rz))
+        # V u = u + b (r x u) + c (r x (r x u))
+        translation = _screw(twist.dx, twist.dy, twist.dz, rx, ry, rz, b, c)
+        transform = Transform3d(
+            translation, Rotation3d.fromRotationVector((rx, ry, rz))
+        )
+        return self + transform
+
+    def log(self, end: "Pose3d") -> Twist3d:
+        """Returns a Twist3d that maps this pose to the end pose.
+
+        If c = a.log(b), then a.exp(c) = b.
+
+        :param end: The end pose for the transformation.
+
+        :returns: The twist that maps self to end.
+        """
+        transform = end - self
+        rx, ry, rz = transform.rotation.toRotationVector()
+        d = _log_coefficient(math.sqrt(rx * rx + ry * ry + rz * rz))
+        translation = transform.translation
+        # V^-1 t = t - (r x t) / 2 + d (r x (r x t))
+        u = _screw(translation.x, translation.y, translation.z, rx, ry, rz, -0.5, d)
+        return Twist3d(u.x, u.y, u.z, rx, ry, rz)
+
+
+def _components(translation: Translation3d, rotation: Rotation3d) -> tuple:
+    return (
+        translation.x,
+        translation.y,
+        translation.z,
+        rotation.w,
+        rotation.x,
+        rotation.y,
+        rotation.z,
+    )
+
+
+def _exp_coefficients(theta: float):
+    """Returns the coefficients a, b and c of the SE(3) exponential::
+
+        a = sin(theta) / theta
+        b = (1 - cos(theta)) / theta^2
+        c = (1 - a) / theta^2
+
+    using Taylor series for small angles, where these lose precision.
+    """
+    theta_sq = theta * theta
+    if theta < 1e-2:
+        return (
+            1 - theta_sq / 6 + theta_sq * theta_sq / 120,
+            0.5 - theta_sq / 24 + theta_sq * theta_sq / 720,
+            1 / 6 - theta_sq / 120 + theta_sq * theta_sq / 5040,
+        )
+    a = math.sin(theta) / theta
+    return a, 2 * math.sin(0.5 * theta) ** 2 / theta_sq, (1 - a) / theta_sq
+
+
+def _log_coefficient(theta: float) -> float:
+    """Returns the coefficient (1 - a / 2b) / theta^2 of the SE(3) logarithm,
+    using a Taylor series for small angles.
+    """
+    theta_sq = theta * theta
+    if theta < 1e-2:
+        return 1 / 12 + theta_sq / 720 + theta_sq * theta_sq / 30240
+    half = 0.5 * theta
+    return (1 - half / math.tan(half)) / theta_sq
+
+
+def _screw(
+    x: float, y: float, z: float, rx: float, ry: float, rz: float, b: float, c: float
+) -> Translation3d:
+    """Returns u + b (r x u) + c (r x (r x u))."""
+    cx = ry * z - rz * y
+    cy = rz * x - rx * z
+    cz = rx * y - ry * x
+    return Translation3d(
+        x + b * cx + c * (ry * cz - rz * cy),
+        y + b * cy + c * (rz * cx - rx * cz),
+        z + b * cz + c * (rx * cy - ry * cx),
+    )
@@ -0,0 +1,308 @@
+from typing import Iterable, Union, overload
+
+import numpy as np
+
+from . import Pose2dArray
+from .pose3d import Pose3d, Transform3d
+from .rotation3darray import Rotation3dArray
+from .translation3d import Translation3d
+from .translation3darray import Translation3dArray
+
+
+class Pose3dArray:
+    """An array of 3d poses.
+
+    This stores the translations and rotations of the poses as a
+    Translation3dArray and a Rotation3dArray, and performs the same
+    operations as Pose3d on every pose at once.
+
+    A pose is also a rigid transform, so a Pose3dArray can equally hold
+    a sequence of transforms, such as the camera to target transforms
+    of every detection in a frame.
+    """
+
+    __slots__ = ("translation", "rotation")
+
+    #: The NumPy dtype of packed arrays of poses, with the same
+    #: layout as :meth:`Pose3d.toBytes`.
+    dtype = np.dtype(
+        [
+            ("x", "<f8"),
+            ("y", "<f8"),
+            ("z", "<f8"),
+            ("qw", "<f8"),
+            ("qx", "<f8"),
+            ("qy", "<f8"),
+            ("qz", "<f8"),
+        ]
+    )
+
+    def __init__(self, translation: Translation3dArray, rotation: Rotation3dArray):
+        #: The translations of the poses.
+        self.translation = translation
+        #: The rotations of the poses.
+        self.rotation = rotation
+
+    @classmethod
+    def fromPoses(cls, poses: Iterable[Pose3d]) -> "Pose3dArray":
+        """Creates an array from individual poses, or transforms."""
+        components = np.array(
+            [
+                (
+                    pose.translation.x,
+                    pose.translation.y,
+                    pose.translation.z,
+                    pose.rotation.w,
+                    pose.rotation.x,
+                    pose.rotation.y,
+                    pose.rotation.z,
+                )
+                for pose in poses
+            ],
+            dtype=float,
+        ).reshape(-1, 7)
+        return cls(
+            Translation3dArray(*components[:, :3].T),
+            Rotation3dArray(*components[:, 3:].T),
+        )
+
+    @classmethod
+    def fromArray(cls, poses: np.ndarray) -> "Pose3dArray":
+        """Creates an array from an (n, 7) array of x, y, z and the w, x, y
+        and z components of the rotation quaternions, which don't have
+        to be normalised.
+        """
+        poses = np.asarray(poses, dtype=float)
+        return cls(
+            Translation3dArray.fromArray(poses[:, :3]),
+            Rotation3dArray.fromQuaternions(poses[:, 3:]),
+        )
+
+    @classmethod
+    def fromPose2dArray(cls, poses: Pose2dArray) -> "Pose3dArray":
+        """Creates an array of poses in the XY plane from 2d poses."""
+        translation = poses.translation
+        return cls(
+            Translation3dArray(
+                translation.x, translation.y, np.zeros_like(translation.x)
+            ),
+            Rotation3dArray.fromRotation2dArray(poses.rotation),
+        )
+
+    @classmethod
+    def fromTwists(cls, twists: np.ndarray) -> "Pose3dArray":
+        """Creates the transforms that each twist applies to a pose.
+
+        This is the array equivalent of ``Pose3d().exp(twist)``.
+
+        :param twists: An (n, 6) array of the dx, dy, dz, rx, ry and rz
+                       of each twist.
+        """
+        twists = np.asarray(twists, dtype=float)
+        u = twists[:, :3]
+        r = twists[:, 3:]
+        theta_sq = np.einsum("ij,ij->i", r, r)
+        theta = np.sqrt(theta_sq)
+        small = theta < 1e-2
+        safe_theta = np.where(small, 1.0, theta)
+        safe_theta_sq = np.where(small, 1.0, theta_sq)
+        b = np.where(
+            small,
+            0.5 - theta_sq / 24 + theta_sq ** 2 / 720,
+            2 * np.sin(0.5 * theta) ** 2 / safe_theta_sq,
+        )
+        c = np.where(
+            small,
+            1 / 6 - theta_sq / 120 + theta_sq ** 2 / 5040,
+            (1 - np.sin(safe_theta) / safe_theta) / safe_theta_sq,
+        )
+        return cls(
+            Translation3dArray.fromArray(_screw(u, r, b, c)),
+            Rotation3dArray.fromRotationVectors(r),
+        )
+
+    def toArray(self) -> np.ndarray:
+        """Returns the poses as an (n, 7) array of x, y, z and the w, x, y
+        and z components of the rotation quaternions.
+        """
+        translation = self.translation
+        rotation = self.rotation
+        return np.column_stack(
+            (
+                translation.x,
+                translation.y,
+                translation.z,
+                rotation.w,
+                rotation.x,
+                rotation.y,
+                rotation.z,
+            )
+        )
+
+    def toPacked(self) -> np.ndarray:
+        """Packs the poses into a structured array of :attr:`dtype`.
+
+        The result supports the buffer protocol, so it can be written
+        directly to shared memory or a socket.
+        """
+        translation = self.translation
+        rotation = self.rotation
+        packed = np.empty(len(translation), dtype=self.dtype)
+        packed["x"] = translation.x
+        packed["y"] = translation.y
+        packed["z"] = translation.z
+        packed["qw"] = rotation.w
+        packed["qx"] = rotation.x
+        packed["qy"] = rotation.y
+        packed["qz"] = rotation.z
+        return packed
+
+    @classmethod
+    def fromPacked(cls, buffer) -> "Pose3dArray":
+        """Unpacks poses from a buffer packed by :meth:`toPacked`.
+
+        The components are views of the buffer rather than copies.
+        """
+        packed = np.frombuffer(buffer, dtype=cls.dtype)
+        return cls(
+            Translation3dArray(packed["x"], packed["y"], packed["z"]),
+            Rotation3dArray(packed["qw"], packed["qx"], packed["qy"], packed["qz"]),
+        )
+
+    def toPose2dArray(self) -> Pose2dArray:
+        """Returns the projections of the poses onto the XY plane.
+
+        See :meth:`Pose3d.toPose2d`.
+        """
+        return Pose2dArray(
+            self.translation.toTranslation2dArray(), self.rotation.toRotation2dArray()
+        )
+
+    def __len__(self) -> int:
+        return len(self.translation)
+
+    @overload
+    def __getitem__(self, index: int) -> Pose3d:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "Pose3dArray":
+        ...
+
+    def __getitem__(self, index):
+        """Returns a single Pose3d, or an array for slices and index arrays."""
+        translation = self.translation[index]
+        rotation = self.rotation[index]
+        if isinstance(translation, Translation3dArray):
+            return Pose3dArray(translation, rotation)
+        return Pose3d(translation, rotation)
+
+    def __repr__(self) -> str:
+        return f"Pose3dArray({self.toArray()!r})"
+
+    def __add__(self, other: Union["Pose3dArray", Transform3d]) -> "Pose3dArray":
+        """Transforms every pose by the given transformation,
+        or element-wise by an array of transforms.
+
+        See :meth:`Pose3d.__add__`.
+        """
+        if not isinstance(other, (Pose3dArray, Transform3d)):
+            return NotImplemented
+        rotation = self.rotation
+        translation = other.translation
+        if isinstance(translation, Translation3d):
+            # Broadcast the single translation against the rotations.
+            translation = Translation3dArray(
+                translation.x, translation.y, translation.z
+            )
+        return Pose3dArray(
+            self.translation + translation.rotateBy(rotation),
+            other.rotation + rotation,
+        )
+
+    def __radd__(self, other: Pose3d) -> "Pose3dArray":
+        """Transforms a single pose by every transform in the array."""
+        if not isinstance(other, Pose3d):
+            return NotImplemented
+        rotation = other.rotation
+        return Pose3dArray(
+            self.translation.rotateBy(rotation) + other.translation,
+            self.rotation + rotation,
+        )
+
+    def __sub__(self, other: Union["Pose3dArray", Pose3d]) -> "Pose3dArray":
+        """Returns the transforms that map the other poses to these poses
+        element-wise, or that map a single pose to each of these poses.
+
+        See :meth:`Pose3d.__sub__`.
+        """
+        if not isinstance(other, (Pose3dArray, Pose3d)):
+            return NotImplemented
+        inverse = -other.rotation
+        return Pose3dArray(
+            (self.translation - other.translation).rotateBy(inverse),
+            self.rotation - other.rotation,
+        )
+
+    def relativeTo(self, other: Union["Pose3dArray", Pose3d]) -> "Pose3dArray":
+        """Returns these poses relative to the other poses element-wise,
+        or relative to a single pose.
+
+        See :meth:`Pose3d.relativeTo`.
+        """
+        return self - other
+
+    def inverse(self) -> "Pose3dArray":
+        """Returns the inverse of every transform.
+
+        See :meth:`Transform3d.inverse`.
+        """
+        rotation = -self.rotation
+        return Pose3dArray(-self.translation.rotateBy(rotation), rotation)
+
+    def exp(self, twists: np.ndarray) -> "Pose3dArray":
+        """Applies a twist to every pose element-wise.
+
+        See :meth:`Pose3d.exp`.
+
+        :param twists: An (n, 6) array of the dx, dy, dz, rx, ry and rz
+                       of each twist.
+        """
+        return self + Pose3dArray.fromTwists(twists)
+
+    def log(self, end: Union["Pose3dArray", Pose3d]) -> np.ndarray:
+        """Returns the twists that map each pose to the corresponding end pose.
+
+        See :meth:`Pose3d.log`.
+
+        :returns: An (n, 6) array of the dx, dy, dz, rx, ry and rz
+                  of each twist.
+        """
+        if isinstance(end, Pose3d):
+            end = Pose3dArray.fromPoses([end])
+        transforms = end - self
+        r = transforms.rotation.toRotationVectors()
+        theta_sq = np.einsum("ij,ij->i", r, r)
+        small = theta_sq < 1e-4
+        safe_theta_sq = np.where(small, 1.0, theta_sq)
+        safe_half = 0.5 * np.sqrt(safe_theta_sq)
+        d = np.where(
+            small,
+            1 / 12 + theta_sq / 720 + theta_sq ** 2 / 30240,
+            (1 - safe_half / np.tan(safe_half)) / safe_theta_sq,
+        )
+        u = _screw(transforms.translation.toArray(), r, -0.5, d)
+        return np.column_stack((u, r))
+
+
+def _screw(
+    u: np.ndarray,
+    r: np.ndarray,
+    b: Union[float, np.ndarray],
+    c: Union[float, np.ndarray],
+) -> np.ndarray:
+    """Returns u + b (r x u) + c (r x (r x u)) for each row."""
+    cross = np.cross(r, u)
+    return (
+        u + np.reshape(b, (-1, 1)) * cross + np.reshape(c, (-1, 1)) * np.cross(r, cross)
+    )
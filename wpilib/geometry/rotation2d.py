@@ -1,6 +1,12 @@
 import math
+import struct
 from dataclasses import dataclass
-from typing import overload
+from typing import Optional, overload
+
+from .tolerance import _quantize
+
+#: The interned zero rotation, set once the class is defined.
+_zero_rotation: Optional["Rotation2d"] = None
 
 
 @dataclass(frozen=True)
@@ -16,6 +22,16 @@ class Rotation2d:
 
     __slots__ = ("value", "cos", "sin")
 
+    #: The binary layout of a packed rotation: its value in radians.
+    _packer = struct.Struct("<d")
+    #: The size of a packed rotation in bytes.
+    packedSize = _packer.size
+
+    def __new__(cls, *args: float) -> "Rotation2d":
+        if not args and _zero_rotation is not None and cls is Rotation2d:
+            return _zero_rotation
+        return object.__new__(cls)
+
     @overload
     def __init__(self, __value: float = 0):
         """Constructs a Rotation2d with the given radian value."""
@@ -41,7 +57,11 @@ class Rotation2d:
 
         In this case the x and y do not need to be normalised.
 
+        Calling this with no arguments returns a shared zero rotation.
         """
+        if self is _zero_rotation:
+            return
+
         value: float
         cos: float
         sin: float
@@ -71,16 +91,45 @@ class Rotation2d:
 
     @classmethod
     def fromDegrees(cls, degrees: float) -> "Rotation2d":
-        """Creates a Rotation2d with the given degrees value."""
+        """Creates a Rotation2d with the given degrees value.
+
+        Multiples of 90 degrees return shared instances.
+        """
+        if cls is Rotation2d:
+            interned = _cardinal_rotations.get(degrees)
+            if interned is not None:
+                return interned
         return cls(math.radians(degrees))
 
     def __repr__(self) -> str:
         return f"Rotation2d({self.value})"
 
+    def __reduce__(self):
+        return _reconstruct_rotation, (self.value, self.cos, self.sin)
+
+    def toBytes(self) -> bytes:
+        """Packs the rotation into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.value)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the rotation into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, self.value)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Rotation2d":
+        """Unpacks a rotation packed by :meth:`toBytes` or :meth:`packInto`."""
+        (value,) = cls._packer.unpack_from(buffer, offset)
+        return cls(value)
+
     def __add__(self, other: "Rotation2d") -> "Rotation2d":
         """Adds two rotations together, with the result bounded between -pi and pi."""
         if not isinstance(other, Rotation2d):
             return NotImplemented
+        # Adding zero is free, unless the result would need wrapping.
+        if other is _zero_rotation and -math.pi <= self.value <= math.pi:
+            return self
+        if self is _zero_rotation and -math.pi <= other.value <= math.pi:
+            return other
         cos_a = self.cos
         cos_b = other.cos
         sin_a = self.sin
@@ -91,14 +140,24 @@ class Rotation2d:
         """Subtracts the other rotation from self."""
         if not isinstance(other, Rotation2d):
             return NotImplemented
-        return self + -other
+        if other is _zero_rotation and -math.pi <= self.value <= math.pi:
+            return self
+        cos_a = self.cos
+        cos_b = other.cos
+        sin_a = self.sin
+        sin_b = other.sin
+        return Rotation2d(cos_a * cos_b + sin_a * sin_b, sin_a * cos_b - cos_a * sin_b)
 
     def __neg__(self) -> "Rotation2d":
         """Takes the inverse of the current rotation.
 
         This is simply the negative of the current angular value.
         """
-        return Rotation2d(-self.value)
+        value = -self.value
+        interned = _interned_rotations.get(value)
+        if interned is not None:
+            return interned
+        return _reconstruct_rotation(value, self.cos, -self.sin)
 
     def __mul__(self, other: float) -> "Rotation2d":
         """Multiplies the current rotation by a scalar."""
@@ -113,6 +172,12 @@ class Rotation2d:
             return NotImplemented
         return math.isclose(self.value, other.value)
 
+    def _key(self) -> tuple:
+        """Returns the value rounded to the geometry tolerance, to look up
+        memoized results by.
+        """
+        return (_quantize(self.value),)
+
     def getRadians(self) -> float:
         """Returns the value of the rotation in radians."""
         return self.value
@@ -124,3 +189,28 @@ class Rotation2d:
     def tan(self) -> float:
         """Returns the tangent of the rotation."""
         return self.sin / self.cos
+
+
+def _reconstruct_rotation(value: float, cos: float, sin: float) -> Rotation2d:
+    """Creates a Rotation2d from its components without renormalising it."""
+    if value == 0 and cos == 1:
+        return _zero_rotation
+    rotation = object.__new__(Rotation2d)
+    object.__setattr__(rotation, "value", value)
+    object.__setattr__(rotation, "cos", cos)
+    object.__setattr__(rotation, "sin", sin)
+    return rotation
+
+
+_zero_rotation = Rotation2d()
+
+#: Shared instances of the cardinal angles, keyed by degrees.
+_cardinal_rotations = {
+    degrees: Rotation2d(math.radians(degrees)) for degrees in (90, 180, -90, -180)
+}
+_cardinal_rotations[0] = _zero_rotation
+
+#: Shared instances of the cardinal angles, keyed by radians.
+_interned_rotations = {
+    rotation.value: rotation for rotation in _cardinal_rotations.values()
+}
@@ -0,0 +1,210 @@
+from typing import Iterable, Optional, Union, overload
+
+import numpy as np
+
+from .rotation2d import Rotation2d, _reconstruct_rotation
+
+
+class Rotation2dArray:
+    """An array of rotations in a 2d coordinate frame.
+
+    This stores the cosines and sines of the rotations in parallel NumPy
+    arrays, and performs the same operations as Rotation2d on every
+    rotation at once.
+
+    Like Rotation2d, rotations created from radian values keep those values,
+    even outside of -pi to pi, until they are added or subtracted.
+    """
+
+    __slots__ = ("cos", "sin", "_radians")
+
+    #: The NumPy dtype of packed arrays of rotations, with the same
+    #: layout as :meth:`Rotation2d.toBytes`.
+    dtype = np.dtype([("value", "<f8")])
+
+    def __init__(
+        self, cos: np.ndarray, sin: np.ndarray, radians: Optional[np.ndarray] = None
+    ):
+        """Constructs an array of rotations from their cosines and sines.
+
+        The cosines and sines must already be normalised.
+        Use :meth:`fromComponents` if they are not.
+
+        :param radians: The angles of the rotations in radians, if known.
+            Otherwise the angles are between -pi and pi.
+        """
+        #: The cosines of the rotations.
+        self.cos = np.asarray(cos, dtype=float)
+        #: The sines of the rotations.
+        self.sin = np.asarray(sin, dtype=float)
+        self._radians = radians
+
+    @classmethod
+    def fromRadians(cls, values: np.ndarray) -> "Rotation2dArray":
+        """Creates an array of rotations from radian values."""
+        values = np.asarray(values, dtype=float)
+        return cls(np.cos(values), np.sin(values), values)
+
+    @classmethod
+    def fromDegrees(cls, values: np.ndarray) -> "Rotation2dArray":
+        """Creates an array of rotations from degree values."""
+        return cls.fromRadians(np.radians(values))
+
+    @classmethod
+    def fromComponents(cls, x: np.ndarray, y: np.ndarray) -> "Rotation2dArray":
+        """Creates an array of rotations from x and y components,
+        which don't have to be normalised.
+
+        As with Rotation2d, components too close to zero give a zero rotation.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        magnitude = np.hypot(x, y)
+        valid = magnitude > 1e-6
+        cos = np.ones_like(magnitude)
+        sin = np.zeros_like(magnitude)
+        np.divide(x, magnitude, out=cos, where=valid)
+        np.divide(y, magnitude, out=sin, where=valid)
+        return cls(cos, sin)
+
+    @classmethod
+    def fromRotations(cls, rotations: Iterable[Rotation2d]) -> "Rotation2dArray":
+        """Creates an array from individual rotations."""
+        components = np.array(
+            [(rotation.cos, rotation.sin, rotation.value) for rotation in rotations],
+            dtype=float,
+        ).reshape(-1, 3)
+        return cls(components[:, 0], components[:, 1], components[:, 2])
+
+    def toPacked(self) -> np.ndarray:
+        """Packs the rotations into a structured array of :attr:`dtype`.
+
+        The result supports the buffer protocol, so it can be written
+        directly to shared memory or a socket.
+        """
+        packed = np.empty(len(self.cos), dtype=self.dtype)
+        packed["value"] = self.getRadians()
+        return packed
+
+    @classmethod
+    def fromPacked(cls, buffer) -> "Rotation2dArray":
+        """Unpacks rotations from a buffer packed by :meth:`toPacked`."""
+        return cls.fromRadians(np.frombuffer(buffer, dtype=cls.dtype)["value"])
+
+    def __len__(self) -> int:
+        return len(self.cos)
+
+    @overload
+    def __getitem__(self, index: int) -> Rotation2d:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "Rotation2dArray":
+        ...
+
+    def __getitem__(self, index):
+        """Returns a single Rotation2d, or an array for slices and index arrays."""
+        cos = self.cos[index]
+        sin = self.sin[index]
+        radians = self._radians
+        if radians is not None:
+            radians = radians[index]
+        if np.ndim(cos) == 0:
+            cos = float(cos)
+            sin = float(sin)
+            if radians is None:
+                radians = np.arctan2(sin, cos)
+            return _reconstruct_rotation(float(radians), cos, sin)
+        return Rotation2dArray(cos, sin, radians)
+
+    def __repr__(self) -> str:
+        return f"Rotation2dArray({self.getRadians()!r})"
+
+    def __add__(self, other: Union["Rotation2dArray", Rotation2d]) -> "Rotation2dArray":
+        """Adds rotations element-wise, or adds a single rotation to all."""
+        if not isinstance(other, (Rotation2dArray, Rotation2d)):
+            return NotImplemented
+        cos_a = self.cos
+        cos_b = other.cos
+        sin_a = self.sin
+        sin_b = other.sin
+        return Rotation2dArray(
+            cos_a * cos_b - sin_a * sin_b, cos_a * sin_b + sin_a * cos_b
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union["Rotation2dArray", Rotation2d]) -> "Rotation2dArray":
+        """Subtracts rotations element-wise, or subtracts a single rotation."""
+        if not isinstance(other, (Rotation2dArray, Rotation2d)):
+            return NotImplemented
+        cos_a = self.cos
+        cos_b = other.cos
+        sin_a = self.sin
+        sin_b = other.sin
+        return Rotation2dArray(
+            cos_a * cos_b + sin_a * sin_b, sin_a * cos_b - cos_a * sin_b
+        )
+
+    def __rsub__(self, other: Rotation2d) -> "Rotation2dArray":
+        """Subtracts each rotation from a single rotation."""
+        if not isinstance(other, Rotation2d):
+            return NotImplemented
+        return -self + other
+
+    def __neg__(self) -> "Rotation2dArray":
+        """Takes the inverse of each rotation."""
+        radians = self._radians
+        return Rotation2dArray(
+            self.cos.copy(), -self.sin, None if radians is None else -radians
+        )
+
+    def __mul__(self, other: Union[float, np.ndarray]) -> "Rotation2dArray":
+        """Multiplies each angle by a scalar, or element-wise by an array."""
+        if not isinstance(other, (float, int, np.ndarray)):
+            return NotImplemented
+        return Rotation2dArray.fromRadians(self.getRadians() * other)
+
+    __rmul__ = __mul__
+
+    def interpolate(
+        self, end: Union["Rotation2dArray", Rotation2d], t: Union[float, np.ndarray]
+    ) -> "Rotation2dArray":
+        """Interpolates from these rotations towards the end rotations
+        along the shortest path.
+
+        :param end: The rotations at t = 1.
+        :param t: The interpolation parameter, either a scalar or an array.
+        """
+        return self + (end - self) * t
+
+    def getRadians(self) -> np.ndarray:
+        """Returns the angles in radians.
+
+        These are the values the rotations were created from, or between
+        -pi and pi if they are not known, as for the sum of rotations.
+        """
+        radians = self._radians
+        if radians is None:
+            return np.arctan2(self.sin, self.cos)
+        return radians
+
+    def getDegrees(self) -> np.ndarray:
+        """Returns the angles in degrees, as for :meth:`getRadians`."""
+        return np.degrees(self.getRadians())
+
+    def getUnwrappedRadians(self) -> np.ndarray:
+        """Returns the angles in radians as a continuous heading.
+
+        Consecutive angles never differ by more than pi, so that for a
+        sequence of gyro readings the total heading change is preserved.
+        """
+        return np.unwrap(self.getRadians())
+
+    def diff(self) -> "Rotation2dArray":
+        """Returns the differences between consecutive rotations."""
+        return self[1:] - self[:-1]
+
+    def tan(self) -> np.ndarray:
+        """Returns the tangents of the rotations."""
+        return self.sin / self.cos
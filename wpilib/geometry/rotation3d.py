@@ -0,0 +1,317 @@
+import math
+import struct
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .rotation2d import Rotation2d
+from .tolerance import _quantize
+
+
+@dataclass(frozen=True)
+class Rotation3d:
+    """A rotation in a 3d coordinate frame, stored as a unit quaternion.
+
+    The rotation matrix is computed when it is first needed, and cached.
+    """
+
+    #: The real component of the quaternion.
+    w: float
+    #: The i component of the quaternion.
+    x: float
+    #: The j component of the quaternion.
+    y: float
+    #: The k component of the quaternion.
+    z: float
+
+    __slots__ = ("w", "x", "y", "z", "_matrix")
+
+    #: The binary layout of a packed rotation: its quaternion w, x, y and z.
+    _packer = struct.Struct("<4d")
+    #: The size of a packed rotation in bytes.
+    packedSize = _packer.size
+
+    def __init__(self, roll: float = 0, pitch: float = 0, yaw: float = 0):
+        """Constructs a rotation from roll, pitch and yaw angles in radians.
+
+        The rotation is a roll about the X axis, then a pitch about the
+        Y axis, then a yaw about the Z axis, each about the fixed axes.
+
+        :param roll: The counterclockwise rotation about the X axis.
+        :param pitch: The counterclockwise rotation about the Y axis.
+        :param yaw: The counterclockwise rotation about the Z axis.
+        """
+        cr = math.cos(roll * 0.5)
+        sr = math.sin(roll * 0.5)
+        cp = math.cos(pitch * 0.5)
+        sp = math.sin(pitch * 0.5)
+        cy = math.cos(yaw * 0.5)
+        sy = math.sin(yaw * 0.5)
+        _set_quaternion(
+            self,
+            cr * cp * cy + sr * sp * sy,
+            sr * cp * cy - cr * sp * sy,
+            cr * sp * cy + sr * cp * sy,
+            cr * cp * sy - sr * sp * cy,
+        )
+
+    @classmethod
+    def fromQuaternion(cls, w: float, x: float, y: float, z: float) -> "Rotation3d":
+        """Creates a rotation from a quaternion, which doesn't have to be
+        normalised.
+        """
+        norm = math.sqrt(w * w + x * x + y * y + z * z)
+        assert norm > 1e-9, "The quaternion must not be zero"
+        return _from_quaternion(w / norm, x / norm, y / norm, z / norm)
+
+    @classmethod
+    def fromAxisAngle(cls, axis: Sequence[float], angle: float) -> "Rotation3d":
+        """Creates a counterclockwise rotation about an axis.
+
+        :param axis: The x, y and z components of the axis, which doesn't
+                     have to be normalised.
+        :param angle: The angle to rotate by in radians.
+        """
+        ax, ay, az = axis
+        norm = math.sqrt(ax * ax + ay * ay + az * az)
+        assert norm > 1e-9, "The axis must not be zero"
+        scale = math.sin(angle * 0.5) / norm
+        return _from_quaternion(
+            math.cos(angle * 0.5), ax * scale, ay * scale, az * scale
+        )
+
+    @classmethod
+    def fromRotationVector(cls, vector: Sequence[float]) -> "Rotation3d":
+        """Creates a rotation from a rotation vector, whose direction is the
+        axis of the rotation and whose norm is the angle in radians.
+
+        This is the format of rotations returned by OpenCV's solvePnP.
+        """
+        rx, ry, rz = vector
+        theta = math.sqrt(rx * rx + ry * ry + rz * rz)
+        if theta < 1e-9:
+            scale = 0.5 - theta * theta / 48
+        else:
+            scale = math.sin(theta * 0.5) / theta
+        return _from_quaternion(
+            math.cos(theta * 0.5), rx * scale, ry * scale, rz * scale
+        )
+
+    @classmethod
+    def fromMatrix(cls, matrix: np.ndarray) -> "Rotation3d":
+        """Creates a rotation from a 3x3 rotation matrix."""
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = np.asarray(
+            matrix, dtype=float
+        ).tolist()
+        trace = m00 + m11 + m22
+        # Divide by the largest component of the quaternion, for precision.
+        if trace > 0:
+            s = 0.5 / math.sqrt(trace + 1)
+            w, x, y, z = 0.25 / s, (m21 - m12) * s, (m02 - m20) * s, (m10 - m01) * s
+        elif m00 > m11 and m00 > m22:
+            s = 2 * math.sqrt(1 + m00 - m11 - m22)
+            w, x, y, z = (m21 - m12) / s, 0.25 * s, (m01 + m10) / s, (m02 + m20) / s
+        elif m11 > m22:
+            s = 2 * math.sqrt(1 + m11 - m00 - m22)
+            w, x, y, z = (m02 - m20) / s, (m01 + m10) / s, 0.25 * s, (m12 + m21) / s
+        else:
+            s = 2 * math.sqrt(1 + m22 - m00 - m11)
+            w, x, y, z = (m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, 0.25 * s
+        return cls.fromQuaternion(w, x, y, z)
+
+    @classmethod
+    def fromRotation2d(cls, rotation: Rotation2d) -> "Rotation3d":
+        """Creates a rotation about the Z axis from a 2d rotation."""
+        half = rotation.value * 0.5
+        return _from_quaternion(math.cos(half), 0.0, 0.0, math.sin(half))
+
+    def __repr__(self) -> str:
+        return f"Rotation3d.fromQuaternion({self.w}, {self.x}, {self.y}, {self.z})"
+
+    def __reduce__(self):
+        return _from_quaternion, (self.w, self.x, self.y, self.z)
+
+    def toBytes(self) -> bytes:
+        """Packs the rotation into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.w, self.x, self.y, self.z)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the rotation into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, self.w, self.x, self.y, self.z)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Rotation3d":
+        """Unpacks a rotation packed by :meth:`toBytes` or :meth:`packInto`."""
+        return _from_quaternion(*cls._packer.unpack_from(buffer, offset))
+
+    def __add__(self, other: "Rotation3d") -> "Rotation3d":
+        """Applies the other rotation after this one, about the fixed axes."""
+        if not isinstance(other, Rotation3d):
+            return NotImplemented
+        return _multiply(other, self)
+
+    def __sub__(self, other: "Rotation3d") -> "Rotation3d":
+        """Returns the rotation that, followed by the other rotation,
+        gives this one, so that ``(self - other) + other == self``.
+        """
+        if not isinstance(other, Rotation3d):
+            return NotImplemented
+        return self + -other
+
+    def __neg__(self) -> "Rotation3d":
+        """Returns the inverse of the rotation."""
+        return _from_quaternion(self.w, -self.x, -self.y, -self.z)
+
+    def __mul__(self, other: float) -> "Rotation3d":
+        """Scales the angle of the rotation, keeping its axis."""
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        rx, ry, rz = self.toRotationVector()
+        return Rotation3d.fromRotationVector((rx * other, ry * other, rz * other))
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: "Rotation3d") -> bool:
+        """Compares the quaternions of the rotations to within 1e-9, so that
+        quaternions of opposite signs are equal.
+        """
+        if not isinstance(other, Rotation3d):
+            return NotImplemented
+        q = (self.w, self.x, self.y, self.z)
+        p = (other.w, other.x, other.y, other.z)
+        return all(map(_isclose, q, p)) or all(map(_isclose, q, (-c for c in p)))
+
+    def __hash__(self) -> int:
+        return hash(_normalize_sign((self.w, self.x, self.y, self.z)))
+
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, with
+        the sign of the quaternion chosen so that q and -q are the same,
+        to look up memoized results by.
+        """
+        return _normalize_sign(
+            (_quantize(self.w), _quantize(self.x), _quantize(self.y), _quantize(self.z))
+        )
+
+    def toRotationVector(self) -> Tuple[float, float, float]:
+        """Returns the rotation vector, whose direction is the axis of the
+        rotation and whose norm is the angle in radians, from 0 to pi.
+        """
+        w = self.w
+        x = self.x
+        y = self.y
+        z = self.z
+        if w < 0:
+            w, x, y, z = -w, -x, -y, -z
+        norm = math.sqrt(x * x + y * y + z * z)
+        if norm < 1e-9:
+            scale = 2 / w
+        else:
+            scale = 2 * math.atan2(norm, w) / norm
+        return x * scale, y * scale, z * scale
+
+    def getAngle(self) -> float:
+        """Returns the angle of the rotation about its axis in radians,
+        from 0 to pi.
+        """
+        norm = math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+        return 2 * math.atan2(norm, abs(self.w))
+
+    def getX(self) -> float:
+        """Returns the counterclockwise rotation about the X axis (roll)."""
+        w = self.w
+        x = self.x
+        y = self.y
+        z = self.z
+        return math.atan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+
+    def getY(self) -> float:
+        """Returns the counterclockwise rotation about the Y axis (pitch)."""
+        ratio = 2 * (self.w * self.y - self.z * self.x)
+        ratio = min(max(ratio, -1.0), 1.0)
+        # More precise than asin near +-90 degrees.
+        return 2 * math.atan2(math.sqrt(1 + ratio), math.sqrt(1 - ratio)) - math.pi / 2
+
+    def getZ(self) -> float:
+        """Returns the counterclockwise rotation about the Z axis (yaw)."""
+        w = self.w
+        x = self.x
+        y = self.y
+        z = self.z
+        return math.atan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z))
+
+    def toRotation2d(self) -> Rotation2d:
+        """Returns the rotation about the Z axis (yaw) as a 2d rotation."""
+        return Rotation2d(self.getZ())
+
+    def toMatrix(self) -> np.ndarray:
+        """Returns the 3x3 rotation matrix.
+
+        The matrix is cached, and is read-only.
+        """
+        matrix = self._matrix
+        if matrix is None:
+            matrix = _quaternion_matrix(self.w, self.x, self.y, self.z)
+            matrix.flags.writeable = False
+            object.__setattr__(self, "_matrix", matrix)
+        return matrix
+
+
+def _isclose(a: float, b: float) -> bool:
+    """Compares components of 3d geometry to within 1e-9, as WPILib does."""
+    return math.isclose(a, b, abs_tol=1e-9)
+
+
+def _normalize_sign(components: tuple) -> tuple:
+    """Negates quaternion components if their first nonzero one is negative."""
+    for component in components:
+        if component:
+            if component < 0:
+                return tuple(-component for component in components)
+            break
+    return components
+
+
+def _set_quaternion(rotation: Rotation3d, w: float, x: float, y: float, z: float):
+    object.__setattr__(rotation, "w", w)
+    object.__setattr__(rotation, "x", x)
+    object.__setattr__(rotation, "y", y)
+    object.__setattr__(rotation, "z", z)
+    object.__setattr__(rotation, "_matrix", None)
+
+
+def _from_quaternion(w: float, x: float, y: float, z: float) -> Rotation3d:
+    """Creates a Rotation3d from a unit quaternion without renormalising it."""
+    rotation = object.__new__(Rotation3d)
+    _set_quaternion(rotation, w, x, y, z)
+    return rotation
+
+
+def _multiply(a: Rotation3d, b: Rotation3d) -> Rotation3d:
+    """Returns the rotation of the quaternion product a * b, renormalised."""
+    aw = a.w
+    ax = a.x
+    ay = a.y
+    az = a.z
+    bw = b.w
+    bx = b.x
+    by = b.y
+    bz = b.z
+    return Rotation3d.fromQuaternion(
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    )
+
+
+def _quaternion_matrix(w: float, x: float, y: float, z: float) -> np.ndarray:
+    """Returns the rotation matrix of a unit quaternion."""
+    return np.array(
+        [
+            (1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)),
+            (2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)),
+            (2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)),
+        ]
+    )
@@ -0,0 +1,278 @@
+from typing import Iterable, Union, overload
+
+import numpy as np
+
+from .rotation2darray import Rotation2dArray
+from .rotation3d import Rotation3d, _from_quaternion
+
+
+class Rotation3dArray:
+    """An array of rotations in a 3d coordinate frame.
+
+    This stores the components of the unit quaternions of the rotations in
+    parallel NumPy arrays, and performs the same operations as Rotation3d
+    on every rotation at once.
+    """
+
+    __slots__ = ("w", "x", "y", "z")
+
+    #: The NumPy dtype of packed arrays of rotations, with the same
+    #: layout as :meth:`Rotation3d.toBytes`.
+    dtype = np.dtype([("w", "<f8"), ("x", "<f8"), ("y", "<f8"), ("z", "<f8")])
+
+    def __init__(self, w: np.ndarray, x: np.ndarray, y: np.ndarray, z: np.ndarray):
+        """Constructs an array of rotations from the components of their
+        quaternions.
+
+        The quaternions must already be normalised.
+        Use :meth:`fromQuaternions` if they are not.
+        """
+        #: The real components of the quaternions.
+        self.w = np.asarray(w, dtype=float)
+        #: The i components of the quaternions.
+        self.x = np.asarray(x, dtype=float)
+        #: The j components of the quaternions.
+        self.y = np.asarray(y, dtype=float)
+        #: The k components of the quaternions.
+        self.z = np.asarray(z, dtype=float)
+
+    @classmethod
+    def fromQuaternions(cls, quaternions: np.ndarray) -> "Rotation3dArray":
+        """Creates an array of rotations from an (n, 4) array of the w, x,
+        y and z components of quaternions, which don't have to be normalised.
+        """
+        quaternions = np.asarray(quaternions, dtype=float)
+        norm = np.sqrt(np.einsum("ij,ij->i", quaternions, quaternions))
+        assert np.all(norm > 1e-9), "The quaternions must not be zero"
+        w, x, y, z = (quaternions / norm[:, np.newaxis]).T
+        return cls(w, x, y, z)
+
+    @classmethod
+    def fromEulerAngles(
+        cls, roll: np.ndarray, pitch: np.ndarray, yaw: np.ndarray
+    ) -> "Rotation3dArray":
+        """Creates an array of rotations from roll, pitch and yaw angles
+        in radians.
+
+        See :class:`Rotation3d`.
+        """
+        half_roll = 0.5 * np.asarray(roll, dtype=float)
+        half_pitch = 0.5 * np.asarray(pitch, dtype=float)
+        half_yaw = 0.5 * np.asarray(yaw, dtype=float)
+        cr = np.cos(half_roll)
+        sr = np.sin(half_roll)
+        cp = np.cos(half_pitch)
+        sp = np.sin(half_pitch)
+        cy = np.cos(half_yaw)
+        sy = np.sin(half_yaw)
+        return cls(
+            cr * cp * cy + sr * sp * sy,
+            sr * cp * cy - cr * sp * sy,
+            cr * sp * cy + sr * cp * sy,
+            cr * cp * sy - sr * sp * cy,
+        )
+
+    @classmethod
+    def fromRotationVectors(cls, vectors: np.ndarray) -> "Rotation3dArray":
+        """Creates an array of rotations from an (n, 3) array of rotation
+        vectors.
+
+        See :meth:`Rotation3d.fromRotationVector`.
+        """
+        vectors = np.asarray(vectors, dtype=float)
+        theta = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+        small = theta < 1e-9
+        safe_theta = np.where(small, 1.0, theta)
+        scale = np.where(small, 0.5 - theta ** 2 / 48, np.sin(0.5 * theta) / safe_theta)
+        x, y, z = (vectors * scale[:, np.newaxis]).T
+        return cls(np.cos(0.5 * theta), x, y, z)
+
+    @classmethod
+    def fromRotation2dArray(cls, rotations: Rotation2dArray) -> "Rotation3dArray":
+        """Creates an array of rotations about the Z axis from 2d rotations."""
+        half = 0.5 * rotations.getRadians()
+        zeros = np.zeros_like(half)
+        return cls(np.cos(half), zeros, zeros.copy(), np.sin(half))
+
+    @classmethod
+    def fromRotations(cls, rotations: Iterable[Rotation3d]) -> "Rotation3dArray":
+        """Creates an array from individual rotations."""
+        components = np.array(
+            [
+                (rotation.w, rotation.x, rotation.y, rotation.z)
+                for rotation in rotations
+            ],
+            dtype=float,
+        ).reshape(-1, 4)
+        return cls(*components.T)
+
+    def toQuaternions(self) -> np.ndarray:
+        """Returns the rotations as an (n, 4) array of the w, x, y and z
+        components of their quaternions.
+        """
+        return np.column_stack((self.w, self.x, self.y, self.z))
+
+    def toPacked(self) -> np.ndarray:
+        """Packs the rotations into a structured array of :attr:`dtype`.
+
+        The result supports the buffer protocol, so it can be written
+        directly to shared memory or a socket.
+        """
+        packed = np.empty(len(self.w), dtype=self.dtype)
+        packed["w"] = self.w
+        packed["x"] = self.x
+        packed["y"] = self.y
+        packed["z"] = self.z
+        return packed
+
+    @classmethod
+    def fromPacked(cls, buffer) -> "Rotation3dArray":
+        """Unpacks rotations from a buffer packed by :meth:`toPacked`.
+
+        The components are views of the buffer rather than copies.
+        """
+        packed = np.frombuffer(buffer, dtype=cls.dtype)
+        return cls(packed["w"], packed["x"], packed["y"], packed["z"])
+
+    def __len__(self) -> int:
+        return len(self.w)
+
+    @overload
+    def __getitem__(self, index: int) -> Rotation3d:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "Rotation3dArray":
+        ...
+
+    def __getitem__(self, index):
+        """Returns a single Rotation3d, or an array for slices and index arrays."""
+        w = self.w[index]
+        x = self.x[index]
+        y = self.y[index]
+        z = self.z[index]
+        if np.ndim(w) == 0:
+            return _from_quaternion(float(w), float(x), float(y), float(z))
+        return Rotation3dArray(w, x, y, z)
+
+    def __repr__(self) -> str:
+        return f"Rotation3dArray({self.toQuaternions()!r})"
+
+    def __add__(self, other: Union["Rotation3dArray", Rotation3d]) -> "Rotation3dArray":
+        """Applies the other rotations after these element-wise, or a single
+        rotation after all of them.
+
+        See :meth:`Rotation3d.__add__`.
+        """
+        if not isinstance(other, (Rotation3dArray, Rotation3d)):
+            return NotImplemented
+        return _multiply(other, self)
+
+    def __radd__(self, other: Rotation3d) -> "Rotation3dArray":
+        """Applies each rotation after a single rotation."""
+        if not isinstance(other, Rotation3d):
+            return NotImplemented
+        return _multiply(self, other)
+
+    def __sub__(self, other: Union["Rotation3dArray", Rotation3d]) -> "Rotation3dArray":
+        """Subtracts rotations element-wise, or subtracts a single rotation.
+
+        See :meth:`Rotation3d.__sub__`.
+        """
+        if not isinstance(other, (Rotation3dArray, Rotation3d)):
+            return NotImplemented
+        return _multiply(-other, self)
+
+    def __rsub__(self, other: Rotation3d) -> "Rotation3dArray":
+        """Subtracts each rotation from a single rotation."""
+        if not isinstance(other, Rotation3d):
+            return NotImplemented
+        return _multiply(-self, other)
+
+    def __neg__(self) -> "Rotation3dArray":
+        """Takes the inverse of each rotation."""
+        return Rotation3dArray(self.w.copy(), -self.x, -self.y, -self.z)
+
+    def toRotationVectors(self) -> np.ndarray:
+        """Returns an (n, 3) array of the rotation vectors of the rotations.
+
+        See :meth:`Rotation3d.toRotationVector`.
+        """
+        sign = np.where(self.w < 0, -1.0, 1.0)
+        w = sign * self.w
+        vectors = np.column_stack((self.x, self.y, self.z)) * sign[:, np.newaxis]
+        norm = np.sqrt(np.einsum("ij,ij->i", vectors, vectors))
+        small = norm < 1e-9
+        safe_norm = np.where(small, 1.0, norm)
+        scale = np.where(small, 2 / w, 2 * np.arctan2(norm, w) / safe_norm)
+        return vectors * scale[:, np.newaxis]
+
+    def getAngle(self) -> np.ndarray:
+        """Returns the angles of the rotations about their axes in radians,
+        from 0 to pi.
+        """
+        norm = np.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+        return 2 * np.arctan2(norm, np.abs(self.w))
+
+    def getX(self) -> np.ndarray:
+        """Returns the counterclockwise rotations about the X axis (roll)."""
+        w = self.w
+        x = self.x
+        y = self.y
+        z = self.z
+        return np.arctan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+
+    def getY(self) -> np.ndarray:
+        """Returns the counterclockwise rotations about the Y axis (pitch)."""
+        ratio = np.clip(2 * (self.w * self.y - self.z * self.x), -1.0, 1.0)
+        return 2 * np.arctan2(np.sqrt(1 + ratio), np.sqrt(1 - ratio)) - np.pi / 2
+
+    def getZ(self) -> np.ndarray:
+        """Returns the counterclockwise rotations about the Z axis (yaw)."""
+        w = self.w
+        x = self.x
+        y = self.y
+        z = self.z
+        return np.arctan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z))
+
+    def toRotation2dArray(self) -> Rotation2dArray:
+        """Returns the rotations about the Z axis (yaw) as 2d rotations."""
+        return Rotation2dArray.fromRadians(self.getZ())
+
+    def toMatrices(self) -> np.ndarray:
+        """Returns an (n, 3, 3) array of the rotation matrices."""
+        w = self.w
+        x = self.x
+        y = self.y
+        z = self.z
+        matrices = np.empty((len(w), 3, 3))
+        matrices[:, 0, 0] = 1 - 2 * (y * y + z * z)
+        matrices[:, 0, 1] = 2 * (x * y - w * z)
+        matrices[:, 0, 2] = 2 * (x * z + w * y)
+        matrices[:, 1, 0] = 2 * (x * y + w * z)
+        matrices[:, 1, 1] = 1 - 2 * (x * x + z * z)
+        matrices[:, 1, 2] = 2 * (y * z - w * x)
+        matrices[:, 2, 0] = 2 * (x * z - w * y)
+        matrices[:, 2, 1] = 2 * (y * z + w * x)
+        matrices[:, 2, 2] = 1 - 2 * (x * x + y * y)
+        return matrices
+
+
+def _multiply(
+    a: Union[Rotation3dArray, Rotation3d], b: Union[Rotation3dArray, Rotation3d]
+) -> Rotation3dArray:
+    """Returns the rotations of the quaternion products a * b, renormalised."""
+    aw = a.w
+    ax = a.x
+    ay = a.y
+    az = a.z
+    bw = b.w
+    bx = b.x
+    by = b.y
+    bz = b.z
+    w = aw * bw - ax * bx - ay * by - az * bz
+    x = aw * bx + ax * bw + ay * bz - az * by
+    y = aw * by - ax * bz + ay * bw + az * bx
+    z = aw * bz + ax * by - ay * bx + az * bw
+    norm = np.sqrt(w * w + x * x + y * y + z * z)
+    return Rotation3dArray(w / norm, x / norm, y / norm, z / norm)
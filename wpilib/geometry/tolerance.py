@@ -0,0 +1,116 @@
+import functools
+from typing import Callable, TypeVar
+
+__all__ = ("get_tolerance", "set_tolerance", "memoize")
+
+_F = TypeVar("_F", bound=Callable)
+
+#: The width of the grid that geometry components are rounded to
+#: when looking up memoized results.
+_tolerance = 1e-9
+#: Incremented whenever the tolerance changes, to invalidate memoized results.
+_generation = 0
+
+
+def get_tolerance() -> float:
+    """Returns the tolerance used to look up memoized results."""
+    return _tolerance
+
+
+def set_tolerance(tolerance: float) -> None:
+    """Sets the tolerance used to look up memoized results.
+
+    Arguments of functions decorated with :func:`memoize` are looked up by
+    their components rounded to the nearest multiple of the tolerance.
+    This doesn't change how geometry objects compare or hash.
+
+    This should be called before any memoized function is used, as every
+    memoized function discards its results when the tolerance changes.
+
+    :param tolerance: The new tolerance. Defaults to 1e-9.
+    """
+    global _tolerance, _generation
+    assert tolerance > 0, "Tolerance must be positive"
+    _tolerance = tolerance
+    _generation += 1
+
+
+def _quantize(value: float):
+    """Rounds a value to the nearest multiple of the tolerance."""
+    try:
+        return round(value / _tolerance)
+    except (OverflowError, ValueError):
+        # Infinities and NaNs are compared as they are.
+        return value
+
+
+def _memo_key(value):
+    """Returns the key to look up a memoized argument by.
+
+    Geometry objects are keyed by their type and their components rounded
+    to the tolerance, and tuples and lists by the keys of their items.
+    """
+    if isinstance(value, (tuple, list)):
+        return tuple, tuple(_memo_key(item) for item in value)
+    key = getattr(value, "_key", None)
+    if key is not None:
+        return type(value), key()
+    return value
+
+
+class _MemoArgument:
+    """An argument of a memoized function, compared by its key."""
+
+    __slots__ = ("value", "key")
+
+    def __init__(self, value):
+        self.value = value
+        self.key = _memo_key(value)
+
+    def __eq__(self, other: "_MemoArgument") -> bool:
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+
+def memoize(maxsize: int = 128) -> Callable[[_F], _F]:
+    """Decorator that caches the results of a function of geometry objects.
+
+    This is :func:`functools.lru_cache`, except that geometry arguments are
+    looked up by their components rounded to the tolerance, and the cache
+    is cleared whenever the tolerance is changed. For example, a function
+    keyed by a center of rotation or a tuple of waypoints is only
+    recomputed when an argument moves to a different multiple of the
+    tolerance. The function is called with the first arguments seen for
+    each key.
+
+    :param maxsize: The maximum number of results to keep.
+    """
+
+    def decorator(function: _F) -> _F:
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(*args: _MemoArgument, **kwargs: _MemoArgument):
+            return function(
+                *(arg.value for arg in args),
+                **{name: arg.value for name, arg in kwargs.items()},
+            )
+
+        generation = _generation
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            nonlocal generation
+            if generation != _generation:
+                cached.cache_clear()
+                generation = _generation
+            return cached(
+                *(_MemoArgument(arg) for arg in args),
+                **{name: _MemoArgument(arg) for name, arg in kwargs.items()},
+            )
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
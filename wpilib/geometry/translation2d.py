@@ -1,7 +1,13 @@
 import math
+import struct
 from dataclasses import dataclass
+from typing import Optional
 
 from .rotation2d import Rotation2d
+from .tolerance import _quantize
+
+#: The interned zero translation, set once the class is defined.
+_identity_translation: Optional["Translation2d"] = None
 
 
 @dataclass(frozen=True)
@@ -22,7 +28,28 @@ class Translation2d:
 
     __slots__ = ("x", "y")
 
+    #: The binary layout of a packed translation: its x and y components.
+    _packer = struct.Struct("<2d")
+    #: The size of a packed translation in bytes.
+    packedSize = _packer.size
+
+    def __new__(cls, x: float = 0, y: float = 0) -> "Translation2d":
+        if (
+            x == 0
+            and y == 0
+            and _identity_translation is not None
+            and cls is Translation2d
+        ):
+            return _identity_translation
+        return object.__new__(cls)
+
     def __init__(self, x: float = 0, y: float = 0):
+        """Constructs a Translation2d with the given x and y components.
+
+        A zero translation returns a shared instance.
+        """
+        if self is _identity_translation:
+            return
         object.__setattr__(self, "x", x)
         object.__setattr__(self, "y", y)
 
@@ -41,6 +68,22 @@ class Translation2d:
         """
         return self.norm()
 
+    def __reduce__(self):
+        return Translation2d, (self.x, self.y)
+
+    def toBytes(self) -> bytes:
+        """Packs the translation into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.x, self.y)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the translation into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, self.x, self.y)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Translation2d":
+        """Unpacks a translation packed by :meth:`toBytes` or :meth:`packInto`."""
+        return cls(*cls._packer.unpack_from(buffer, offset))
+
     def rotateBy(self, other: Rotation2d) -> "Translation2d":
         """Applies a rotation to the translation in 2d space.
 
@@ -57,6 +100,8 @@ class Translation2d:
 
         :returns: The new rotated translation.
         """
+        if self is _identity_translation:
+            return self
         x = self.x
         y = self.y
         cos = other.cos
@@ -67,12 +112,18 @@ class Translation2d:
         """Adds two translations in 2d space."""
         if not isinstance(other, Translation2d):
             return NotImplemented
+        if other is _identity_translation:
+            return self
+        if self is _identity_translation:
+            return other
         return Translation2d(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other: "Translation2d") -> "Translation2d":
         """Subtracts the other translation from self."""
         if not isinstance(other, Translation2d):
             return NotImplemented
+        if other is _identity_translation:
+            return self
         return Translation2d(self.x - other.x, self.y - other.y)
 
     def __neg__(self) -> "Translation2d":
@@ -97,3 +148,12 @@ class Translation2d:
         if not isinstance(other, Translation2d):
             return NotImplemented
         return math.isclose(self.x, other.x) and math.isclose(self.y, other.y)
+
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return _quantize(self.x), _quantize(self.y)
+
+
+_identity_translation = Translation2d()
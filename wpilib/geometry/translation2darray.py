@@ -0,0 +1,314 @@
+import math
+from typing import TYPE_CHECKING, Dict, Iterable, Tuple, Union, overload
+
+import numpy as np
+
+from .rotation2d import Rotation2d
+from .rotation2darray import Rotation2dArray
+from .translation2d import Translation2d
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import Pose2d
+
+
+class Translation2dArray:
+    """An array of translations in 2d space.
+
+    This stores the x and y components of the translations in parallel
+    NumPy arrays, and performs the same operations as Translation2d on
+    every translation at once.
+    """
+
+    __slots__ = ("x", "y")
+
+    #: The NumPy dtype of packed arrays of translations, with the same
+    #: layout as :meth:`Translation2d.toBytes`.
+    dtype = np.dtype([("x", "<f8"), ("y", "<f8")])
+
+    def __init__(self, x: np.ndarray, y: np.ndarray):
+        #: The X components of the translations.
+        self.x = np.asarray(x, dtype=float)
+        #: The Y components of the translations.
+        self.y = np.asarray(y, dtype=float)
+
+    @classmethod
+    def fromTranslations(
+        cls, translations: Iterable[Translation2d]
+    ) -> "Translation2dArray":
+        """Creates an array from individual translations."""
+        xy = np.array(
+            [(translation.x, translation.y) for translation in translations],
+            dtype=float,
+        ).reshape(-1, 2)
+        return cls(xy[:, 0], xy[:, 1])
+
+    @classmethod
+    def fromArray(cls, xy: np.ndarray) -> "Translation2dArray":
+        """Creates an array from an (n, 2) array of x and y components."""
+        xy = np.asarray(xy, dtype=float)
+        return cls(xy[:, 0], xy[:, 1])
+
+    def toArray(self) -> np.ndarray:
+        """Returns the translations as an (n, 2) array of x and y components."""
+        return np.column_stack((self.x, self.y))
+
+    def toPacked(self) -> np.ndarray:
+        """Packs the translations into a structured array of :attr:`dtype`.
+
+        The result supports the buffer protocol, so it can be written
+        directly to shared memory or a socket.
+        """
+        packed = np.empty(len(self.x), dtype=self.dtype)
+        packed["x"] = self.x
+        packed["y"] = self.y
+        return packed
+
+    @classmethod
+    def fromPacked(cls, buffer) -> "Translation2dArray":
+        """Unpacks translations from a buffer packed by :meth:`toPacked`.
+
+        The components are views of the buffer rather than copies.
+        """
+        packed = np.frombuffer(buffer, dtype=cls.dtype)
+        return cls(packed["x"], packed["y"])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @overload
+    def __getitem__(self, index: int) -> Translation2d:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "Translation2dArray":
+        ...
+
+    def __getitem__(self, index):
+        """Returns a single Translation2d, or an array for slices and index arrays."""
+        x = self.x[index]
+        y = self.y[index]
+        if np.ndim(x) == 0:
+            return Translation2d(float(x), float(y))
+        return Translation2dArray(x, y)
+
+    def __repr__(self) -> str:
+        return f"Translation2dArray({self.toArray()!r})"
+
+    def getDistance(
+        self, other: Union["Translation2dArray", Translation2d]
+    ) -> np.ndarray:
+        """Calculates the distances between translations element-wise,
+        or from each translation to a single translation.
+        """
+        return np.hypot(other.x - self.x, other.y - self.y)
+
+    def getPairwiseDistances(self, other: "Translation2dArray") -> np.ndarray:
+        """Calculates the distance from every translation to every other.
+
+        :returns: An (n, m) array of distances, where n is the length of
+                  this array and m is the length of the other.
+        """
+        return np.hypot(
+            other.x[np.newaxis, :] - self.x[:, np.newaxis],
+            other.y[np.newaxis, :] - self.y[:, np.newaxis],
+        )
+
+    def nearest(self, point: Translation2d) -> Tuple[int, float]:
+        """Finds the translation nearest to the given point by brute force.
+
+        For repeated queries against a large fixed set of translations,
+        use :class:`Translation2dGrid` instead.
+
+        :returns: The index of the nearest translation, and its distance.
+        """
+        distances = self.getDistance(point)
+        index = int(np.argmin(distances))
+        return index, float(distances[index])
+
+    def norm(self) -> np.ndarray:
+        """Returns the norms, or distances from the origin to the translations."""
+        return np.hypot(self.x, self.y)
+
+    def rotateBy(
+        self, other: Union[Rotation2d, Rotation2dArray]
+    ) -> "Translation2dArray":
+        """Applies a rotation to every translation, or rotations element-wise.
+
+        See :meth:`Translation2d.rotateBy`.
+        """
+        x = self.x
+        y = self.y
+        cos = other.cos
+        sin = other.sin
+        return Translation2dArray(x * cos - y * sin, x * sin + y * cos)
+
+    def relativeTo(self, pose: "Pose2d") -> "Translation2dArray":
+        """Converts field-relative translations into the frame of the given pose.
+
+        For example, this converts field landmarks into the robot frame
+        when given the robot pose.
+        """
+        rotation = pose.rotation
+        cos = rotation.cos
+        sin = rotation.sin
+        x = self.x - pose.translation.x
+        y = self.y - pose.translation.y
+        return Translation2dArray(x * cos + y * sin, y * cos - x * sin)
+
+    def __add__(
+        self, other: Union["Translation2dArray", Translation2d]
+    ) -> "Translation2dArray":
+        """Adds translations element-wise, or adds a single translation to all."""
+        if not isinstance(other, (Translation2dArray, Translation2d)):
+            return NotImplemented
+        return Translation2dArray(self.x + other.x, self.y + other.y)
+
+    __radd__ = __add__
+
+    def __sub__(
+        self, other: Union["Translation2dArray", Translation2d]
+    ) -> "Translation2dArray":
+        """Subtracts translations element-wise, or subtracts a single translation."""
+        if not isinstance(other, (Translation2dArray, Translation2d)):
+            return NotImplemented
+        return Translation2dArray(self.x - other.x, self.y - other.y)
+
+    def __rsub__(self, other: Translation2d) -> "Translation2dArray":
+        if not isinstance(other, Translation2d):
+            return NotImplemented
+        return Translation2dArray(other.x - self.x, other.y - self.y)
+
+    def __neg__(self) -> "Translation2dArray":
+        """Takes the inverse of every translation."""
+        return Translation2dArray(-self.x, -self.y)
+
+    def __mul__(self, other: Union[float, np.ndarray]) -> "Translation2dArray":
+        """Multiplies the translations by a scalar, or element-wise by an array."""
+        if not isinstance(other, (float, int, np.ndarray)):
+            return NotImplemented
+        return Translation2dArray(self.x * other, self.y * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union[float, np.ndarray]) -> "Translation2dArray":
+        """Divides the translations by a scalar, or element-wise by an array."""
+        if not isinstance(other, (float, int, np.ndarray)):
+            return NotImplemented
+        return Translation2dArray(self.x / other, self.y / other)
+
+
+class Translation2dGrid:
+    """A uniform grid spatial index over a fixed set of translations.
+
+    This answers nearest neighbour and radius queries by only looking at
+    grid cells near the query point, rather than every translation.
+    Choose a cell size around the typical spacing between the translations.
+    """
+
+    __slots__ = ("points", "cellSize", "_origin_x", "_origin_y", "_shape", "_cells")
+
+    def __init__(self, points: Translation2dArray, cellSize: float):
+        """
+        :param points: The translations to index.
+        :param cellSize: The width and height of each grid cell.
+        """
+        assert len(points) > 0, "Cannot index an empty set of translations"
+        assert cellSize > 0, "Cell size must be positive"
+
+        self.points = points
+        self.cellSize = cellSize
+        self._origin_x = float(points.x.min())
+        self._origin_y = float(points.y.min())
+
+        cell_x = ((points.x - self._origin_x) // cellSize).astype(int)
+        cell_y = ((points.y - self._origin_y) // cellSize).astype(int)
+        self._shape = (int(cell_x.max()) + 1, int(cell_y.max()) + 1)
+
+        keys = cell_x * self._shape[1] + cell_y
+        order = np.argsort(keys, kind="stable")
+        unique_keys, starts = np.unique(keys[order], return_index=True)
+        groups = np.split(order, starts[1:])
+        num_y = self._shape[1]
+        self._cells: Dict[Tuple[int, int], np.ndarray] = {
+            (int(key) // num_y, int(key) % num_y): groups[i]
+            for i, key in enumerate(unique_keys)
+        }
+
+    def _cellOf(self, point: Translation2d) -> Tuple[int, int]:
+        cell_size = self.cellSize
+        return (
+            math.floor((point.x - self._origin_x) / cell_size),
+            math.floor((point.y - self._origin_y) / cell_size),
+        )
+
+    def _ring(self, cell_x: int, cell_y: int, radius: int):
+        """Yields the index arrays of the cells at the given Chebyshev radius."""
+        cells = self._cells
+        if radius == 0:
+            group = cells.get((cell_x, cell_y))
+            if group is not None:
+                yield group
+            return
+        for dx in range(-radius, radius + 1):
+            for dy in (-radius, radius):
+                group = cells.get((cell_x + dx, cell_y + dy))
+                if group is not None:
+                    yield group
+        for dy in range(-radius + 1, radius):
+            for dx in (-radius, radius):
+                group = cells.get((cell_x + dx, cell_y + dy))
+                if group is not None:
+                    yield group
+
+    def nearest(self, point: Translation2d) -> Tuple[int, float]:
+        """Finds the indexed translation nearest to the given point.
+
+        :returns: The index of the nearest translation, and its distance.
+        """
+        points = self.points
+        cell_x, cell_y = self._cellOf(point)
+        num_x, num_y = self._shape
+        if not (0 <= cell_x < num_x and 0 <= cell_y < num_y):
+            # The rings around a point outside the grid are mostly empty,
+            # and there are more of them the further away it is.
+            return points.nearest(point)
+
+        max_radius = max(cell_x, num_x - 1 - cell_x, cell_y, num_y - 1 - cell_y)
+
+        best_index = -1
+        best_distance = math.inf
+        for radius in range(max_radius + 1):
+            for group in self._ring(cell_x, cell_y, radius):
+                distances = np.hypot(
+                    points.x[group] - point.x, points.y[group] - point.y
+                )
+                i = int(np.argmin(distances))
+                if distances[i] < best_distance:
+                    best_distance = float(distances[i])
+                    best_index = int(group[i])
+            # Every cell further out is at least this far from the point.
+            if best_distance <= radius * self.cellSize:
+                break
+
+        return best_index, best_distance
+
+    def withinRadius(self, point: Translation2d, radius: float) -> np.ndarray:
+        """Returns the indices of the indexed translations within the given
+        distance of the point, in ascending order.
+        """
+        points = self.points
+        cell_x, cell_y = self._cellOf(point)
+        cell_radius = math.ceil(radius / self.cellSize)
+
+        groups = [
+            group
+            for ring in range(cell_radius + 1)
+            for group in self._ring(cell_x, cell_y, ring)
+        ]
+        if not groups:
+            return np.empty(0, dtype=int)
+        candidates = np.concatenate(groups)
+        distances = np.hypot(
+            points.x[candidates] - point.x, points.y[candidates] - point.y
+        )
+        return np.sort(candidates[distances <= radius])
@@ -0,0 +1,153 @@
+import math
+import struct
+from dataclasses import dataclass
+
+from .rotation3d import Rotation3d, _isclose
+from .tolerance import _quantize
+from .translation2d import Translation2d
+
+
+@dataclass(frozen=True)
+class Translation3d:
+    """Represents a translation in 3d space.
+
+    This object can be used to represent a point or a vector.
+
+    This assumes that you are using conventional mathematical axes.
+    When the robot is placed on the origin, facing toward the X direction,
+    moving forward increases the X, moving to the left increases the Y,
+    and moving up increases the Z.
+    """
+
+    #: The X component of the translation.
+    x: float
+    #: The Y component of the translation.
+    y: float
+    #: The Z component of the translation.
+    z: float
+
+    __slots__ = ("x", "y", "z")
+
+    #: The binary layout of a packed translation: its x, y and z components.
+    _packer = struct.Struct("<3d")
+    #: The size of a packed translation in bytes.
+    packedSize = _packer.size
+
+    def __init__(self, x: float = 0, y: float = 0, z: float = 0):
+        """Constructs a Translation3d with the given x, y and z components."""
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "z", z)
+
+    @classmethod
+    def fromTranslation2d(cls, translation: Translation2d) -> "Translation3d":
+        """Creates a translation in the XY plane from a 2d translation."""
+        return cls(translation.x, translation.y, 0.0)
+
+    def __reduce__(self):
+        return Translation3d, (self.x, self.y, self.z)
+
+    def toBytes(self) -> bytes:
+        """Packs the translation into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.x, self.y, self.z)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the translation into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, self.x, self.y, self.z)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Translation3d":
+        """Unpacks a translation packed by :meth:`toBytes` or :meth:`packInto`."""
+        return cls(*cls._packer.unpack_from(buffer, offset))
+
+    def getDistance(self, other: "Translation3d") -> float:
+        """Calculates the distance between two translations in 3d space."""
+        return (other - self).norm()
+
+    def norm(self) -> float:
+        """Returns the norm, or distance from the origin to the translation."""
+        x = self.x
+        y = self.y
+        z = self.z
+        return math.sqrt(x * x + y * y + z * z)
+
+    def __abs__(self) -> float:
+        """Returns the norm of this translation.
+
+        This is equivalent to the norm method.
+        """
+        return self.norm()
+
+    def toTranslation2d(self) -> Translation2d:
+        """Returns the projection of the translation onto the XY plane."""
+        return Translation2d(self.x, self.y)
+
+    def rotateBy(self, other: Rotation3d) -> "Translation3d":
+        """Applies a rotation to the translation in 3d space.
+
+        :param other: The rotation to rotate the translation by.
+
+        :returns: The new rotated translation.
+        """
+        w = other.w
+        qx = other.x
+        qy = other.y
+        qz = other.z
+        x = self.x
+        y = self.y
+        z = self.z
+        # v + w * t + q x t, where t = 2 * (q x v).
+        tx = 2 * (qy * z - qz * y)
+        ty = 2 * (qz * x - qx * z)
+        tz = 2 * (qx * y - qy * x)
+        return Translation3d(
+            x + w * tx + qy * tz - qz * ty,
+            y + w * ty + qz * tx - qx * tz,
+            z + w * tz + qx * ty - qy * tx,
+        )
+
+    def __add__(self, other: "Translation3d") -> "Translation3d":
+        """Adds two translations in 3d space."""
+        if not isinstance(other, Translation3d):
+            return NotImplemented
+        return Translation3d(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: "Translation3d") -> "Translation3d":
+        """Subtracts the other translation from self."""
+        if not isinstance(other, Translation3d):
+            return NotImplemented
+        return Translation3d(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __neg__(self) -> "Translation3d":
+        """Returns the inverse of the current translation."""
+        return Translation3d(-self.x, -self.y, -self.z)
+
+    def __mul__(self, other: float) -> "Translation3d":
+        """Multiplies the translation by a scalar."""
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        return Translation3d(self.x * other, self.y * other, self.z * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: float) -> "Translation3d":
+        """Divides the translation by a scalar."""
+        if not isinstance(other, (float, int)):
+            return NotImplemented
+        return Translation3d(self.x / other, self.y / other, self.z / other)
+
+    def __eq__(self, other: "Translation3d") -> bool:
+        """Compares the components to within 1e-9."""
+        if not isinstance(other, Translation3d):
+            return NotImplemented
+        return (
+            _isclose(self.x, other.x)
+            and _isclose(self.y, other.y)
+            and _isclose(self.z, other.z)
+        )
+
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return _quantize(self.x), _quantize(self.y), _quantize(self.z)
@@ -0,0 +1,179 @@
+from typing import Iterable, Union, overload
+
+import numpy as np
+
+from .rotation3d import Rotation3d
+from .rotation3darray import Rotation3dArray
+from .translation2darray import Translation2dArray
+from .translation3d import Translation3d
+
+
+class Translation3dArray:
+    """An array of translations in 3d space.
+
+    This stores the x, y and z components of the translations in parallel
+    NumPy arrays, and performs the same operations as Translation3d on
+    every translation at once.
+    """
+
+    __slots__ = ("x", "y", "z")
+
+    #: The NumPy dtype of packed arrays of translations, with the same
+    #: layout as :meth:`Translation3d.toBytes`.
+    dtype = np.dtype([("x", "<f8"), ("y", "<f8"), ("z", "<f8")])
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, z: np.ndarray):
+        #: The X components of the translations.
+        self.x = np.asarray(x, dtype=float)
+        #: The Y components of the translations.
+        self.y = np.asarray(y, dtype=float)
+        #: The Z components of the translations.
+        self.z = np.asarray(z, dtype=float)
+
+    @classmethod
+    def fromTranslations(
+        cls, translations: Iterable[Translation3d]
+    ) -> "Translation3dArray":
+        """Creates an array from individual translations."""
+        xyz = np.array(
+            [
+                (translation.x, translation.y, translation.z)
+                for translation in translations
+            ],
+            dtype=float,
+        ).reshape(-1, 3)
+        return cls(xyz[:, 0], xyz[:, 1], xyz[:, 2])
+
+    @classmethod
+    def fromArray(cls, xyz: np.ndarray) -> "Translation3dArray":
+        """Creates an array from an (n, 3) array of x, y and z components."""
+        xyz = np.asarray(xyz, dtype=float)
+        return cls(xyz[:, 0], xyz[:, 1], xyz[:, 2])
+
+    def toArray(self) -> np.ndarray:
+        """Returns the translations as an (n, 3) array of x, y and z components."""
+        return np.column_stack((self.x, self.y, self.z))
+
+    def toPacked(self) -> np.ndarray:
+        """Packs the translations into a structured array of :attr:`dtype`.
+
+        The result supports the buffer protocol, so it can be written
+        directly to shared memory or a socket.
+        """
+        packed = np.empty(len(self.x), dtype=self.dtype)
+        packed["x"] = self.x
+        packed["y"] = self.y
+        packed["z"] = self.z
+        return packed
+
+    @classmethod
+    def fromPacked(cls, buffer) -> "Translation3dArray":
+        """Unpacks translations from a buffer packed by :meth:`toPacked`.
+
+        The components are views of the buffer rather than copies.
+        """
+        packed = np.frombuffer(buffer, dtype=cls.dtype)
+        return cls(packed["x"], packed["y"], packed["z"])
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @overload
+    def __getitem__(self, index: int) -> Translation3d:
+        ...
+
+    @overload
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> "Translation3dArray":
+        ...
+
+    def __getitem__(self, index):
+        """Returns a single Translation3d, or an array for slices and index arrays."""
+        x = self.x[index]
+        y = self.y[index]
+        z = self.z[index]
+        if np.ndim(x) == 0:
+            return Translation3d(float(x), float(y), float(z))
+        return Translation3dArray(x, y, z)
+
+    def __repr__(self) -> str:
+        return f"Translation3dArray({self.toArray()!r})"
+
+    def getDistance(
+        self, other: Union["Translation3dArray", Translation3d]
+    ) -> np.ndarray:
+        """Calculates the distances between translations element-wise,
+        or from each translation to a single translation.
+        """
+        return (other - self).norm()
+
+    def norm(self) -> np.ndarray:
+        """Returns the norms, or distances from the origin to the translations."""
+        return np.sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+
+    def toTranslation2dArray(self) -> Translation2dArray:
+        """Returns the projections of the translations onto the XY plane."""
+        return Translation2dArray(self.x, self.y)
+
+    def rotateBy(
+        self, other: Union[Rotation3d, Rotation3dArray]
+    ) -> "Translation3dArray":
+        """Applies a rotation to every translation, or rotations element-wise.
+
+        See :meth:`Translation3d.rotateBy`.
+        """
+        w = other.w
+        qx = other.x
+        qy = other.y
+        qz = other.z
+        x = self.x
+        y = self.y
+        z = self.z
+        tx = 2 * (qy * z - qz * y)
+        ty = 2 * (qz * x - qx * z)
+        tz = 2 * (qx * y - qy * x)
+        return Translation3dArray(
+            x + w * tx + qy * tz - qz * ty,
+            y + w * ty + qz * tx - qx * tz,
+            z + w * tz + qx * ty - qy * tx,
+        )
+
+    def __add__(
+        self, other: Union["Translation3dArray", Translation3d]
+    ) -> "Translation3dArray":
+        """Adds translations element-wise, or adds a single translation to all."""
+        if not isinstance(other, (Translation3dArray, Translation3d)):
+            return NotImplemented
+        return Translation3dArray(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    __radd__ = __add__
+
+    def __sub__(
+        self, other: Union["Translation3dArray", Translation3d]
+    ) -> "Translation3dArray":
+        """Subtracts translations element-wise, or subtracts a single translation."""
+        if not isinstance(other, (Translation3dArray, Translation3d)):
+            return NotImplemented
+        return Translation3dArray(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __rsub__(self, other: Translation3d) -> "Translation3dArray":
+        if not isinstance(other, Translation3d):
+            return NotImplemented
+        return Translation3dArray(other.x - self.x, other.y - self.y, other.z - self.z)
+
+    def __neg__(self) -> "Translation3dArray":
+        """Takes the inverse of every translation."""
+        return Translation3dArray(-self.x, -self.y, -self.z)
+
+    def __mul__(self, other: Union[float, np.ndarray]) -> "Translation3dArray":
+        """Multiplies the translations by a scalar, or element-wise by an array."""
+        if not isinstance(other, (float, int, np.ndarray)):
+            return NotImplemented
+        return Translation3dArray(self.x * other, self.y * other, self.z * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union[float, np.ndarray]) -> "Translation3dArray":
+        """Divides the translations by a scalar, or element-wise by an array."""
+        if not isinstance(other, (float, int, np.ndarray)):
+            return NotImplemented
+        return Translation3dArray(self.x / other, self.y / other, self.z / other)
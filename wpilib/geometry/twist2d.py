@@ -1,6 +1,9 @@
 import math
+import struct
 from dataclasses import dataclass
 
+from .tolerance import _quantize
+
 
 @dataclass
 class Twist2d:
@@ -21,11 +24,29 @@ class Twist2d:
 
     __slots__ = ("dx", "dy", "dtheta")
 
+    #: The binary layout of a packed twist: its dx, dy and dtheta components.
+    _packer = struct.Struct("<3d")
+    #: The size of a packed twist in bytes.
+    packedSize = _packer.size
+
     def __init__(self, dx: float = 0, dy: float = 0, dtheta: float = 0):
         self.dx = dx
         self.dy = dy
         self.dtheta = dtheta
 
+    def toBytes(self) -> bytes:
+        """Packs the twist into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.dx, self.dy, self.dtheta)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the twist into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, self.dx, self.dy, self.dtheta)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Twist2d":
+        """Unpacks a twist packed by :meth:`toBytes` or :meth:`packInto`."""
+        return cls(*cls._packer.unpack_from(buffer, offset))
+
     def __eq__(self, other: "Twist2d") -> bool:
         if not isinstance(other, Twist2d):
             return NotImplemented
@@ -34,3 +55,9 @@ class Twist2d:
             and math.isclose(self.dy, other.dy)
             and math.isclose(self.dtheta, other.dtheta)
         )
+
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return _quantize(self.dx), _quantize(self.dy), _quantize(self.dtheta)
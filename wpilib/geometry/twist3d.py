@@ -0,0 +1,92 @@
+import struct
+from dataclasses import dataclass
+
+from .rotation3d import _isclose
+from .tolerance import _quantize
+
+
+@dataclass
+class Twist3d:
+    """A change in distance along a 3d arc since the last pose update.
+
+    The rotation is a rotation vector, whose direction is the axis of the
+    rotation and whose norm is the angle in radians.
+
+    A Twist can be used to represent a difference between two poses.
+    """
+
+    #: Linear "dx" component
+    dx: float
+    #: Linear "dy" component
+    dy: float
+    #: Linear "dz" component
+    dz: float
+    #: Rotation vector X component (radians)
+    rx: float
+    #: Rotation vector Y component (radians)
+    ry: float
+    #: Rotation vector Z component (radians)
+    rz: float
+
+    __slots__ = ("dx", "dy", "dz", "rx", "ry", "rz")
+
+    #: The binary layout of a packed twist: its six components.
+    _packer = struct.Struct("<6d")
+    #: The size of a packed twist in bytes.
+    packedSize = _packer.size
+
+    def __init__(
+        self,
+        dx: float = 0,
+        dy: float = 0,
+        dz: float = 0,
+        rx: float = 0,
+        ry: float = 0,
+        rz: float = 0,
+    ):
+        self.dx = dx
+        self.dy = dy
+        self.dz = dz
+        self.rx = rx
+        self.ry = ry
+        self.rz = rz
+
+    def toBytes(self) -> bytes:
+        """Packs the twist into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.dx, self.dy, self.dz, self.rx, self.ry, self.rz)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the twist into a writable buffer at the given offset."""
+        self._packer.pack_into(
+            buffer, offset, self.dx, self.dy, self.dz, self.rx, self.ry, self.rz
+        )
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "Twist3d":
+        """Unpacks a twist packed by :meth:`toBytes` or :meth:`packInto`."""
+        return cls(*cls._packer.unpack_from(buffer, offset))
+
+    def __eq__(self, other: "Twist3d") -> bool:
+        if not isinstance(other, Twist3d):
+            return NotImplemented
+        return (
+            _isclose(self.dx, other.dx)
+            and _isclose(self.dy, other.dy)
+            and _isclose(self.dz, other.dz)
+            and _isclose(self.rx, other.rx)
+            and _isclose(self.ry, other.ry)
+            and _isclose(self.rz, other.rz)
+        )
+
+    def _key(self) -> tuple:
+        """Returns the components rounded to the geometry tolerance, to look
+        up memoized results by.
+        """
+        return (
+            _quantize(self.dx),
+            _quantize(self.dy),
+            _quantize(self.dz),
+            _quantize(self.rx),
+            _quantize(self.ry),
+            _quantize(self.rz),
+        )
@@ -1,3 +1,3 @@
-from .chassisspeeds import ChassisSpeeds
+from .chassisspeeds import ChassisSpeeds, field_to_robot_speeds, robot_to_field_speeds
 
-__all__ = ("ChassisSpeeds",)
+__all__ = ("ChassisSpeeds", "field_to_robot_speeds", "robot_to_field_speeds")
@@ -0,0 +1,193 @@
+import asyncio
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from ..geometry import Pose2d, Twist2d
+from .swerve import SwerveDriveOdometry
+
+__all__ = ("AsyncSwerveDriveOdometry",)
+
+# Python 3.6 has no get_running_loop, but get_event_loop is equivalent
+# inside a coroutine.
+_get_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class AsyncSwerveDriveOdometry:
+    """Runs swerve drive odometry from sensor samples on asyncio queues.
+
+    Gyro samples are put on :attr:`gyroQueue` as ``(timestamp, gyroAngle)``
+    tuples, and module samples are put on :attr:`moduleQueue` as
+    ``(timestamp, module_states)`` tuples, where ``module_states`` is a
+    sequence of SwerveModuleState or a single SwerveModuleStates. Samples
+    from each queue must be in chronological order. The samples are aligned
+    by time as in :meth:`SwerveDriveOdometry.addModuleSample`.
+
+    Call :meth:`run` as a task on the event loop. Every sample waiting on
+    the queues is integrated at once each time it wakes up, so bursts of
+    samples are coalesced into a single wakeup.
+
+    While the odometry's buffer of module samples waiting for the gyro is
+    full, module samples are left on :attr:`moduleQueue` until a newer gyro
+    sample arrives, rather than discarding the oldest buffered samples.
+    A bounded module queue then applies backpressure to its producers.
+    """
+
+    def __init__(
+        self,
+        odometry: SwerveDriveOdometry,
+        moduleQueue: Optional[asyncio.Queue] = None,
+        gyroQueue: Optional[asyncio.Queue] = None,
+        historySize: int = 50,
+        maxBatchSize: int = 32,
+    ):
+        """
+        :param odometry: The odometry to update.
+
+        :param moduleQueue: The queue of module samples. A new queue is
+                            created if not given.
+
+        :param gyroQueue: The queue of gyro samples. A new queue is created
+                          if not given.
+
+        :param historySize: The number of past poses to keep for
+                            :meth:`getPoseAt`.
+
+        :param maxBatchSize: The number of samples to integrate before
+                             yielding to other tasks on the event loop.
+        """
+        self.odometry = odometry
+        self.moduleQueue = asyncio.Queue() if moduleQueue is None else moduleQueue
+        self.gyroQueue = asyncio.Queue() if gyroQueue is None else gyroQueue
+        self.maxBatchSize = maxBatchSize
+        self._history: Deque[Tuple[float, Pose2d]] = deque(maxlen=historySize)
+        self._waiter: Optional[asyncio.Future] = None
+
+    def getPose(self) -> Pose2d:
+        """Returns the latest position of the robot on the field."""
+        return self.odometry.getPose()
+
+    async def nextPose(self) -> Pose2d:
+        """Waits for the next odometry update and returns the new pose."""
+        waiter = self._waiter
+        if waiter is None:
+            waiter = self._waiter = _get_running_loop().create_future()
+        return await asyncio.shield(waiter)
+
+    def getPoseAt(self, timestamp: float) -> Optional[Pose2d]:
+        """Returns the pose of the robot at the given time.
+
+        The pose is interpolated between the recorded poses either side of
+        the given time, and clamped to the oldest and newest recorded poses.
+
+        :returns: The interpolated pose, or None if there are no poses yet.
+        """
+        history = self._history
+        if not history:
+            return None
+
+        later_time, later_pose = history[-1]
+        if timestamp >= later_time:
+            return later_pose
+
+        for i in range(len(history) - 2, -1, -1):
+            earlier_time, earlier_pose = history[i]
+            if earlier_time <= timestamp:
+                twist = earlier_pose.log(later_pose)
+                fraction = (timestamp - earlier_time) / (later_time - earlier_time)
+                return earlier_pose.exp(
+                    Twist2d(
+                        twist.dx * fraction,
+                        twist.dy * fraction,
+                        twist.dtheta * fraction,
+                    )
+                )
+            later_time, later_pose = earlier_time, earlier_pose
+
+        return later_pose
+
+    async def poseAt(self, timestamp: float) -> Pose2d:
+        """Waits until odometry has been updated past the given time,
+        then returns the pose of the robot at that time.
+        """
+        while not self._history or self._history[-1][0] < timestamp:
+            await self.nextPose()
+        return self.getPoseAt(timestamp)
+
+    async def run(self) -> None:
+        """Integrates samples from the queues as they arrive, forever."""
+        gyro_queue = self.gyroQueue
+        module_queue = self.moduleQueue
+        gyro_getter = asyncio.ensure_future(gyro_queue.get())
+        module_getter: Optional[asyncio.Future] = asyncio.ensure_future(
+            module_queue.get()
+        )
+        # A module sample taken off the queue while the odometry's buffer
+        # was full, waiting for the next gyro sample.
+        pending = None
+        try:
+            while True:
+                getters = [gyro_getter]
+                if module_getter is not None:
+                    getters.append(module_getter)
+                await asyncio.wait(getters, return_when=asyncio.FIRST_COMPLETED)
+
+                # Gyro samples are taken first, so that module samples
+                # in the same burst can be integrated straight away.
+                if gyro_getter.done():
+                    await self._ingest(gyro_queue, gyro_getter.result())
+                    gyro_getter = asyncio.ensure_future(gyro_queue.get())
+                    if pending is not None:
+                        pending = await self._ingest(module_queue, pending)
+                if module_getter is not None and module_getter.done():
+                    pending = await self._ingest(module_queue, module_getter.result())
+                    module_getter = None
+                if module_getter is None and pending is None:
+                    module_getter = asyncio.ensure_future(module_queue.get())
+        finally:
+            gyro_getter.cancel()
+            if module_getter is not None:
+                module_getter.cancel()
+
+    async def _ingest(self, queue: asyncio.Queue, sample: tuple) -> Optional[tuple]:
+        """Integrates the given sample and any others waiting on its queue.
+
+        :returns: The module sample that was not integrated because the
+                  odometry's buffer of module samples is full, if any.
+        """
+        odometry = self.odometry
+        is_gyro = queue is self.gyroQueue
+        module_samples = odometry._module_samples
+        count = 0
+        while True:
+            timestamp, value = sample
+            if is_gyro:
+                odometry.addGyroSample(timestamp, value)
+            elif len(module_samples) == module_samples.maxlen:
+                return sample
+            else:
+                odometry.addModuleSample(timestamp, *value)
+            self._recordUpdate()
+
+            count += 1
+            if count >= self.maxBatchSize:
+                count = 0
+                await asyncio.sleep(0)
+            try:
+                sample = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+
+    def _recordUpdate(self) -> None:
+        timestamp = self.odometry.getTimestamp()
+        history = self._history
+        if timestamp is None or (history and history[-1][0] == timestamp):
+            return
+
+        pose = self.odometry.getPose()
+        history.append((timestamp, pose))
+
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(pose)
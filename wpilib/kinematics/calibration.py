@@ -0,0 +1,216 @@
+"""Calibration of swerve drive kinematics from logged odometry.
+
+The module locations passed to :class:`SwerveDriveKinematics` usually come
+from CAD, and wheel wear changes the distance travelled per encoder count.
+:func:`calibrate_kinematics` fits the location of each module and a scale
+for the distances reported by its encoder, from module positions logged
+alongside ground truth poses of the robot.
+"""
+
+import typing
+
+import numpy as np
+
+from ..geometry import Pose2d, Pose2dArray, Rotation2d, Translation2d
+from .replay import replay_positions
+from .swerve import SwerveDriveKinematics
+
+__all__ = ("CalibrationResult", "calibrate_kinematics")
+
+
+class CalibrationResult(typing.NamedTuple):
+    """The fitted kinematics and wheel scales of a swerve drive."""
+
+    #: The kinematics with the fitted module locations.
+    kinematics: SwerveDriveKinematics
+    #: The scale of the distance reported by each module's encoder, such
+    #: that the distance travelled is the reported distance times the scale.
+    scales: np.ndarray
+    #: The RMS error, in meters, of the odometry's motion over each window
+    #: of ``window`` samples: the difference between the replayed and the
+    #: true translation over the window, in the robot's frame at its start.
+    #: This is not the absolute error of the replayed poses, and depends on
+    #: the ``window`` passed to :func:`calibrate_kinematics`.
+    error: float
+
+
+def _fit_linear(
+    twists: np.ndarray, deltas: np.ndarray, cos: np.ndarray, sin: np.ndarray
+) -> np.ndarray:
+    """Fits each module in closed form from the twists between samples.
+
+    A module at (x, y) moves by (dx - dtheta * y, dy + dtheta * x) in the
+    robot's frame for a twist (dx, dy, dtheta), in a constant direction,
+    so its scaled encoder delta satisfies, linearly in (scale, x, y)::
+
+        scale * delta * cos + dtheta * y = dx
+        scale * delta * sin - dtheta * x = dy
+
+    :returns: An (m, 3) array of the scale, x and y of each module.
+    """
+    dx = twists[:, 0]
+    dy = twists[:, 1]
+    dtheta = twists[:, 2]
+    zeros = np.zeros_like(dtheta)
+    targets = np.concatenate((dx, dy))
+    fits = []
+    for j in range(deltas.shape[1]):
+        design = np.concatenate(
+            (
+                np.column_stack((deltas[:, j] * cos[:, j], zeros, dtheta)),
+                np.column_stack((deltas[:, j] * sin[:, j], -dtheta, zeros)),
+            )
+        )
+        fit, _, rank, _ = np.linalg.lstsq(design, targets, rcond=None)
+        assert (
+            rank == 3
+        ), "The log must include driving and turning to calibrate each module"
+        fits.append(fit)
+    return np.array(fits)
+
+
+def calibrate_kinematics(
+    gyroAngles: np.ndarray,
+    moduleDistances: np.ndarray,
+    moduleAngles: np.ndarray,
+    poses: np.ndarray,
+    window: int = 50,
+    iterations: int = 10,
+) -> CalibrationResult:
+    """Fits the module locations and wheel scales of a swerve drive.
+
+    The fit has two stages. Each module is first fitted in closed form to
+    the motion between consecutive ground truth poses, which is exact for
+    noiseless logs of constant velocity steps. The fit is then refined by
+    Levenberg-Marquardt iterations that minimize both the error of the
+    motion of each module and the error of the odometry replayed over the
+    whole log with :func:`.replay_positions`, measured over windows of
+    samples. The odometry error alone hardly depends on the location of
+    each module, so the motion of the modules keeps the fit well posed.
+
+    The log must include both driving and turning.
+
+    :param gyroAngles: The n angles reported by the gyroscope, in radians.
+
+    :param moduleDistances: An (n, m) array of the distances reported by
+        each of the m modules.
+
+    :param moduleAngles: An (n, m) array of the module angles, in radians.
+
+    :param poses: An (n, 3) array of the ground truth x, y and heading of
+        the robot at each sample, with the heading in radians.
+
+    :param window: The number of samples over which the odometry error is
+        measured, both in the fit and in the returned
+        :attr:`CalibrationResult.error`. Longer windows weight the drift of
+        the odometry more, but are more sensitive to noise.
+
+    :param iterations: The maximum number of refinement iterations.
+        The refinement is skipped if this is zero.
+    """
+    gyro_angles = np.asarray(gyroAngles, dtype=float)
+    distances = np.asarray(moduleDistances, dtype=float)
+    module_angles = np.asarray(moduleAngles, dtype=float)
+    poses = np.asarray(poses, dtype=float)
+    num_samples, num_modules = distances.shape
+    assert (
+        poses.shape == (num_samples, 3) and len(gyro_angles) == num_samples
+    ), "Every sample requires a gyro angle, module positions and a pose"
+    assert 0 < window < num_samples, "The window must be shorter than the log"
+
+    truth = Pose2dArray.fromArray(poses)
+    twists = truth[:-1].log(truth[1:])
+    deltas = np.diff(distances, axis=0)
+    module_cos = np.cos(module_angles[1:])
+    module_sin = np.sin(module_angles[1:])
+    fit = _fit_linear(twists, deltas, module_cos, module_sin)
+    # Order the parameters as scales, then module locations.
+    params = fit.T.reshape(-1)
+
+    x, y, theta = poses[0]
+    initial_pose = Pose2d(x, y, Rotation2d(theta))
+    heading = poses[:-window, 2]
+    cos = np.cos(heading)
+    sin = np.sin(heading)
+
+    def relative_motion(translations: np.ndarray) -> np.ndarray:
+        """The motion over each window, in the robot's frame at its start."""
+        motion = translations[window:] - translations[:-window]
+        return np.concatenate(
+            (
+                cos * motion[:, 0] + sin * motion[:, 1],
+                cos * motion[:, 1] - sin * motion[:, 0],
+            )
+        )
+
+    true_motion = relative_motion(poses[:, :2])
+    # The errors over a window accumulate the noise of every step in it.
+    window_weight = 1 / np.sqrt(window)
+
+    def unpack(params: np.ndarray):
+        scales, xs, ys = params.reshape(3, num_modules)
+        kinematics = SwerveDriveKinematics(
+            *(Translation2d(xs[j], ys[j]) for j in range(num_modules))
+        )
+        return kinematics, scales, xs, ys
+
+    def residuals(params: np.ndarray) -> np.ndarray:
+        kinematics, scales, xs, ys = unpack(params)
+        # The motion of each module between samples, as in _fit_linear.
+        dtheta = twists[:, 2, None]
+        scaled_deltas = deltas * scales
+        module_errors = (
+            scaled_deltas * module_cos - (twists[:, 0, None] - dtheta * ys),
+            scaled_deltas * module_sin - (twists[:, 1, None] + dtheta * xs),
+        )
+        replayed = replay_positions(
+            kinematics, gyro_angles, distances * scales, module_angles, initial_pose
+        )
+        odometry_errors = relative_motion(replayed[:, :2]) - true_motion
+        return np.concatenate(
+            (
+                module_errors[0].reshape(-1),
+                module_errors[1].reshape(-1),
+                window_weight * odometry_errors,
+            )
+        )
+
+    error = residuals(params)
+    cost = error @ error
+    damping = 1e-3
+    for _ in range(iterations):
+        # Forward difference Jacobian, one replay per parameter.
+        steps = np.diag(1e-6 * np.maximum(np.abs(params), 1.0))
+        jacobian = np.column_stack(
+            [(residuals(params + step) - error) / step.sum() for step in steps]
+        )
+        normal = jacobian.T @ jacobian
+        gradient = jacobian.T @ error
+        # Parameters that don't affect the odometry have a zero diagonal.
+        scaling = np.maximum(np.diag(normal), 1e-12 * np.trace(normal))
+
+        while damping < 1e10:
+            candidate = params - np.linalg.solve(
+                normal + damping * np.diag(scaling), gradient
+            )
+            candidate_error = residuals(candidate)
+            candidate_cost = candidate_error @ candidate_error
+            if candidate_cost < cost:
+                damping /= 10
+                break
+            damping *= 10
+        else:
+            break
+
+        converged = cost - candidate_cost <= 1e-12 * cost
+        params, error, cost = candidate, candidate_error, candidate_cost
+        if converged:
+            break
+
+    kinematics, scales, _, _ = unpack(params)
+    odometry_errors = error[-2 * (num_samples - window) :] / window_weight
+    return CalibrationResult(
+        kinematics,
+        scales.copy(),
+        float(np.sqrt(odometry_errors @ odometry_errors / (num_samples - window))),
+    )
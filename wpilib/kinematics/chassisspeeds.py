@@ -1,6 +1,12 @@
+import struct
 import typing
+from typing import Optional, Union
 
-from ..geometry import Rotation2d
+import numpy as np
+
+from ..geometry import Rotation2d, Rotation2dArray
+
+__all__ = ("ChassisSpeeds", "field_to_robot_speeds", "robot_to_field_speeds")
 
 
 class ChassisSpeeds(typing.NamedTuple):
@@ -24,6 +30,27 @@ class ChassisSpeeds(typing.NamedTuple):
     #: Represents the angular velocity of the robot frame. (CCW is +)
     omega: float = 0
 
+    #: The binary layout of packed chassis speeds: vx, vy and omega.
+    _packer = struct.Struct("<3d")
+    #: The size of packed chassis speeds in bytes.
+    packedSize = _packer.size
+    #: The NumPy dtype of packed arrays of chassis speeds, with the same
+    #: layout as :meth:`toBytes`.
+    dtype = np.dtype([("vx", "<f8"), ("vy", "<f8"), ("omega", "<f8")])
+
+    def toBytes(self) -> bytes:
+        """Packs the chassis speeds into :attr:`packedSize` bytes."""
+        return self._packer.pack(*self)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the chassis speeds into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, *self)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "ChassisSpeeds":
+        """Unpacks chassis speeds packed by :meth:`toBytes` or :meth:`packInto`."""
+        return cls(*cls._packer.unpack_from(buffer, offset))
+
     @classmethod
     def fromFieldRelativeSpeeds(
         cls, vx: float, vy: float, omega: float, robotAngle: Rotation2d
@@ -51,3 +78,68 @@ class ChassisSpeeds(typing.NamedTuple):
             -vx * robotAngle.sin + vy * robotAngle.cos,
             omega,
         )
+
+
+_Headings = Union[Rotation2dArray, Rotation2d, np.ndarray]
+
+
+def _heading_components(robotAngles: _Headings):
+    """Returns the cosines and sines of the headings, as arrays or floats."""
+    if isinstance(robotAngles, (Rotation2dArray, Rotation2d)):
+        return robotAngles.cos, robotAngles.sin
+    angles = np.asarray(robotAngles, dtype=float)
+    return np.cos(angles), np.sin(angles)
+
+
+def _rotate_speeds(
+    speeds: np.ndarray, cos, sin, out: Optional[np.ndarray]
+) -> np.ndarray:
+    speeds = np.asarray(speeds, dtype=float)
+    vx = speeds[:, 0]
+    vy = speeds[:, 1]
+    if out is None:
+        out = np.empty_like(speeds)
+    # Compute both components before writing, as out may be speeds.
+    out[:, 0], out[:, 1] = vx * cos - vy * sin, vx * sin + vy * cos
+    if out is not speeds:
+        out[:, 2] = speeds[:, 2]
+    return out
+
+
+def field_to_robot_speeds(
+    speeds: np.ndarray, robotAngles: _Headings, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Converts many field-relative speeds into robot-relative speeds.
+
+    This is the array equivalent of :meth:`ChassisSpeeds.fromFieldRelativeSpeeds`,
+    and the result can be passed directly to
+    :meth:`.SwerveDriveKinematics.toModuleVelocities`.
+
+    :param speeds: An (n, 3) array of field-relative (vx, vy, omega) rows.
+
+    :param robotAngles: The heading of the robot for each row, either as a
+        Rotation2dArray, whose cosines and sines are used without any
+        trigonometry, or as an array of angles in radians. A single
+        Rotation2d applies the same heading to every row.
+
+    :param out: An optional (n, 3) array to write the result to, which may
+        be ``speeds`` itself to convert in place.
+
+    :returns: An (n, 3) array of robot-relative (vx, vy, omega) rows.
+    """
+    cos, sin = _heading_components(robotAngles)
+    return _rotate_speeds(speeds, cos, -sin, out)
+
+
+def robot_to_field_speeds(
+    speeds: np.ndarray, robotAngles: _Headings, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Converts many robot-relative speeds into field-relative speeds.
+
+    This is the inverse of :func:`field_to_robot_speeds`, and takes the
+    same arguments.
+
+    :returns: An (n, 3) array of field-relative (vx, vy, omega) rows.
+    """
+    cos, sin = _heading_components(robotAngles)
+    return _rotate_speeds(speeds, cos, sin, out)
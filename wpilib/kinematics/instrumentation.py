@@ -0,0 +1,294 @@
+"""Opt-in latency and allocation instrumentation for kinematics and odometry.
+
+Nothing is measured until an :class:`Instrumentation` is enabled, at which
+point the instrumented methods are wrapped with timing code. Disabling it
+restores the original methods, so there is no overhead when it is not in use.
+"""
+
+import bisect
+import functools
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .swerve import SwerveDriveKinematics, SwerveDriveOdometry
+
+__all__ = ("CallStats", "Instrumentation")
+
+#: Default upper bounds of the timing histogram buckets, in seconds.
+DEFAULT_BUCKETS = (
+    50e-6,
+    100e-6,
+    200e-6,
+    500e-6,
+    1e-3,
+    2e-3,
+    5e-3,
+    10e-3,
+    20e-3,
+)
+
+_active: Optional["Instrumentation"] = None
+
+
+class CallStats:
+    """Timing statistics for calls to a single method."""
+
+    __slots__ = ("buckets", "counts", "count", "total", "min", "max", "alloc_bytes")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        :param buckets: The upper bounds of the histogram buckets in seconds,
+                        in ascending order. Calls slower than the last bound
+                        are counted in an extra overflow bucket.
+        """
+        #: Upper bounds of the histogram buckets, in seconds.
+        self.buckets = tuple(buckets)
+        self.clear()
+
+    def clear(self) -> None:
+        """Clears the recorded statistics."""
+        #: Number of calls in each bucket, with a trailing overflow bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        #: Number of calls recorded.
+        self.count = 0
+        #: Total time spent in the calls, in seconds.
+        self.total = 0.0
+        #: Duration of the fastest call, in seconds.
+        self.min = float("inf")
+        #: Duration of the slowest call, in seconds.
+        self.max = 0.0
+        #: Total bytes allocated by the calls, if allocations are traced.
+        self.alloc_bytes = 0
+
+    def record(self, elapsed: float, alloc_bytes: int = 0) -> None:
+        """Records the duration of a single call."""
+        self.counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+        self.count += 1
+        self.total += elapsed
+        if elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.alloc_bytes += alloc_bytes
+
+    def _buckets(self):
+        """Iterates over the bounded buckets as (upper bound, count) pairs."""
+        counts = self.counts
+        for i, bound in enumerate(self.buckets):
+            yield bound, counts[i]
+
+    @property
+    def mean(self) -> float:
+        """The mean duration of the calls, in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Returns an upper bound on the given percentile of the call durations.
+
+        This is the upper bound of the histogram bucket the percentile falls
+        in, or the slowest call if it falls in the overflow bucket.
+
+        :param q: The percentile, between 0 and 100.
+        """
+        if not self.count:
+            return 0.0
+        threshold = self.count * q / 100
+        seen = 0
+        for bound, count in self._buckets():
+            seen += count
+            if seen >= threshold:
+                return min(bound, self.max)
+        return self.max
+
+    def asDict(self) -> Dict[str, float]:
+        """Returns the statistics as a flat dictionary of numbers."""
+        result = {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p95": self.percentile(95),
+            "allocBytes": self.alloc_bytes,
+        }
+        for bound, count in self._buckets():
+            result[f"le{bound * 1e6:g}us"] = count
+        result["overflow"] = self.counts[-1]
+        return result
+
+
+class Instrumentation:
+    """Measures how long kinematics and odometry calls take.
+
+    Only one instrumentation can be enabled at a time. It can be used as a
+    context manager::
+
+        with Instrumentation() as instrumentation:
+            ...
+        if instrumentation.isOverBudget("SwerveDriveOdometry.updateWithTime", 0.1):
+            ...
+    """
+
+    #: The instrumented methods, as (class, method name) pairs.
+    targets: Tuple[Tuple[type, str], ...] = (
+        (SwerveDriveKinematics, "toSwerveModuleStates"),
+        (SwerveDriveKinematics, "toChassisSpeeds"),
+        (SwerveDriveOdometry, "updateWithTime"),
+        (SwerveDriveOdometry, "updateWithPositions"),
+        (SwerveDriveOdometry, "updateWithTimestamps"),
+        (SwerveDriveOdometry, "addGyroSample"),
+        (SwerveDriveOdometry, "addModuleSample"),
+    )
+
+    def __init__(
+        self,
+        period: float = 0.02,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        traceAllocations: bool = False,
+    ):
+        """
+        :param period: The control loop period in seconds, used for budgets.
+        :param buckets: The upper bounds of the timing histogram buckets.
+        :param traceAllocations: Whether to use tracemalloc to count the peak
+                                 bytes allocated by each call. This is
+                                 considerably slower. On Python 3.9 and later
+                                 this resets the tracemalloc peak, so it
+                                 can't be combined with other measurements
+                                 of the peak.
+        """
+        self.period = period
+        self.traceAllocations = traceAllocations
+        self.stats: Dict[str, CallStats] = {
+            self._name(cls, name): CallStats(buckets) for cls, name in self.targets
+        }
+        self._originals: Dict[Tuple[type, str], Callable] = {}
+        self._started_tracemalloc = False
+        # The peak traced memory of each traced call in progress, outermost
+        # first, as instrumented calls can be nested.
+        self._peaks: List[int] = []
+
+    @staticmethod
+    def _name(cls: type, name: str) -> str:
+        return f"{cls.__name__}.{name}"
+
+    def enable(self) -> None:
+        """Starts measuring the instrumented methods."""
+        global _active
+        if _active is self:
+            return
+        if _active is not None:
+            raise RuntimeError("another Instrumentation is already enabled")
+
+        if self.traceAllocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        for cls, name in self.targets:
+            original = cls.__dict__[name]
+            self._originals[cls, name] = original
+            setattr(cls, name, self._wrap(original, self.stats[self._name(cls, name)]))
+        _active = self
+
+    def disable(self) -> None:
+        """Stops measuring, restoring the original methods."""
+        global _active
+        if _active is not self:
+            return
+
+        for (cls, name), original in self._originals.items():
+            setattr(cls, name, original)
+        self._originals.clear()
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        _active = None
+
+    def __enter__(self) -> "Instrumentation":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def _wrap(self, func: Callable, stats: CallStats) -> Callable:
+        perf_counter = time.perf_counter
+        record = stats.record
+
+        if not self.traceAllocations:
+
+            @functools.wraps(func)
+            def timed(*args, **kwargs):
+                start = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    record(perf_counter() - start)
+
+            return timed
+
+        get_traced_memory = tracemalloc.get_traced_memory
+        reset_peak = getattr(tracemalloc, "reset_peak", None)
+        peaks = self._peaks
+
+        @functools.wraps(func)
+        def traced(*args, **kwargs):
+            before, peak = get_traced_memory()
+            if reset_peak is not None:
+                # Resetting the peak loses the peak of any enclosing call so
+                # far, so keep it, and combine it with ours when we return.
+                if peaks:
+                    peaks[-1] = max(peaks[-1], peak)
+                reset_peak()
+            peaks.append(before)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                current, peak = get_traced_memory()
+                if reset_peak is None:
+                    peak = current
+                peak = max(peaks.pop(), peak)
+                if peaks:
+                    peaks[-1] = max(peaks[-1], peak)
+                record(elapsed, max(peak - before, 0))
+
+        return traced
+
+    def reset(self) -> None:
+        """Clears all recorded statistics."""
+        for stats in self.stats.values():
+            stats.clear()
+
+    def getBudgetFraction(self, name: str) -> float:
+        """Returns the slowest call of a method as a fraction of the period.
+
+        :param name: The method name, such as ``"SwerveDriveOdometry.updateWithTime"``.
+        """
+        return self.stats[name].max / self.period
+
+    def isOverBudget(self, name: str, share: float) -> bool:
+        """Returns whether any call of a method exceeded its share of the period.
+
+        :param name: The method name, such as ``"SwerveDriveOdometry.updateWithTime"``.
+        :param share: The fraction of the period the method may use.
+        """
+        return self.getBudgetFraction(name) > share
+
+    def asDict(self) -> Dict[str, Dict[str, float]]:
+        """Returns the statistics of each method as nested dictionaries."""
+        return {name: stats.asDict() for name, stats in self.stats.items()}
+
+    def flatten(self, prefix: str = "") -> Dict[str, float]:
+        """Returns the statistics as flat key/value pairs.
+
+        The keys are of the form ``prefix + "SwerveDriveOdometry.updateWithTime/mean"``,
+        suitable for publishing as individual NetworkTables entries.
+        """
+        return {
+            f"{prefix}{name}/{key}": value
+            for name, stats in self.stats.items()
+            for key, value in stats.asDict().items()
+        }
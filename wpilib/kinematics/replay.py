@@ -0,0 +1,204 @@
+"""Fast replay of logged swerve module positions into odometry poses.
+
+Replaying a long log through :class:`SwerveDriveOdometry` one update at a
+time is limited by the speed of the Python interpreter. The functions here
+integrate a whole log at once, using a compiled kernel when numba is
+installed, and NumPy otherwise.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+
+from ..geometry import Pose2d
+from .swerve import SwerveDriveKinematics
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
+__all__ = ("NUMBA_AVAILABLE", "replay_positions")
+
+#: Whether numba is installed, so that replay can use a compiled kernel.
+NUMBA_AVAILABLE = numba is not None
+
+
+def _integrate_loop(
+    forward_kinematics: np.ndarray,
+    headings: np.ndarray,
+    distances: np.ndarray,
+    cos: np.ndarray,
+    sin: np.ndarray,
+    x: float,
+    y: float,
+    out_x: np.ndarray,
+    out_y: np.ndarray,
+) -> None:
+    """Integrates module positions into translations one step at a time.
+
+    This is written with scalar operations only, so that numba can compile
+    it into a single native loop.
+    """
+    num_samples, num_modules = distances.shape
+    out_x[0] = x
+    out_y[0] = y
+    for i in range(1, num_samples):
+        dx = 0.0
+        dy = 0.0
+        for j in range(num_modules):
+            delta = distances[i, j] - distances[i - 1, j]
+            vx = delta * cos[i, j]
+            vy = delta * sin[i, j]
+            dx += forward_kinematics[0, 2 * j] * vx
+            dx += forward_kinematics[0, 2 * j + 1] * vy
+            dy += forward_kinematics[1, 2 * j] * vx
+            dy += forward_kinematics[1, 2 * j + 1] * vy
+
+        previous = headings[i - 1]
+        dtheta = headings[i] - previous
+        dtheta = math.atan2(math.sin(dtheta), math.cos(dtheta))
+        if abs(dtheta) < 1e-9:
+            s = 1.0 - dtheta * dtheta / 6
+            c = 0.5 * dtheta
+        else:
+            s = math.sin(dtheta) / dtheta
+            c = 2.0 * math.sin(0.5 * dtheta) ** 2 / dtheta
+
+        tx = dx * s - dy * c
+        ty = dx * c + dy * s
+        cos_previous = math.cos(previous)
+        sin_previous = math.sin(previous)
+        x += tx * cos_previous - ty * sin_previous
+        y += tx * sin_previous + ty * cos_previous
+        out_x[i] = x
+        out_y[i] = y
+
+
+if numba is not None:  # pragma: no cover
+    _integrate_kernel = numba.njit(cache=True)(_integrate_loop)
+else:
+    _integrate_kernel = None
+
+
+def _integrate_vectorized(
+    forward_kinematics: np.ndarray,
+    headings: np.ndarray,
+    distances: np.ndarray,
+    cos: np.ndarray,
+    sin: np.ndarray,
+    x: float,
+    y: float,
+    out_x: np.ndarray,
+    out_y: np.ndarray,
+) -> None:
+    """Integrates module positions into translations with NumPy.
+
+    The headings come from the gyro rather than the previous pose, so the
+    change in translation of every step is known up front, and only a
+    cumulative sum is sequential.
+    """
+    num_samples = len(distances)
+    out_x[0] = x
+    out_y[0] = y
+    if num_samples == 1:
+        return
+    deltas = np.diff(distances, axis=0)
+    vectors = np.stack((deltas * cos[1:], deltas * sin[1:]), axis=-1)
+    chassis = vectors.reshape(num_samples - 1, -1) @ forward_kinematics[:2].T
+    dx = chassis[:, 0]
+    dy = chassis[:, 1]
+
+    previous = headings[:-1]
+    dtheta = np.diff(headings)
+    dtheta = np.arctan2(np.sin(dtheta), np.cos(dtheta))
+    small = np.abs(dtheta) < 1e-9
+    safe_dtheta = np.where(small, 1.0, dtheta)
+    s = np.where(small, 1.0 - dtheta * dtheta / 6, np.sin(dtheta) / safe_dtheta)
+    c = np.where(small, 0.5 * dtheta, 2.0 * np.sin(0.5 * dtheta) ** 2 / safe_dtheta)
+
+    tx = dx * s - dy * c
+    ty = dx * c + dy * s
+    cos_previous = np.cos(previous)
+    sin_previous = np.sin(previous)
+    np.cumsum(tx * cos_previous - ty * sin_previous, out=out_x[1:])
+    np.cumsum(tx * sin_previous + ty * cos_previous, out=out_y[1:])
+    out_x[1:] += x
+    out_y[1:] += y
+
+
+def replay_positions(
+    kinematics: SwerveDriveKinematics,
+    gyroAngles: np.ndarray,
+    moduleDistances: np.ndarray,
+    moduleAngles: np.ndarray,
+    initialPose: Optional[Pose2d] = None,
+    compiled: Optional[bool] = None,
+) -> np.ndarray:
+    """Integrates a log of module positions into robot poses.
+
+    This gives the same poses as calling
+    :meth:`SwerveDriveOdometry.updateWithPositions` once per sample,
+    starting from the first sample.
+
+    :param kinematics: The swerve drive kinematics for your drivetrain.
+
+    :param gyroAngles: The n angles reported by the gyroscope, in radians.
+
+    :param moduleDistances: An (n, m) array of the distances travelled by
+        each of the m modules, in the same order as the kinematics.
+
+    :param moduleAngles: An (n, m) array of the module angles, in radians.
+
+    :param initialPose: The pose of the robot at the first sample.
+
+    :param compiled: Whether to use the compiled kernel. By default it is
+        used when numba is installed.
+
+    :returns: An (n, 3) array of the x, y and heading of the robot at
+              each sample, with the heading in radians.
+    """
+    if initialPose is None:
+        initialPose = Pose2d()
+    if compiled is None:
+        compiled = NUMBA_AVAILABLE
+    elif compiled and not NUMBA_AVAILABLE:
+        raise ImportError("numba is required for compiled odometry replay")
+
+    gyro_angles = np.asarray(gyroAngles, dtype=float)
+    distances = np.ascontiguousarray(moduleDistances, dtype=float)
+    module_angles = np.asarray(moduleAngles, dtype=float)
+    num_samples = len(gyro_angles)
+    assert distances.shape == (
+        num_samples,
+        kinematics.num_modules,
+    ), "Module distances must have one column per module and a row per sample"
+    assert (
+        module_angles.shape == distances.shape
+    ), "Module angles must have the same shape as module distances"
+
+    poses = np.empty((num_samples, 3))
+    if num_samples == 0:
+        return poses
+
+    headings = gyro_angles - gyro_angles[0] + initialPose.rotation.value
+    out_x = np.empty(num_samples)
+    out_y = np.empty(num_samples)
+    integrate = _integrate_kernel if compiled else _integrate_vectorized
+    integrate(
+        kinematics.forward_kinematics,
+        headings,
+        distances,
+        np.cos(module_angles),
+        np.sin(module_angles),
+        float(initialPose.translation.x),
+        float(initialPose.translation.y),
+        out_x,
+        out_y,
+    )
+
+    poses[:, 0] = out_x
+    poses[:, 1] = out_y
+    poses[:, 2] = np.arctan2(np.sin(headings), np.cos(headings))
+    return poses
@@ -0,0 +1,221 @@
+"""Sharing the robot pose between processes through shared memory.
+
+A single :class:`SharedPoseWriter`, usually fed by odometry, publishes
+each new pose into a ring buffer in shared memory. Any number of
+:class:`SharedPoseReader` in other processes can read the latest pose
+and recent history without locks, using a sequence counter to detect
+and retry reads that overlap a write.
+"""
+
+import os
+import struct
+import sys
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..geometry import Pose2d, Pose2dArray, Rotation2d
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # pragma: no cover
+    # Shared memory requires Python 3.8.
+    resource_tracker = shared_memory = None
+
+__all__ = ("SharedPoseWriter", "SharedPoseReader")
+
+# The header holds the sequence counter, which is odd while a write is in
+# progress, the number of poses ever written, and the capacity of the ring.
+_header = struct.Struct("<QQQ")
+_sequence = struct.Struct("<Q")
+_record = struct.Struct("<4d")
+_record_dtype = np.dtype(
+    [("timestamp", "<f8"), ("x", "<f8"), ("y", "<f8"), ("theta", "<f8")]
+)
+
+#: Whether shared memory blocks are registered with the resource tracker,
+#: which removes them when the process that opened them exits.
+_TRACKED = sys.version_info < (3, 13) and os.name == "posix"
+
+
+def _open(name: Optional[str], create: bool = False, size: int = 0):
+    """Opens a shared memory block that is not removed when a process exits.
+
+    The writer removes the block when it is closed, so readers in other
+    processes can start and stop independently of it.
+    """
+    if shared_memory is None:  # pragma: no cover
+        raise ImportError("Shared pose publishing requires Python 3.8 or newer")
+    if sys.version_info >= (3, 13):  # pragma: no cover
+        return shared_memory.SharedMemory(name, create, size, track=False)
+    memory = shared_memory.SharedMemory(name, create, size)
+    if _TRACKED:
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+class SharedPoseWriter:
+    """Publishes poses into a shared memory ring buffer.
+
+    There must only be one writer for each shared memory block, which is
+    removed when the writer is closed. To publish
+    every odometry update, register the writer with the odometry::
+
+        writer = SharedPoseWriter("robot_pose")
+        odometry.addListener(writer.publish)
+    """
+
+    __slots__ = ("historySize", "_memory", "_buffer", "_sequence", "_count")
+
+    def __init__(self, name: Optional[str] = None, historySize: int = 64):
+        """Creates a new shared memory block for the poses.
+
+        :param name: The name of the shared memory block, which readers use
+                     to find it. A unique name is generated if not given.
+
+        :param historySize: The number of recent poses to keep.
+        """
+        assert historySize > 0, "History size must be positive"
+        self.historySize = historySize
+        self._memory = _open(
+            name, create=True, size=_header.size + historySize * _record.size
+        )
+        self._buffer = self._memory.buf
+        self._sequence = 0
+        self._count = 0
+        _header.pack_into(self._buffer, 0, 0, 0, historySize)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self._memory.name
+
+    def publish(self, timestamp: float, pose: Pose2d) -> None:
+        """Publishes a new pose, replacing the oldest pose in the history."""
+        buffer = self._buffer
+        sequence = self._sequence
+        count = self._count
+        translation = pose.translation
+
+        _sequence.pack_into(buffer, 0, sequence + 1)
+        _record.pack_into(
+            buffer,
+            _header.size + count % self.historySize * _record.size,
+            timestamp,
+            translation.x,
+            translation.y,
+            pose.rotation.value,
+        )
+        _header.pack_into(buffer, 0, sequence + 2, count + 1, self.historySize)
+
+        self._sequence = sequence + 2
+        self._count = count + 1
+
+    def close(self) -> None:
+        """Closes the shared memory block, and removes it.
+
+        Readers that are still attached can keep reading the last poses.
+        """
+        memory = self._memory
+        self._buffer = None
+        memory.close()
+        if _TRACKED:
+            # Unlinking unregisters the block, so register it again first.
+            resource_tracker.register(memory._name, "shared_memory")
+        memory.unlink()
+
+    def __enter__(self) -> "SharedPoseWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class SharedPoseReader:
+    """Reads poses published by a :class:`SharedPoseWriter`.
+
+    Reads never block the writer. If the writer publishes while a read is
+    in progress, the read is retried.
+    """
+
+    __slots__ = ("maxRetries", "_memory", "_buffer", "_history_size")
+
+    def __init__(self, name: str, maxRetries: int = 1000):
+        """Attaches to an existing shared memory block.
+
+        :param name: The name of the shared memory block of the writer.
+
+        :param maxRetries: The number of times to retry a read that
+            overlaps a write before giving up.
+        """
+        self.maxRetries = maxRetries
+        self._memory = _open(name)
+        self._buffer = self._memory.buf
+        self._history_size = _header.unpack_from(self._buffer)[2]
+
+    def _read(self, read_records):
+        """Calls read_records with the pose count until it isn't torn by a write."""
+        buffer = self._buffer
+        for _ in range(self.maxRetries):
+            sequence, count, _ = _header.unpack_from(buffer)
+            if not sequence % 2:
+                result = read_records(count)
+                if _sequence.unpack_from(buffer)[0] == sequence:
+                    return result
+            # Let the writer finish, in case it is in this process.
+            time.sleep(0)
+        raise RuntimeError("Timed out waiting for the shared pose writer")
+
+    def getLatest(self) -> Optional[Tuple[float, Pose2d]]:
+        """Returns the timestamp and pose most recently published,
+        or None if no poses have been published yet.
+        """
+        buffer = self._buffer
+        history_size = self._history_size
+
+        def read_latest(count: int):
+            if not count:
+                return None
+            offset = _header.size + (count - 1) % history_size * _record.size
+            return _record.unpack_from(buffer, offset)
+
+        record = self._read(read_latest)
+        if record is None:
+            return None
+        timestamp, x, y, theta = record
+        return timestamp, Pose2d(x, y, Rotation2d(theta))
+
+    def getHistory(self) -> Tuple[np.ndarray, Pose2dArray]:
+        """Returns the recently published poses, oldest first.
+
+        :returns: The timestamps of the poses, and the poses.
+        """
+        buffer = self._buffer
+        history_size = self._history_size
+        ring = np.frombuffer(
+            buffer, dtype=_record_dtype, count=history_size, offset=_header.size
+        )
+
+        def read_history(count: int):
+            if count <= history_size:
+                return ring[:count].copy()
+            start = count % history_size
+            return np.concatenate((ring[start:], ring[:start]))
+
+        records = self._read(read_history)
+        poses = Pose2dArray.fromArray(
+            np.column_stack((records["x"], records["y"], records["theta"]))
+        )
+        return records["timestamp"], poses
+
+    def close(self) -> None:
+        """Detaches from the shared memory block."""
+        self._buffer = None
+        self._memory.close()
+
+    def __enter__(self) -> "SharedPoseReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
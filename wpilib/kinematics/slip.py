@@ -0,0 +1,125 @@
+import numpy as np
+
+__all__ = ("SlipDetector",)
+
+
+class SlipDetector:
+    """Detects wheel slip from the residuals of the forward kinematics.
+
+    Each module's residual is the difference between its measured velocity
+    and the velocity that the fitted chassis speed gives it, as returned by
+    :meth:`.SwerveDriveKinematics.toChassisSpeedsWithResidual`. The detector
+    keeps an exponentially weighted mean and variance of the magnitude of
+    each module's residual as a baseline, and flags a module as slipping
+    when its residual rises well above the baseline::
+
+        detector = SlipDetector(kinematics.num_modules)
+
+        speeds, residual = kinematics.toChassisSpeedsWithResidual(*states)
+        detector.update(residual)
+        odometry.updateWithTime(now, gyroAngle, *states,
+                                weights=detector.getWeights())
+
+    Samples from slipping modules are not added to the baseline, so a
+    sustained slip does not become the new normal.
+    """
+
+    __slots__ = (
+        "alpha",
+        "threshold",
+        "minResidual",
+        "slipWeight",
+        "_mean",
+        "_variance",
+        "_slipping",
+    )
+
+    def __init__(
+        self,
+        numModules: int,
+        alpha: float = 0.05,
+        threshold: float = 4.0,
+        minResidual: float = 0.1,
+        slipWeight: float = 0.01,
+    ):
+        """
+        :param numModules: The number of swerve modules.
+
+        :param alpha: The smoothing factor of the baseline, between 0 and 1.
+            Larger values adapt to changes in the residuals faster.
+
+        :param threshold: The number of standard deviations above the
+            baseline mean at which a module is considered to be slipping.
+
+        :param minResidual: The smallest residual above the baseline mean,
+            in m/s, at which a module is considered to be slipping. This
+            prevents false detections when the baseline is very steady.
+
+        :param slipWeight: The weight given to slipping modules by
+            :meth:`getWeights`. This is positive so that the forward
+            kinematics remains solvable if most modules are slipping.
+        """
+        assert 0 < alpha <= 1, "Smoothing factor must be between 0 and 1"
+        self.alpha = alpha
+        self.threshold = threshold
+        self.minResidual = minResidual
+        self.slipWeight = slipWeight
+        self._mean = np.zeros(numModules)
+        self._variance = np.zeros(numModules)
+        self._slipping = np.zeros(numModules, dtype=bool)
+
+    def reset(self) -> None:
+        """Forgets the baseline and clears any detected slip."""
+        self._mean.fill(0)
+        self._variance.fill(0)
+        self._slipping.fill(False)
+
+    def update(self, residual: np.ndarray) -> np.ndarray:
+        """Updates the detector with the residuals of a forward kinematics solve.
+
+        :param residual: An (n, 2) array of the residual of each module.
+
+        :returns: Whether each module is slipping. This is an internal array
+                  that is overwritten by the next update.
+        """
+        residual = np.asarray(residual, dtype=float)
+        magnitudes = np.hypot(residual[:, 0], residual[:, 1])
+        mean = self._mean
+        variance = self._variance
+
+        deviation = magnitudes - mean
+        limit = np.maximum(self.threshold * np.sqrt(variance), self.minResidual)
+        slipping = np.greater(deviation, limit, out=self._slipping)
+
+        # Incremental exponentially weighted mean and variance, skipping
+        # modules that are slipping.
+        increment = np.where(slipping, 0.0, self.alpha * deviation)
+        decay = np.where(slipping, 1.0, 1 - self.alpha)
+        variance += deviation * increment
+        variance *= decay
+        mean += increment
+        return slipping
+
+    def isSlipping(self) -> bool:
+        """Returns whether any module was slipping at the last update."""
+        return bool(self._slipping.any())
+
+    def getSlipping(self) -> np.ndarray:
+        """Returns whether each module was slipping at the last update."""
+        return self._slipping.copy()
+
+    def getBaseline(self) -> np.ndarray:
+        """Returns the baseline mean and standard deviation of the magnitude
+        of the residual of each module.
+
+        :returns: An (n, 2) array of the mean and standard deviation.
+        """
+        return np.column_stack((self._mean, np.sqrt(self._variance)))
+
+    def getWeights(self) -> np.ndarray:
+        """Returns weights for the forward kinematics that down-weight the
+        modules that were slipping at the last update.
+
+        See :meth:`.SwerveDriveKinematics.toChassisSpeeds`.
+        """
+        return np.where(self._slipping, self.slipWeight, 1.0)
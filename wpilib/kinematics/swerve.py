@@ -1,6 +1,9 @@
+import itertools
 import math
+import struct
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, Deque, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -15,7 +18,13 @@ from ..geometry import (
 from .chassisspeeds import ChassisSpeeds
 
 
-__all__ = ("SwerveModuleState", "SwerveDriveKinematics", "SwerveDriveOdometry")
+__all__ = (
+    "SwerveModulePosition",
+    "SwerveModuleState",
+    "SwerveModuleStates",
+    "SwerveDriveKinematics",
+    "SwerveDriveOdometry",
+)
 
 
 @dataclass
@@ -29,10 +38,168 @@ class SwerveModuleState:
 
     __slots__ = ("speed", "angle")
 
+    #: The binary layout of a packed module state: the speed and angle in radians.
+    _packer = struct.Struct("<2d")
+    #: The size of a packed module state in bytes.
+    packedSize = _packer.size
+
     def __init__(self, speed: float = 0, angle: Rotation2d = _zero_rotation):
         self.speed = speed
         self.angle = angle
 
+    def toBytes(self) -> bytes:
+        """Packs the module state into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.speed, self.angle.value)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the module state into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, self.speed, self.angle.value)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "SwerveModuleState":
+        """Unpacks a module state packed by :meth:`toBytes` or :meth:`packInto`."""
+        speed, angle = cls._packer.unpack_from(buffer, offset)
+        return cls(speed, Rotation2d(angle))
+
+
+@dataclass
+class SwerveModulePosition:
+    """Represents the position of one swerve module."""
+
+    #: Distance travelled by the wheel of the module.
+    distance: float
+    #: Angle of the module.
+    angle: Rotation2d
+
+    __slots__ = ("distance", "angle")
+
+    #: The binary layout of a packed module position:
+    #: the distance and angle in radians.
+    _packer = struct.Struct("<2d")
+    #: The size of a packed module position in bytes.
+    packedSize = _packer.size
+
+    def __init__(self, distance: float = 0, angle: Rotation2d = _zero_rotation):
+        self.distance = distance
+        self.angle = angle
+
+    def toBytes(self) -> bytes:
+        """Packs the module position into :attr:`packedSize` bytes."""
+        return self._packer.pack(self.distance, self.angle.value)
+
+    def packInto(self, buffer, offset: int = 0) -> None:
+        """Packs the module position into a writable buffer at the given offset."""
+        self._packer.pack_into(buffer, offset, self.distance, self.angle.value)
+
+    @classmethod
+    def fromBytes(cls, buffer, offset: int = 0) -> "SwerveModulePosition":
+        """Unpacks a module position packed by :meth:`toBytes` or :meth:`packInto`."""
+        distance, angle = cls._packer.unpack_from(buffer, offset)
+        return cls(distance, Rotation2d(angle))
+
+
+class SwerveModuleStates:
+    """A fixed-size array of swerve module states.
+
+    The speeds and the cosines and sines of the module angles are stored in
+    parallel NumPy arrays, so that kinematics can read and write the states
+    of every module in place without creating a SwerveModuleState and a
+    Rotation2d per module each control cycle.
+    """
+
+    __slots__ = ("speeds", "cos", "sin", "_vectors")
+
+    #: The NumPy dtype of packed arrays of module states, with the same
+    #: layout as :meth:`SwerveModuleState.toBytes`.
+    dtype = np.dtype([("speed", "<f8"), ("angle", "<f8")])
+
+    def __init__(self, num_modules: int):
+        """Constructs an array of stopped module states facing forward.
+
+        :param num_modules: The number of swerve modules.
+        """
+        #: Speeds of the wheels of the modules.
+        self.speeds = np.zeros(num_modules)
+        #: Cosines of the angles of the modules.
+        self.cos = np.ones(num_modules)
+        #: Sines of the angles of the modules.
+        self.sin = np.zeros(num_modules)
+        self._vectors = np.zeros((num_modules, 2))
+
+    @classmethod
+    def fromStates(cls, *states: SwerveModuleState) -> "SwerveModuleStates":
+        """Creates an array of module states from individual module states."""
+        result = cls(len(states))
+        for i, state in enumerate(states):
+            result[i] = state
+        return result
+
+    def toPacked(self) -> np.ndarray:
+        """Packs the module states into a structured array of :attr:`dtype`.
+
+        The result supports the buffer protocol, so it can be written
+        directly to shared memory or a socket.
+        """
+        packed = np.empty(len(self.speeds), dtype=self.dtype)
+        packed["speed"] = self.speeds
+        packed["angle"] = np.arctan2(self.sin, self.cos)
+        return packed
+
+    @classmethod
+    def fromPacked(cls, buffer) -> "SwerveModuleStates":
+        """Unpacks module states from a buffer packed by :meth:`toPacked`."""
+        packed = np.frombuffer(buffer, dtype=cls.dtype)
+        result = cls(len(packed))
+        result.speeds[:] = packed["speed"]
+        angles = packed["angle"]
+        np.cos(angles, out=result.cos)
+        np.sin(angles, out=result.sin)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.speeds)
+
+    def __getitem__(self, index: int) -> SwerveModuleState:
+        """Returns a copy of the state of the module at the given index."""
+        return SwerveModuleState(
+            float(self.speeds[index]),
+            Rotation2d(float(self.cos[index]), float(self.sin[index])),
+        )
+
+    def __setitem__(self, index: int, state: SwerveModuleState) -> None:
+        """Sets the state of the module at the given index."""
+        self.speeds[index] = state.speed
+        self.cos[index] = state.angle.cos
+        self.sin[index] = state.angle.sin
+
+    def toVectors(self) -> np.ndarray:
+        """Returns the velocity vectors of the modules.
+
+        :returns: An internal (n, 2) array of the x and y components of
+            the velocity of each module. It is overwritten in place by
+            subsequent kinematics calls.
+        """
+        vectors = self._vectors
+        np.multiply(self.speeds, self.cos, out=vectors[:, 0])
+        np.multiply(self.speeds, self.sin, out=vectors[:, 1])
+        return vectors
+
+    def _setFromVectors(self) -> None:
+        """Updates the speeds and angles from the internal velocity vectors."""
+        vectors = self._vectors
+        x = vectors[:, 0]
+        y = vectors[:, 1]
+        speeds = self.speeds
+        cos = self.cos
+        sin = self.sin
+        np.hypot(x, y, out=speeds)
+        # Match Rotation2d(x, y): modules that are not moving face forward.
+        moving = speeds > 1e-6
+        cos.fill(1)
+        sin.fill(0)
+        np.divide(x, speeds, out=cos, where=moving)
+        np.divide(y, speeds, out=sin, where=moving)
+
 
 class SwerveDriveKinematics:
     """Helper class that converts a chassis velocity (dx, dy, and dtheta components)
@@ -53,6 +220,19 @@ class SwerveDriveKinematics:
     We take the Moore-Penrose pseudoinverse of [moduleLocations] and then
     multiply by [moduleStates] to get our chassis speeds.
 
+    The forward kinematics can also weight each module, so that a module
+    that is slipping or has a noisy encoder can be trusted less than the
+    others. The weights can change every cycle; rather than recomputing
+    the pseudoinverse, this sums cached per-module blocks of the normal
+    equations and solves a 3x3 system.
+
+    Modules can be disabled, for example when one fails, and moved at
+    runtime, without constructing new kinematics and losing the state of
+    odometry that uses them. Disabled modules are left out of the forward
+    kinematics. The forward kinematics for each subset of enabled modules
+    is cached, and :meth:`precomputeSubsets` computes them in advance, so
+    that disabling a module mid-match only swaps a matrix.
+
     Forward kinematics is also used for odometry -- determining the
     position of the robot on the field using encoders and a gyro.
     """
@@ -63,8 +243,16 @@ class SwerveDriveKinematics:
         "_inverse_kinematics",
         "forward_kinematics",
         "_prev_cor",
+        "_cor_matrices",
+        "_origin_inverse_kinematics",
+        "_normal_blocks",
+        "_enabled",
+        "_subset_matrices",
     )
 
+    #: The number of centers of rotation to keep inverse kinematics for.
+    MAX_CACHED_CENTERS = 8
+
     def __init__(self, *wheels: Translation2d):
         """Constructs a swerve drive kinematics object.
 
@@ -88,13 +276,127 @@ class SwerveDriveKinematics:
         self.num_modules = len(wheels)
         self._inverse_kinematics = inverse_kinematics
         self.forward_kinematics = np.linalg.pinv(inverse_kinematics)
+        self._enabled = (True,) * len(wheels)
+        # Forward kinematics keyed by which modules are enabled.
+        self._subset_matrices = {self._enabled: self.forward_kinematics}
         self._prev_cor = _identity_translation
+        # Inverse kinematics keyed by center of rotation, least recent first.
+        self._cor_matrices = {_identity_translation: inverse_kinematics}
+        self._origin_inverse_kinematics = inverse_kinematics
+        # The contribution of each module to the normal equations, A_i^T A_i.
+        blocks = inverse_kinematics.reshape(-1, 2, 3)
+        self._normal_blocks = np.einsum("mij,mik->mjk", blocks, blocks).reshape(-1, 9)
+
+    def isModuleEnabled(self, index: int) -> bool:
+        """Returns whether a module is used by the forward kinematics."""
+        return self._enabled[index]
+
+    def getEnabledModules(self) -> Tuple[bool, ...]:
+        """Returns whether each module is used by the forward kinematics."""
+        return self._enabled
+
+    def setModuleEnabled(self, index: int, enabled: bool) -> None:
+        """Enables or disables a module in the forward kinematics.
+
+        The module states passed to the forward kinematics must still
+        include disabled modules, but they are ignored. Inverse kinematics
+        still returns a state for every module.
+
+        :param index: The index of the module, in the order passed to the
+                      constructor.
+        :param enabled: Whether to use the module.
+        """
+        enabled_modules = list(self._enabled)
+        enabled_modules[index] = enabled
+        self.setEnabledModules(enabled_modules)
+
+    def setEnabledModules(self, enabled: Sequence[bool]) -> None:
+        """Sets which modules are used by the forward kinematics.
+
+        This takes constant time if the forward kinematics for the subset
+        of modules has been computed before.
+
+        :param enabled: Whether to use each module. At least two modules
+                        must be enabled.
+        """
+        enabled = tuple(bool(module_enabled) for module_enabled in enabled)
+        assert (
+            len(enabled) == self.num_modules
+        ), "Number of modules must be consistent with number of wheel locations."
+        assert sum(enabled) >= 2, "A swerve drive requires at least two modules"
+        forward_kinematics = self._subset_matrices.get(enabled)
+        if forward_kinematics is None:
+            forward_kinematics = self._subsetForwardKinematics(enabled)
+            self._subset_matrices[enabled] = forward_kinematics
+        self.forward_kinematics = forward_kinematics
+        self._enabled = enabled
+
+    def precomputeSubsets(self, minModules: int = 2) -> None:
+        """Computes the forward kinematics for every subset of modules in
+        advance, so that switching subsets never computes a matrix.
+
+        :param minModules: The smallest number of enabled modules to
+                           compute the forward kinematics for.
+        """
+        num_modules = self.num_modules
+        for num_enabled in range(max(minModules, 2), num_modules + 1):
+            for indices in itertools.combinations(range(num_modules), num_enabled):
+                enabled = tuple(i in indices for i in range(num_modules))
+                if enabled not in self._subset_matrices:
+                    self._subset_matrices[enabled] = self._subsetForwardKinematics(
+                        enabled
+                    )
+
+    def moveModule(self, index: int, location: Translation2d) -> None:
+        """Moves a module to a new location relative to the robot center.
+
+        The inverse kinematics and every cached forward kinematics are
+        updated for the new location.
+
+        :param index: The index of the module, in the order passed to the
+                      constructor.
+        :param location: The new location of the module.
+        """
+        modules = list(self.modules)
+        modules[index] = location
+        self.modules = tuple(modules)
+
+        origin = self._origin_inverse_kinematics.copy()
+        origin[2 * index, 2] = -location.y
+        origin[2 * index + 1, 2] = location.x
+        self._origin_inverse_kinematics = origin
+        normal_blocks = self._normal_blocks.copy()
+        block = origin[2 * index : 2 * index + 2]
+        normal_blocks[index] = (block.T @ block).reshape(-1)
+        self._normal_blocks = normal_blocks
+
+        self._cor_matrices = {_identity_translation: origin}
+        self._inverse_kinematics = self._inverseKinematicsAbout(self._prev_cor)
+        self._subset_matrices = {
+            enabled: self._subsetForwardKinematics(enabled)
+            for enabled in self._subset_matrices
+        }
+        self.forward_kinematics = self._subset_matrices[self._enabled]
+
+    def _subsetForwardKinematics(self, enabled: Tuple[bool, ...]) -> np.ndarray:
+        """Computes the forward kinematics using only the enabled modules.
+
+        This is the pseudoinverse of the inverse kinematics of the enabled
+        modules, with zero columns for the disabled modules. Rather than
+        recomputing the pseudoinverse, the normal equations are summed from
+        the cached per-module blocks.
+        """
+        mask = np.array(enabled, dtype=float)
+        normal = (mask @ self._normal_blocks).reshape(3, 3)
+        transposed = self._origin_inverse_kinematics.T * np.repeat(mask, 2)
+        return np.linalg.solve(normal, transposed)
 
     def toSwerveModuleStates(
         self,
         chassisSpeeds: ChassisSpeeds,
         centerOfRotation: Translation2d = _identity_translation,
-    ) -> List[SwerveModuleState]:
+        out: Optional[SwerveModuleStates] = None,
+    ) -> Union[List[SwerveModuleState], SwerveModuleStates]:
         """Performs inverse kinematics to return the module states from a desired
         chassis velocity.
 
@@ -115,6 +417,9 @@ class SwerveDriveKinematics:
             of the robot and provide a chassis speed that only has a
             dtheta component, the robot will rotate around that corner.
 
+        :param out: If given, the module states are written into this array
+            in place, and it is returned instead of a new list.
+
         :returns: An array containing the module states.
             Use caution because these module states are not normalized.
             Sometimes, a user input may cause one of the module speeds
@@ -124,21 +429,78 @@ class SwerveDriveKinematics:
         prev_cor = self._prev_cor
         inverse_kinematics = self._inverse_kinematics
         if prev_cor is not centerOfRotation and prev_cor != centerOfRotation:
-            cor_y = centerOfRotation.y
-            cor_x = centerOfRotation.x
-            for i, module in enumerate(self.modules):
-                inverse_kinematics[2 * i, 2] = -module.y + cor_y
-                inverse_kinematics[2 * i + 1, 2] = module.x - cor_x
+            inverse_kinematics = self._inverseKinematicsAbout(centerOfRotation)
+            self._inverse_kinematics = inverse_kinematics
             self._prev_cor = centerOfRotation
 
         chassis_vel_vec = np.array(chassisSpeeds)
+        if out is not None:
+            assert (
+                len(out) == self.num_modules
+            ), "Number of modules must be consistent with number of wheel locations."
+            np.matmul(inverse_kinematics, chassis_vel_vec, out=out._vectors.reshape(-1))
+            out._setFromVectors()
+            return out
+
         module_states = inverse_kinematics @ chassis_vel_vec
-        return [
-            SwerveModuleState(math.hypot(x, y), Rotation2d(x, y))
-            for x, y in module_states.reshape(-1, 2)
-        ]
+        states = []
+        for x, y in module_states.reshape(-1, 2):
+            speed = math.hypot(x, y)
+            # Stationary modules face forward, as in Rotation2d(x, y).
+            angle = Rotation2d(x, y) if speed > 1e-6 else _zero_rotation
+            states.append(SwerveModuleState(speed, angle))
+        return states
+
+    def toModuleVelocities(
+        self,
+        chassisSpeeds: np.ndarray,
+        centerOfRotation: Translation2d = _identity_translation,
+    ) -> np.ndarray:
+        """Performs inverse kinematics on many chassis speeds at once.
+
+        This is useful for checking the module speeds along a whole
+        trajectory, without a Python object per module per sample.
+
+        :param chassisSpeeds: An (n, 3) array of (vx, vy, omega) rows.
+
+        :param centerOfRotation: The center of rotation.
+
+        :returns: An (n, m, 2) array of the x and y components of the
+                  velocity of each of the m modules.
+        """
+        chassis_speeds = np.asarray(chassisSpeeds, dtype=float)
+        if centerOfRotation is self._prev_cor:
+            inverse_kinematics = self._inverse_kinematics
+        else:
+            inverse_kinematics = self._inverseKinematicsAbout(centerOfRotation)
+        module_velocities = chassis_speeds @ inverse_kinematics.T
+        return module_velocities.reshape(len(chassis_speeds), self.num_modules, 2)
+
+    def _inverseKinematicsAbout(self, centerOfRotation: Translation2d) -> np.ndarray:
+        """Returns the inverse kinematics matrix for a center of rotation.
 
-    def toChassisSpeeds(self, *wheel_states: SwerveModuleState) -> ChassisSpeeds:
+        Matrices are cached for the most recently used centers of rotation,
+        so switching between a few of them doesn't rebuild the matrix.
+        """
+        matrices = self._cor_matrices
+        inverse_kinematics = matrices.pop(centerOfRotation, None)
+        if inverse_kinematics is None:
+            if len(matrices) >= self.MAX_CACHED_CENTERS:
+                del matrices[next(iter(matrices))]
+            inverse_kinematics = np.empty((2 * self.num_modules, 3))
+            cor_y = centerOfRotation.y
+            cor_x = centerOfRotation.x
+            for i, module in enumerate(self.modules):
+                inverse_kinematics[2 * i] = (1, 0, -module.y + cor_y)
+                inverse_kinematics[2 * i + 1] = (0, 1, module.x - cor_x)
+        matrices[centerOfRotation] = inverse_kinematics
+        return inverse_kinematics
+
+    def toChassisSpeeds(
+        self,
+        *wheel_states: Union[SwerveModuleState, SwerveModuleStates],
+        weights: Optional[Sequence[float]] = None,
+    ) -> ChassisSpeeds:
         """Performs forward kinematics to return the resulting chassis state
         from the given module states.
 
@@ -150,25 +512,116 @@ class SwerveDriveKinematics:
                              as measured from respective encoders and gyros.
                              The order of the swerve module states should be
                              same as passed into the constructor of this class.
+                             Alternatively, a single SwerveModuleStates.
+
+        :param weights: The weight of each module in the least squares fit,
+                        in the same order as the modules. By default, every
+                        module is weighted equally. At least two modules
+                        must have positive weights.
 
         :returns: The resulting chassis speed.
         """
+        module_states_mat = self._moduleVectors(wheel_states)
+        chassis_vel_vec = self._forwardKinematics(module_states_mat, weights)
+        return ChassisSpeeds(*chassis_vel_vec)
+
+    def toChassisSpeedsWithResidual(
+        self,
+        *wheel_states: Union[SwerveModuleState, SwerveModuleStates],
+        weights: Optional[Sequence[float]] = None,
+    ) -> Tuple[ChassisSpeeds, np.ndarray]:
+        """Performs forward kinematics as :meth:`toChassisSpeeds`, and also
+        returns how much each module disagrees with the result.
+
+        The module states of a rigid robot with no wheel slip agree exactly
+        with some chassis speed, so large residuals indicate slip, a
+        collision or a faulty module. See :class:`.SlipDetector`.
+
+        :returns: The resulting chassis speed, and an (n, 2) array of the
+                  difference between the measured velocity of each module
+                  and its velocity from the resulting chassis speed.
+        """
+        module_states_mat = self._moduleVectors(wheel_states)
+        chassis_vel_vec = self._forwardKinematics(module_states_mat, weights)
+        residual = module_states_mat - self._origin_inverse_kinematics @ chassis_vel_vec
+        return ChassisSpeeds(*chassis_vel_vec), residual.reshape(-1, 2)
+
+    def _moduleVectors(
+        self, wheel_states: Sequence[Union[SwerveModuleState, SwerveModuleStates]]
+    ) -> np.ndarray:
+        """Returns the flattened velocity vectors of the module states."""
         num_modules = self.num_modules
+        if len(wheel_states) == 1 and isinstance(wheel_states[0], SwerveModuleStates):
+            module_states = wheel_states[0]
+            assert (
+                len(module_states) == num_modules
+            ), "Number of modules must be consistent with number of wheel locations."
+            return module_states.toVectors().reshape(-1)
         assert (
             len(wheel_states) == num_modules
         ), "Number of modules must be consistent with number of wheel locations."
-        module_states_mat = np.array(
+        return np.array(
             [
                 (module.speed * module.angle.cos, module.speed * module.angle.sin)
                 for module in wheel_states
             ]
         ).reshape(-1)
-        chassis_vel_vec = self.forward_kinematics @ module_states_mat
-        return ChassisSpeeds(*chassis_vel_vec)
+
+    def toTwist2d(
+        self,
+        *wheel_deltas: SwerveModulePosition,
+        weights: Optional[Sequence[float]] = None,
+    ) -> Twist2d:
+        """Performs forward kinematics to return the resulting change in
+        chassis pose from the given changes in module positions.
+
+        :param wheel_deltas: The distance travelled by each module since the
+                             last update, paired with the current angle of
+                             the module. The order should be the same as
+                             passed into the constructor of this class.
+
+        :param weights: The weight of each module, as for :meth:`toChassisSpeeds`.
+
+        :returns: The resulting twist in the robot's frame of reference.
+        """
+        assert (
+            len(wheel_deltas) == self.num_modules
+        ), "Number of modules must be consistent with number of wheel locations."
+        module_deltas_mat = np.array(
+            [
+                (module.distance * module.angle.cos, module.distance * module.angle.sin)
+                for module in wheel_deltas
+            ]
+        ).reshape(-1)
+        return Twist2d(*self._forwardKinematics(module_deltas_mat, weights))
+
+    def _forwardKinematics(
+        self, module_vectors: np.ndarray, weights: Optional[Sequence[float]]
+    ) -> np.ndarray:
+        """Solves for the chassis motion from the flattened module vectors.
+
+        With weights, this solves the weighted normal equations
+        ``(sum w_i A_i^T A_i) x = sum w_i A_i^T u_i``, which only needs a
+        3x3 solve per call.
+        """
+        if weights is None:
+            return self.forward_kinematics @ module_vectors
+        weights = np.asarray(weights, dtype=float)
+        assert weights.shape == (
+            self.num_modules,
+        ), "Number of weights must be consistent with number of wheel locations."
+        if not all(self._enabled):
+            weights = weights * self._enabled
+        normal = (weights @ self._normal_blocks).reshape(3, 3)
+        weighted_vectors = np.repeat(weights, 2) * module_vectors
+        return np.linalg.solve(
+            normal, weighted_vectors @ self._origin_inverse_kinematics
+        )
 
     @staticmethod
     def normalizeWheelSpeeds(
-        moduleStates: List[SwerveModuleState], attainableMaxSpeed: float
+        moduleStates: Union[List[SwerveModuleState], SwerveModuleStates],
+        attainableMaxSpeed: float,
     ) -> None:
         """Normalizes the wheel speeds using some max attainable speed.
 
@@ -184,6 +637,13 @@ class SwerveDriveKinematics:
 
         :param attainableMaxSpeed: The absolute max speed that a module can reach.
         """
+        if isinstance(moduleStates, SwerveModuleStates):
+            speeds = moduleStates.speeds
+            real_max_speed = speeds.max()
+            if real_max_speed > attainableMaxSpeed:
+                speeds *= attainableMaxSpeed / real_max_speed
+            return
+
         real_max_speed = max(module.speed for module in moduleStates)
         if real_max_speed > attainableMaxSpeed:
             factor = attainableMaxSpeed / real_max_speed
@@ -202,14 +662,27 @@ class SwerveDriveOdometry:
     Teams can use odometry during the autonomous period for complex
     tasks like path following. Furthermore, odometry can be used for
     latency compensation when using computer-vision systems.
+
+    When the gyro and the module encoders are sampled at different times,
+    their readings can be passed in separately with their own timestamps
+    using :meth:`addGyroSample` and :meth:`addModuleSample`. Module samples
+    are then integrated once a gyro reading at least as new has arrived,
+    using the gyro angle interpolated to the time of the module sample.
     """
 
     __slots__ = (
         "kinematics",
         "_pose",
+        "_version",
         "_previous_time",
         "_previous_angle",
         "_gyro_offset",
+        "_previous_distances",
+        "_gyro_samples",
+        "_module_samples",
+        "_dropped_gyro_samples",
+        "_dropped_module_samples",
+        "_listeners",
     )
 
     def __init__(
@@ -217,17 +690,48 @@ class SwerveDriveOdometry:
         kinematics: SwerveDriveKinematics,
         gyroAngle: Rotation2d,
         initialPose: Optional[Pose2d] = None,
+        sampleBufferSize: int = 8,
     ):
+        """
+        :param kinematics: The swerve drive kinematics for your drivetrain.
+
+        :param gyroAngle: The angle reported by the gyroscope.
+
+        :param initialPose: The starting position of the robot on the field.
+
+        :param sampleBufferSize: The number of timestamped gyro and module
+            samples to buffer for :meth:`addGyroSample` and
+            :meth:`addModuleSample`. Beyond this limit the oldest samples
+            are discarded, and counted by :meth:`getDroppedGyroSamples` and
+            :meth:`getDroppedModuleSamples`.
+        """
         if initialPose is None:
             initialPose = Pose2d()
 
         self.kinematics = kinematics
         self._pose = initialPose
+        self._version = 0
         self._previous_time: Optional[float] = None
         self._previous_angle = initialPose.rotation
         self._gyro_offset = initialPose.rotation - gyroAngle
+        self._previous_distances: Optional[np.ndarray] = None
+        self._gyro_samples: Deque[Tuple[float, Rotation2d]] = deque(
+            maxlen=sampleBufferSize
+        )
+        self._module_samples: Deque[
+            Tuple[float, Sequence[Union[SwerveModuleState, SwerveModuleStates]]]
+        ] = deque(maxlen=sampleBufferSize)
+        self._dropped_gyro_samples = 0
+        self._dropped_module_samples = 0
+        self._listeners: List[Callable[[float, Pose2d], None]] = []
 
-    def resetPosition(self, pose: Pose2d, gyroAngle: Rotation2d) -> None:
+    def resetPosition(
+        self,
+        pose: Pose2d,
+        gyroAngle: Rotation2d,
+        *modulePositions: SwerveModulePosition,
+        timestamp: Optional[float] = None,
+    ) -> None:
         """Resets the robot's position on the field.
 
         The gyroscope angle does not need to be reset here on the user's robot
@@ -236,20 +740,93 @@ class SwerveDriveOdometry:
         :param pose: The position on the field that your robot is at.
 
         :param gyroAngle: The angle reported by the gyroscope.
+
+        :param modulePositions: The current positions of all swerve modules,
+            if using :meth:`updateWithPositions`. If not given, the next
+            module positions passed to it are used as the starting point.
+
+        :param timestamp: The time passed to the listeners with the new pose,
+            on the same clock as the times passed to :meth:`updateWithTime`.
+            This is required if any listeners are registered.
         """
+        self._checkTimestamp(timestamp)
         self._pose = pose
+        self._version += 1
         self._previous_angle = pose.rotation
         self._gyro_offset = pose.rotation - gyroAngle
+        self._previous_distances = (
+            np.array([position.distance for position in modulePositions])
+            if modulePositions
+            else None
+        )
+        self._gyro_samples.clear()
+        self._module_samples.clear()
+        self._notifyListeners(timestamp, pose)
 
     def getPose(self) -> Pose2d:
         """Returns the position of the robot on the field."""
         return self._pose
 
+    def addListener(self, listener: Callable[[float, Pose2d], None]) -> None:
+        """Registers a function to call with the time and the new pose
+        whenever the pose changes, by an update or a reset.
+
+        This can be used to publish the pose to other processes, for
+        example with :class:`~wpilib.kinematics.sharedpose.SharedPoseWriter`.
+        """
+        self._listeners.append(listener)
+
+    def removeListener(self, listener: Callable[[float, Pose2d], None]) -> None:
+        """Unregisters a function registered with :meth:`addListener`."""
+        self._listeners.remove(listener)
+
+    def _checkTimestamp(self, timestamp: Optional[float]) -> None:
+        # There's no way to tell which clock the caller uses, and mixing
+        # clocks would put the poses in the listeners out of order.
+        assert (
+            timestamp is not None or not self._listeners
+        ), "A timestamp is required when listeners are registered"
+
+    def _notifyListeners(self, timestamp: Optional[float], pose: Pose2d) -> None:
+        for listener in self._listeners:
+            listener(timestamp, pose)
+
+    def getVersion(self) -> int:
+        """Returns a counter that is incremented whenever the pose changes.
+
+        This can be used to cache values derived from the pose.
+        """
+        return self._version
+
+    def getTimestamp(self) -> Optional[float]:
+        """Returns the time of the last update, or None if not yet updated."""
+        return self._previous_time
+
+    def getDroppedGyroSamples(self) -> int:
+        """Returns the number of gyro samples discarded because the sample
+        buffer was full.
+
+        This happens when the gyro runs more than the sample buffer size
+        ahead of the module samples. Module samples older than every
+        buffered gyro sample then use the oldest buffered gyro angle.
+        """
+        return self._dropped_gyro_samples
+
+    def getDroppedModuleSamples(self) -> int:
+        """Returns the number of module samples that were never integrated.
+
+        These are samples discarded because the sample buffer was full, as
+        happens when the gyro lags by more than the sample buffer size, and
+        samples older than a sample that was already integrated.
+        """
+        return self._dropped_module_samples
+
     def updateWithTime(
         self,
         currentTime: float,
         gyroAngle: Rotation2d,
-        *module_states: SwerveModuleState,
+        *module_states: Union[SwerveModuleState, SwerveModuleStates],
+        weights: Optional[Sequence[float]] = None,
     ) -> Pose2d:
         """Updates the robot's position on the field using forward kinematics
         and integration of the pose over time.
@@ -267,6 +844,11 @@ class SwerveDriveOdometry:
         :param module_states: The current state of all swerve modules.
                     Please provide the states in the same order in which
                     you instantiated your SwerveDriveKinematics.
+                    Alternatively, a single SwerveModuleStates.
+
+        :param weights: The weight of each module in the forward kinematics,
+            to trust modules that may be slipping less than the others.
+            See :meth:`SwerveDriveKinematics.toChassisSpeeds`.
 
         :returns: The new pose of the robot.
         """
@@ -275,7 +857,9 @@ class SwerveDriveOdometry:
         self._previous_time = currentTime
 
         angle = gyroAngle + self._gyro_offset
-        dx, dy, _dtheta = self.kinematics.toChassisSpeeds(*module_states)
+        dx, dy, _dtheta = self.kinematics.toChassisSpeeds(
+            *module_states, weights=weights
+        )
 
         new_pose = self._pose.exp(
             Twist2d(
@@ -286,6 +870,201 @@ class SwerveDriveOdometry:
         )
 
         self._previous_angle = angle
-        self._pose = Pose2d(new_pose.translation, angle)
+        pose = self._pose = Pose2d(new_pose.translation, angle)
+        self._version += 1
+        self._notifyListeners(currentTime, pose)
+
+        return pose
+
+    def updateWithPositions(
+        self,
+        gyroAngle: Rotation2d,
+        *module_positions: SwerveModulePosition,
+        weights: Optional[Sequence[float]] = None,
+        timestamp: Optional[float] = None,
+    ) -> Pose2d:
+        """Updates the robot's position on the field using forward kinematics
+        on the distances travelled by each module.
+
+        Unlike :meth:`updateWithTime`, this does not integrate velocities
+        over time, so jitter in the loop period does not affect the pose.
+        This also takes in an angle parameter which is used instead of the
+        angular rate that is calculated from forward kinematics.
+
+        :param gyroAngle: The angle reported by the gyroscope.
+
+        :param module_positions: The current position of all swerve modules.
+                    Please provide the positions in the same order in which
+                    you instantiated your SwerveDriveKinematics.
+
+        :param weights: The weight of each module in the forward kinematics,
+            as for :meth:`updateWithTime`.
+
+        :param timestamp: The time passed to the listeners with the new pose,
+            on the same clock as the times passed to :meth:`updateWithTime`.
+            This is required if any listeners are registered.
+
+        :returns: The new pose of the robot.
+        """
+        self._checkTimestamp(timestamp)
+        kinematics = self.kinematics
+        assert (
+            len(module_positions) == kinematics.num_modules
+        ), "Number of modules must be consistent with number of wheel locations."
+        module_mat = np.array(
+            [
+                (position.distance, position.angle.cos, position.angle.sin)
+                for position in module_positions
+            ]
+        )
+        distances = module_mat[:, 0].copy()
+        previous_distances = self._previous_distances
+        self._previous_distances = distances
+
+        angle = gyroAngle + self._gyro_offset
+        if previous_distances is None:
+            dx = dy = 0
+        else:
+            deltas = distances - previous_distances
+            module_deltas_mat = np.column_stack(
+                (deltas * module_mat[:, 1], deltas * module_mat[:, 2])
+            ).reshape(-1)
+            dx, dy, _dtheta = kinematics._forwardKinematics(module_deltas_mat, weights)
+
+        new_pose = self._pose.exp(
+            Twist2d(dx, dy, (angle - self._previous_angle).getRadians())
+        )
+
+        self._previous_angle = angle
+        pose = self._pose = Pose2d(new_pose.translation, angle)
+        self._version += 1
+        self._notifyListeners(timestamp, pose)
+
+        return pose
+
+    def addGyroSample(self, timestamp: float, gyroAngle: Rotation2d) -> Pose2d:
+        """Records a gyro reading taken at the given time.
+
+        Any buffered module samples taken at or before this time are
+        integrated into the pose.
+
+        At most ``sampleBufferSize`` gyro samples are buffered. If the gyro
+        runs further ahead of the module samples, the oldest gyro samples
+        are discarded and counted by :meth:`getDroppedGyroSamples`.
+
+        :param timestamp: The time the gyro was sampled at. Gyro samples must
+                          be added in chronological order.
+
+        :param gyroAngle: The angle reported by the gyroscope.
+
+        :returns: The new pose of the robot.
+        """
+        self._addGyroSample(timestamp, gyroAngle)
+        return self._integrateSamples()
+
+    def addModuleSample(
+        self,
+        timestamp: float,
+        *module_states: Union[SwerveModuleState, SwerveModuleStates],
+    ) -> Pose2d:
+        """Records the module states measured at the given time.
+
+        The sample is integrated into the pose as soon as a gyro reading
+        taken at or after this time is available. At most
+        ``sampleBufferSize`` module samples are buffered while waiting for
+        the gyro. Beyond that, the oldest module samples are discarded
+        without being integrated, and counted by
+        :meth:`getDroppedModuleSamples`.
+
+        :param timestamp: The time the module encoders were sampled at.
+                          Module samples must be added in chronological order.
+
+        :param module_states: The state of all swerve modules, as for
+            :meth:`updateWithTime`. These must not be modified until the
+            sample has been integrated.
+
+        :returns: The new pose of the robot.
+        """
+        self._addModuleSample(timestamp, module_states)
+        return self._integrateSamples()
+
+    def updateWithTimestamps(
+        self,
+        gyroTime: float,
+        gyroAngle: Rotation2d,
+        moduleTime: float,
+        *module_states: Union[SwerveModuleState, SwerveModuleStates],
+    ) -> Pose2d:
+        """Updates the robot's position using gyro and module readings that
+        were sampled at different times.
+
+        This is equivalent to calling :meth:`addGyroSample` and
+        :meth:`addModuleSample`.
+
+        :param gyroTime: The time the gyro was sampled at.
+
+        :param gyroAngle: The angle reported by the gyroscope.
+
+        :param moduleTime: The time the module encoders were sampled at.
+
+        :param module_states: The state of all swerve modules.
+
+        :returns: The new pose of the robot.
+        """
+        self._addGyroSample(gyroTime, gyroAngle)
+        self._addModuleSample(moduleTime, module_states)
+        return self._integrateSamples()
+
+    def _addGyroSample(self, timestamp: float, gyroAngle: Rotation2d) -> None:
+        samples = self._gyro_samples
+        if len(samples) == samples.maxlen:
+            self._dropped_gyro_samples += 1
+        samples.append((timestamp, gyroAngle))
+
+    def _addModuleSample(
+        self,
+        timestamp: float,
+        module_states: Sequence[Union[SwerveModuleState, SwerveModuleStates]],
+    ) -> None:
+        samples = self._module_samples
+        if len(samples) == samples.maxlen:
+            self._dropped_module_samples += 1
+        samples.append((timestamp, module_states))
+
+    def _integrateSamples(self) -> Pose2d:
+        gyro_samples = self._gyro_samples
+        module_samples = self._module_samples
+        if not gyro_samples:
+            return self._pose
+
+        latest_gyro_time = gyro_samples[-1][0]
+        while module_samples and module_samples[0][0] <= latest_gyro_time:
+            timestamp, module_states = module_samples.popleft()
+            prev_time = self._previous_time
+            if prev_time is not None and timestamp < prev_time:
+                # Stale sample that arrived after a newer one was integrated.
+                self._dropped_module_samples += 1
+                continue
+            self.updateWithTime(
+                timestamp, self._interpolateGyro(timestamp), *module_states
+            )
 
         return self._pose
+
+    def _interpolateGyro(self, timestamp: float) -> Rotation2d:
+        """Returns the gyro angle at the given time.
+
+        Gyro samples that are no longer needed to interpolate at or after
+        the given time are discarded, so this is amortised constant time.
+        """
+        samples = self._gyro_samples
+        while len(samples) > 1 and samples[1][0] <= timestamp:
+            samples.popleft()
+
+        start_time, start_angle = samples[0]
+        if timestamp <= start_time or len(samples) == 1:
+            return start_angle
+
+        end_time, end_angle = samples[1]
+        fraction = (timestamp - start_time) / (end_time - start_time)
+        return start_angle + (end_angle - start_angle) * fraction
@@ -0,0 +1,138 @@
+import math
+from typing import Optional
+
+import numpy as np
+
+from ..geometry import Translation2d, _identity_translation
+from .chassisspeeds import ChassisSpeeds
+from .swerve import SwerveDriveKinematics
+
+__all__ = ("SwerveChassisSpeedsLimiter",)
+
+
+class SwerveChassisSpeedsLimiter:
+    """Limits the rate of change of chassis speeds for a swerve drive.
+
+    Each call moves the output chassis speeds from the previous output
+    towards the requested speeds, by the largest fraction of the change
+    that keeps every module within its drive acceleration and steering
+    rate limits. This prevents wheel slip from abrupt joystick inputs while
+    keeping the direction of the chassis motion unchanged.
+
+    The acceleration limit is applied in closed form. The steering rate
+    limit is applied by bisection with a fixed number of iterations, so
+    the cost of each call is bounded.
+    """
+
+    __slots__ = (
+        "kinematics",
+        "maxModuleAcceleration",
+        "maxSteeringRate",
+        "iterations",
+        "_previous",
+    )
+
+    def __init__(
+        self,
+        kinematics: SwerveDriveKinematics,
+        maxModuleAcceleration: float,
+        maxSteeringRate: float = math.inf,
+        iterations: int = 8,
+    ):
+        """
+        :param kinematics: The kinematics of the drivetrain.
+
+        :param maxModuleAcceleration: The maximum change in velocity of any
+            module per second. This limits the change in the velocity
+            vector, so it also limits the centripetal acceleration of a
+            module changing direction.
+
+        :param maxSteeringRate: The maximum rate in radians per second that
+            any moving module may turn at. A module may reverse its drive
+            direction instead of turning more than 90 degrees.
+
+        :param iterations: The number of bisection iterations used for the
+                           steering rate limit.
+        """
+        self.kinematics = kinematics
+        self.maxModuleAcceleration = maxModuleAcceleration
+        self.maxSteeringRate = maxSteeringRate
+        self.iterations = iterations
+        self.reset()
+
+    def reset(self, speeds: Optional[ChassisSpeeds] = None) -> None:
+        """Resets the limiter to the given current chassis speeds,
+        or to stationary if not given.
+        """
+        if speeds is None:
+            self._previous = np.zeros(3)
+        else:
+            self._previous = np.array(speeds, dtype=float)
+
+    def calculate(
+        self,
+        speeds: ChassisSpeeds,
+        dt: float,
+        centerOfRotation: Translation2d = _identity_translation,
+    ) -> ChassisSpeeds:
+        """Limits the change from the previous output to the given speeds.
+
+        :param speeds: The requested chassis speeds.
+        :param dt: The time since the previous call.
+        :param centerOfRotation: The center of rotation that the speeds will
+            be passed to :meth:`.SwerveDriveKinematics.toSwerveModuleStates`
+            with.
+
+        :returns: The limited chassis speeds.
+        """
+        previous = self._previous
+        change = np.array(speeds, dtype=float) - previous
+        kinematics = self.kinematics
+        if centerOfRotation is kinematics._prev_cor:
+            inverse_kinematics = kinematics._inverse_kinematics
+        else:
+            inverse_kinematics = kinematics._inverseKinematicsAbout(centerOfRotation)
+        # The inverse kinematics of each module, as an (n, 2, 3) stack.
+        matrices = inverse_kinematics.reshape(-1, 2, 3)
+
+        # Module velocities are linear in the chassis speeds, so the change
+        # in each module's velocity scales linearly with the fraction taken.
+        module_change = matrices @ change
+        max_module_change = np.sqrt((module_change * module_change).sum(axis=1)).max()
+        max_delta_v = self.maxModuleAcceleration * dt
+        if max_module_change > max_delta_v:
+            fraction = max_delta_v / max_module_change
+        else:
+            fraction = 1.0
+
+        max_turn = self.maxSteeringRate * dt
+        if max_turn < math.pi / 2:
+            module_velocity = matrices @ previous
+            if self._maxTurn(module_velocity, module_change, fraction) > max_turn:
+                low = 0.0
+                high = fraction
+                for _ in range(self.iterations):
+                    mid = (low + high) / 2
+                    if self._maxTurn(module_velocity, module_change, mid) > max_turn:
+                        high = mid
+                    else:
+                        low = mid
+                fraction = low
+
+        self._previous = result = previous + change * fraction
+        return ChassisSpeeds(*result)
+
+    @staticmethod
+    def _maxTurn(velocity: np.ndarray, change: np.ndarray, fraction: float) -> float:
+        """Returns the largest steering angle change of any moving module."""
+        new_velocity = velocity + change * fraction
+        vx = velocity[:, 0]
+        vy = velocity[:, 1]
+        nx = new_velocity[:, 0]
+        ny = new_velocity[:, 1]
+        moving = (np.hypot(vx, vy) > 1e-6) & (np.hypot(nx, ny) > 1e-6)
+        if not moving.any():
+            return 0.0
+        turn = np.abs(np.arctan2(vx * ny - vy * nx, vx * nx + vy * ny))[moving]
+        # Turning by more than 90 degrees is avoided by reversing the wheel.
+        return float(np.minimum(turn, math.pi - turn).max())
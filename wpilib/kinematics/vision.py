@@ -0,0 +1,77 @@
+from typing import Union
+
+import numpy as np
+
+from ..geometry import Pose2d, Pose2dArray, Transform2d, Translation2dArray
+from .swerve import SwerveDriveOdometry
+
+__all__ = ("CameraTransformCache",)
+
+
+class CameraTransformCache:
+    """Converts vision detections from several cameras into field coordinates.
+
+    Each camera is mounted at a fixed transform from the robot. The
+    camera-to-field transforms are composed with the odometry pose once
+    per odometry update, and then applied to whole arrays of detections,
+    so the cost of each frame doesn't depend on the number of detections
+    as Python objects.
+    """
+
+    __slots__ = ("odometry", "_camera_transforms", "_version", "_field_transforms")
+
+    def __init__(self, odometry: SwerveDriveOdometry, *robotToCameras: Transform2d):
+        """
+        :param odometry: The odometry that tracks the pose of the robot.
+
+        :param robotToCameras: The transform from the robot to each camera.
+            Cameras are referred to by their index in this list.
+        """
+        assert robotToCameras, "At least one camera is required"
+        self.odometry = odometry
+        self._camera_transforms = Pose2dArray.fromPoses(
+            Pose2d(transform.translation, transform.rotation)
+            for transform in robotToCameras
+        )
+        self._version = -1
+        self._field_transforms = self._camera_transforms
+
+    def _getFieldTransforms(self) -> Pose2dArray:
+        """Returns the camera-to-field transforms for the current pose."""
+        odometry = self.odometry
+        version = odometry.getVersion()
+        if version != self._version:
+            pose = odometry.getPose()
+            self._field_transforms = (
+                Pose2dArray.fromPoses((pose,)) + self._camera_transforms
+            )
+            self._version = version
+        return self._field_transforms
+
+    def getCameraPose(self, camera: int) -> Pose2d:
+        """Returns the pose of a camera on the field."""
+        return self._getFieldTransforms()[camera]
+
+    def toField(
+        self, camera: Union[int, np.ndarray], detections: Translation2dArray
+    ) -> Translation2dArray:
+        """Converts detections relative to a camera into field coordinates.
+
+        :param camera: The index of the camera that made every detection,
+            or an array of the camera index of each detection.
+
+        :param detections: The detected positions relative to the camera.
+
+        :returns: The positions of the detections on the field.
+        """
+        transforms = self._getFieldTransforms()
+        rotation = transforms.rotation
+        translation = transforms.translation
+        cos = rotation.cos[camera]
+        sin = rotation.sin[camera]
+        x = detections.x
+        y = detections.y
+        return Translation2dArray(
+            translation.x[camera] + x * cos - y * sin,
+            translation.y[camera] + x * sin + y * cos,
+        )
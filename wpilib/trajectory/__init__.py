@@ -0,0 +1,28 @@
+from .constraint import (
+    CentripetalAccelerationConstraint,
+    MaxVelocityConstraint,
+    RectangularRegionConstraint,
+    SwerveDriveKinematicsConstraint,
+    TrajectoryConstraint,
+)
+from .motionprofile import MotionProfile
+from .parameterizer import TimedSamples, time_parameterize
+from .path import IndexedPath
+from .purepursuit import PurePursuitController
+from .scurveprofile import SCurveProfile
+from .trapezoidprofile import TrapezoidProfile
+
+__all__ = (
+    "CentripetalAccelerationConstraint",
+    "IndexedPath",
+    "MaxVelocityConstraint",
+    "MotionProfile",
+    "PurePursuitController",
+    "RectangularRegionConstraint",
+    "SCurveProfile",
+    "SwerveDriveKinematicsConstraint",
+    "TimedSamples",
+    "TrajectoryConstraint",
+    "TrapezoidProfile",
+    "time_parameterize",
+)
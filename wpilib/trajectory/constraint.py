@@ -0,0 +1,180 @@
+import math
+from typing import Tuple
+
+import numpy as np
+
+from ..geometry import Pose2dArray, Translation2d
+from ..kinematics.swerve import SwerveDriveKinematics
+
+__all__ = (
+    "TrajectoryConstraint",
+    "CentripetalAccelerationConstraint",
+    "MaxVelocityConstraint",
+    "RectangularRegionConstraint",
+    "SwerveDriveKinematicsConstraint",
+)
+
+
+class TrajectoryConstraint:
+    """Base class for constraints on the velocity and acceleration along
+    a trajectory.
+
+    Constraints are evaluated on every sample of a path at once: each
+    method takes arrays of the poses, curvatures and velocities at the
+    samples, and returns an array with a limit for each sample.
+    The default implementations don't constrain anything.
+    """
+
+    __slots__ = ()
+
+    def getMaxVelocity(
+        self, poses: Pose2dArray, curvatures: np.ndarray, velocities: np.ndarray
+    ) -> np.ndarray:
+        """Returns the maximum velocity at each sample.
+
+        :param poses: The poses at the samples, facing the direction of travel.
+        :param curvatures: The curvatures of the path at the samples, in rad/m.
+        :param velocities: The velocities at the samples without this constraint.
+        """
+        return np.full(len(curvatures), math.inf)
+
+    def getMinMaxAcceleration(
+        self, poses: Pose2dArray, curvatures: np.ndarray, velocities: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the minimum and maximum acceleration at each sample.
+
+        The parameters are the same as for :meth:`getMaxVelocity`.
+        """
+        num_samples = len(curvatures)
+        return np.full(num_samples, -math.inf), np.full(num_samples, math.inf)
+
+
+class MaxVelocityConstraint(TrajectoryConstraint):
+    """Limits the velocity to a constant maximum.
+
+    This is mostly useful inside a :class:`RectangularRegionConstraint`,
+    to slow down in part of the field.
+    """
+
+    __slots__ = ("maxVelocity",)
+
+    def __init__(self, maxVelocity: float):
+        """
+        :param maxVelocity: The max velocity.
+        """
+        self.maxVelocity = maxVelocity
+
+    def getMaxVelocity(
+        self, poses: Pose2dArray, curvatures: np.ndarray, velocities: np.ndarray
+    ) -> np.ndarray:
+        return np.full(len(curvatures), self.maxVelocity)
+
+
+class CentripetalAccelerationConstraint(TrajectoryConstraint):
+    """Limits the centripetal acceleration through turns.
+
+    This slows the robot down around tight turns, which makes it easier to
+    track trajectories with sharp turns.
+    """
+
+    __slots__ = ("maxCentripetalAcceleration",)
+
+    def __init__(self, maxCentripetalAcceleration: float):
+        """
+        :param maxCentripetalAcceleration: The max centripetal acceleration.
+        """
+        self.maxCentripetalAcceleration = maxCentripetalAcceleration
+
+    def getMaxVelocity(
+        self, poses: Pose2dArray, curvatures: np.ndarray, velocities: np.ndarray
+    ) -> np.ndarray:
+        # ac = v^2 / r = v^2 * k, so v = sqrt(ac / k)
+        with np.errstate(divide="ignore"):
+            return np.sqrt(self.maxCentripetalAcceleration / np.abs(curvatures))
+
+
+class SwerveDriveKinematicsConstraint(TrajectoryConstraint):
+    """Limits the velocity so that no swerve module exceeds a maximum speed.
+
+    The robot is assumed to face its direction of travel, turning with
+    the path.
+    """
+
+    __slots__ = ("kinematics", "maxSpeed")
+
+    def __init__(self, kinematics: SwerveDriveKinematics, maxSpeed: float):
+        """
+        :param kinematics: The kinematics of the drivetrain.
+        :param maxSpeed: The max speed that any module can reach.
+        """
+        self.kinematics = kinematics
+        self.maxSpeed = maxSpeed
+
+    def getMaxVelocity(
+        self, poses: Pose2dArray, curvatures: np.ndarray, velocities: np.ndarray
+    ) -> np.ndarray:
+        # Module velocities are linear in the chassis velocity, so find the
+        # module speeds at unit velocity and scale them to the max speed.
+        curvatures = np.asarray(curvatures, dtype=float)
+        unit_speeds = np.column_stack(
+            (np.ones_like(curvatures), np.zeros_like(curvatures), curvatures)
+        )
+        vectors = self.kinematics.toModuleVelocities(unit_speeds)
+        max_module_speeds = np.hypot(vectors[..., 0], vectors[..., 1]).max(axis=1)
+        return self.maxSpeed / max_module_speeds
+
+
+class RectangularRegionConstraint(TrajectoryConstraint):
+    """Applies a constraint only within a rectangular region of the field."""
+
+    __slots__ = ("bottomLeftPoint", "topRightPoint", "constraint")
+
+    def __init__(
+        self,
+        bottomLeftPoint: Translation2d,
+        topRightPoint: Translation2d,
+        constraint: TrajectoryConstraint,
+    ):
+        """
+        :param bottomLeftPoint: The bottom left corner of the region.
+        :param topRightPoint: The top right corner of the region.
+        :param constraint: The constraint to enforce inside the region.
+        """
+        self.bottomLeftPoint = bottomLeftPoint
+        self.topRightPoint = topRightPoint
+        self.constraint = constraint
+
+    def isInRegion(self, poses: Pose2dArray) -> np.ndarray:
+        """Returns whether each pose is within the region."""
+        x = poses.translation.x
+        y = poses.translation.y
+        bottom_left = self.bottomLeftPoint
+        top_right = self.topRightPoint
+        return (
+            (x >= bottom_left.x)
+            & (x <= top_right.x)
+            & (y >= bottom_left.y)
+            & (y <= top_right.y)
+        )
+
+    def getMaxVelocity(
+        self, poses: Pose2dArray, curvatures: np.ndarray, velocities: np.ndarray
+    ) -> np.ndarray:
+        inside = self.isInRegion(poses)
+        return np.where(
+            inside,
+            self.constraint.getMaxVelocity(poses, curvatures, velocities),
+            math.inf,
+        )
+
+    def getMinMaxAcceleration(
+        self, poses: Pose2dArray, curvatures: np.ndarray, velocities: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        inside = self.isInRegion(poses)
+        min_acceleration, max_acceleration = self.constraint.getMinMaxAcceleration(
+            poses, curvatures, velocities
+        )
+        return (
+            np.where(inside, min_acceleration, -math.inf),
+            np.where(inside, max_acceleration, math.inf),
+        )
@@ -0,0 +1,89 @@
+import abc
+import math
+from typing import Tuple, Union
+
+import numpy as np
+
+from ..geometry import Rotation2d
+from ..kinematics import ChassisSpeeds
+
+#: A single time, or an array of times.
+Time = Union[float, np.ndarray]
+
+
+class MotionProfile(abc.ABC):
+    """Base class for one-dimensional motion profiles.
+
+    Subclasses evaluate their state in closed form, for a single time or
+    an array of times at once.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def calculate(self, t: Time):
+        """Calculates the state of the profile at time t,
+        where the beginning of the profile was at time t = 0.
+
+        :param t: The time since the beginning of the profile,
+                  or an array of times.
+
+        :returns: The state at time t, with arrays if t is an array.
+        """
+
+    @abc.abstractmethod
+    def totalTime(self) -> float:
+        """Returns the total time the profile takes to reach the goal."""
+
+    def isFinished(self, t: float) -> bool:
+        """Returns true if the profile has reached the goal.
+
+        The profile has reached the goal if the time since the profile
+        started has exceeded the profile's total time.
+
+        :param t: The time since the beginning of the profile.
+        """
+        return t >= self.totalTime()
+
+    def sample(self, dt: float) -> Tuple[np.ndarray, tuple]:
+        """Calculates the whole profile at a fixed period.
+
+        :param dt: The period between samples.
+
+        :returns: The sample times, and the state with arrays of values at
+                  those times. The last sample is at or after the end of
+                  the profile.
+        """
+        times = np.arange(math.ceil(self.totalTime() / dt) + 1) * dt
+        return times, self.calculate(times)
+
+    def getChassisSpeeds(
+        self, t: Time, direction: Rotation2d, omega: float = 0
+    ) -> Union[ChassisSpeeds, np.ndarray]:
+        """Returns the chassis speeds for driving along this profile
+        in a straight line in the given direction.
+
+        The result can be passed to
+        :meth:`SwerveDriveKinematics.toSwerveModuleStates`, after which the
+        module speeds follow the profile's velocity.
+
+        :param t: The time since the beginning of the profile,
+                  or an array of times.
+        :param direction: The robot-relative direction to drive in.
+        :param omega: The angular velocity of the chassis.
+
+        :returns: The chassis speeds at time t, or an (n, 3) array of
+                  (vx, vy, omega) rows if t is an array.
+        """
+        velocity = self.calculate(t).velocity
+        if np.ndim(velocity) == 0:
+            return ChassisSpeeds(
+                velocity * direction.cos, velocity * direction.sin, omega
+            )
+        return np.column_stack(
+            (
+                velocity * direction.cos,
+                velocity * direction.sin,
+                np.full_like(velocity, omega),
+            )
+        )
@@ -0,0 +1,118 @@
+import typing
+from typing import Iterable
+
+import numpy as np
+
+from ..geometry import Pose2dArray
+from .constraint import TrajectoryConstraint
+
+__all__ = ("TimedSamples", "time_parameterize")
+
+
+class TimedSamples(typing.NamedTuple):
+    """The timing of each sample along a time-parameterized path."""
+
+    #: The time at which each sample is reached.
+    times: np.ndarray
+    #: The arc length from the start of the path to each sample.
+    distances: np.ndarray
+    #: The velocity at each sample.
+    velocities: np.ndarray
+    #: The acceleration from each sample to the next.
+    accelerations: np.ndarray
+
+
+def _limit_reachable(
+    squared_limits: np.ndarray, accelerations: np.ndarray, deltas: np.ndarray
+) -> np.ndarray:
+    """Limits squared velocities to those reachable from the first sample.
+
+    Each velocity is limited by ``v[i]^2 <= v[i-1]^2 + 2 * a[i] * ds[i]``.
+    Subtracting the cumulative sum of the ``2 * a * ds`` terms turns this
+    recurrence into a cumulative minimum, so the pass is vectorized.
+    """
+    gains = np.concatenate(([0.0], np.cumsum(2 * accelerations * deltas)))
+    return np.minimum.accumulate(squared_limits - gains) + gains
+
+
+def time_parameterize(
+    poses: Pose2dArray,
+    curvatures: np.ndarray,
+    constraints: Iterable[TrajectoryConstraint],
+    startVelocity: float,
+    endVelocity: float,
+    maxVelocity: float,
+    maxAcceleration: float,
+) -> TimedSamples:
+    """Finds the fastest timing along a path that satisfies the constraints.
+
+    A forward pass limits the velocity at each sample by how fast the robot
+    can accelerate from the previous one, and a backward pass by how fast
+    it can decelerate to the next. Each constraint is evaluated once on
+    arrays of every sample, rather than once per sample.
+
+    Acceleration limits are evaluated at the maximum velocity allowed at
+    each sample, which is conservative for limits that fall with speed.
+
+    :param poses: The samples along the path, facing the direction of travel.
+    :param curvatures: The curvature of the path at each sample, in rad/m.
+    :param constraints: The constraints to apply along the path.
+    :param startVelocity: The velocity at the first sample.
+    :param endVelocity: The velocity at the last sample.
+    :param maxVelocity: The max velocity anywhere along the path.
+    :param maxAcceleration: The max magnitude of acceleration. This must be
+                            finite.
+    """
+    curvatures = np.asarray(curvatures, dtype=float)
+    num_samples = len(poses)
+    assert num_samples >= 2, "A trajectory requires at least two samples"
+    assert len(curvatures) == num_samples, "Each sample requires a curvature"
+
+    translation = poses.translation
+    deltas = np.hypot(np.diff(translation.x), np.diff(translation.y))
+    distances = np.concatenate(([0.0], np.cumsum(deltas)))
+
+    max_velocities = np.full(num_samples, float(maxVelocity))
+    min_accelerations = np.full(num_samples, -float(maxAcceleration))
+    max_accelerations = np.full(num_samples, float(maxAcceleration))
+    constraints = list(constraints)
+    for constraint in constraints:
+        np.minimum(
+            max_velocities,
+            constraint.getMaxVelocity(poses, curvatures, max_velocities),
+            out=max_velocities,
+        )
+    for constraint in constraints:
+        min_acceleration, max_acceleration = constraint.getMinMaxAcceleration(
+            poses, curvatures, max_velocities
+        )
+        np.maximum(min_accelerations, min_acceleration, out=min_accelerations)
+        np.minimum(max_accelerations, max_acceleration, out=max_accelerations)
+    assert np.all(
+        min_accelerations <= max_accelerations
+    ), "Infeasible trajectory: the acceleration constraints are contradictory"
+
+    squared = max_velocities * max_velocities
+    squared[0] = min(squared[0], startVelocity * startVelocity)
+    squared[-1] = min(squared[-1], endVelocity * endVelocity)
+
+    # Forward pass: accelerate from each sample to the next.
+    squared = _limit_reachable(squared, max_accelerations[:-1], deltas)
+    # Backward pass: decelerate from each sample to the next, in reverse.
+    squared = _limit_reachable(squared[::-1], -min_accelerations[:0:-1], deltas[::-1])
+    velocities = np.sqrt(np.maximum(squared[::-1], 0.0))
+
+    # Assume constant acceleration between samples.
+    start = velocities[:-1]
+    end = velocities[1:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        durations = np.where(deltas > 0, 2 * deltas / (start + end), 0.0)
+        accelerations = np.where(
+            deltas > 0, (end * end - start * start) / (2 * deltas), 0.0
+        )
+    assert np.all(
+        np.isfinite(durations)
+    ), "Infeasible trajectory: the robot cannot move between samples"
+
+    times = np.concatenate(([0.0], np.cumsum(durations)))
+    return TimedSamples(times, distances, velocities, np.append(accelerations, 0.0))
@@ -0,0 +1,99 @@
+import bisect
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from ..geometry import (
+    Pose2d,
+    Rotation2dArray,
+    Translation2d,
+    Translation2dArray,
+)
+
+
+class IndexedPath:
+    """A path through a sequence of waypoints, indexed by arc length.
+
+    The path is made of straight segments between consecutive waypoints.
+    The cumulative arc length at each waypoint is precomputed, so that
+    points along the path can be looked up by distance.
+    """
+
+    __slots__ = ("points", "headings", "distances")
+
+    def __init__(
+        self,
+        points: Translation2dArray,
+        headings: Optional[Rotation2dArray] = None,
+    ):
+        """
+        :param points: The waypoints of the path, in order.
+        :param headings: The desired robot heading at each waypoint, if any.
+        """
+        assert len(points) >= 2, "A path requires at least two waypoints"
+        #: The waypoints of the path.
+        self.points = points
+        #: The desired robot heading at each waypoint, or None.
+        self.headings = headings
+        #: The arc length from the start of the path to each waypoint.
+        self.distances = np.concatenate(
+            ([0.0], np.cumsum(np.hypot(np.diff(points.x), np.diff(points.y))))
+        )
+
+    @classmethod
+    def fromWaypoints(
+        cls, waypoints: Iterable[Union[Translation2d, Pose2d]]
+    ) -> "IndexedPath":
+        """Creates a path from Translation2d or Pose2d waypoints.
+
+        If Pose2d waypoints are given, their rotations are used as the
+        desired robot headings.
+        """
+        waypoints = list(waypoints)
+        if all(isinstance(waypoint, Pose2d) for waypoint in waypoints):
+            return cls(
+                Translation2dArray.fromTranslations(
+                    waypoint.translation for waypoint in waypoints
+                ),
+                Rotation2dArray.fromRotations(
+                    waypoint.rotation for waypoint in waypoints
+                ),
+            )
+        return cls(Translation2dArray.fromTranslations(waypoints))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def getTotalDistance(self) -> float:
+        """Returns the arc length of the whole path."""
+        return float(self.distances[-1])
+
+    def getSegment(self, distance: float) -> int:
+        """Returns the index of the segment containing the given arc length.
+
+        Segment i runs from waypoint i to waypoint i + 1.
+        """
+        index = bisect.bisect_right(self.distances, distance) - 1
+        return min(max(index, 0), len(self.points) - 2)
+
+    def sample(self, distance: float, segment: Optional[int] = None) -> Translation2d:
+        """Returns the point at the given arc length along the path.
+
+        :param distance: The arc length, clamped to the ends of the path.
+        :param segment: The index of the segment containing the distance,
+                        if already known.
+        """
+        if segment is None:
+            segment = self.getSegment(distance)
+        points = self.points
+        distances = self.distances
+        start = distances[segment]
+        length = distances[segment + 1] - start
+        t = (distance - start) / length if length > 0 else 0.0
+        t = min(max(t, 0.0), 1.0)
+        x0 = points.x[segment]
+        y0 = points.y[segment]
+        return Translation2d(
+            float(x0 + (points.x[segment + 1] - x0) * t),
+            float(y0 + (points.y[segment + 1] - y0) * t),
+        )
@@ -0,0 +1,181 @@
+from typing import Tuple
+
+from ..geometry import Pose2d, Rotation2d, Translation2d
+from ..kinematics import ChassisSpeeds
+from .path import IndexedPath
+
+
+class PurePursuitController:
+    """A pure pursuit path follower.
+
+    Each cycle, this finds the point on the path closest to the robot,
+    then steers towards the point a fixed lookahead distance further
+    along the path.
+
+    The closest segment is tracked by a cursor that only moves forward
+    along the path, and the lookahead point is found by walking forward
+    from it, so each call does a bounded amount of work on average
+    regardless of how many waypoints the path has.
+    """
+
+    __slots__ = (
+        "path",
+        "lookaheadDistance",
+        "speed",
+        "holonomic",
+        "headingGain",
+        "_segment",
+        "_lookahead_segment",
+        "_progress",
+    )
+
+    def __init__(
+        self,
+        path: IndexedPath,
+        lookaheadDistance: float,
+        speed: float,
+        holonomic: bool = True,
+        headingGain: float = 1.0,
+    ):
+        """
+        :param path: The path to follow.
+
+        :param lookaheadDistance: How far ahead along the path to steer towards.
+
+        :param speed: The translational speed to drive at. The speed is
+                      reduced within the lookahead distance of the end.
+
+        :param holonomic: If true, drive directly towards the lookahead point
+            and turn towards the path headings (if any). Otherwise, drive
+            forward along an arc through the lookahead point, as a
+            differential drive must.
+
+        :param headingGain: The proportional gain for turning towards the
+                            path headings when holonomic.
+        """
+        assert lookaheadDistance > 0, "Lookahead distance must be positive"
+        self.path = path
+        self.lookaheadDistance = lookaheadDistance
+        self.speed = speed
+        self.holonomic = holonomic
+        self.headingGain = headingGain
+        self.reset()
+
+    def reset(self) -> None:
+        """Restarts following from the start of the path."""
+        self._segment = 0
+        self._lookahead_segment = 0
+        self._progress = 0.0
+
+    def getProgress(self) -> float:
+        """Returns the arc length along the path of the closest point to the robot."""
+        return self._progress
+
+    def isFinished(self, tolerance: float = 1e-3) -> bool:
+        """Returns whether the robot has reached the end of the path."""
+        return self._progress >= self.path.getTotalDistance() - tolerance
+
+    def _projectOnto(self, segment: int, point: Translation2d) -> Tuple[float, float]:
+        """Projects a point onto a segment of the path.
+
+        :returns: The squared distance from the point to the segment,
+                  and the arc length of the projected point.
+        """
+        points = self.path.points
+        distances = self.path.distances
+        x0 = points.x[segment]
+        y0 = points.y[segment]
+        dx = points.x[segment + 1] - x0
+        dy = points.y[segment + 1] - y0
+        length_sq = dx * dx + dy * dy
+        if length_sq > 0:
+            t = ((point.x - x0) * dx + (point.y - y0) * dy) / length_sq
+            t = min(max(t, 0.0), 1.0)
+        else:
+            t = 0.0
+        ex = x0 + dx * t - point.x
+        ey = y0 + dy * t - point.y
+        arc = distances[segment] + t * (distances[segment + 1] - distances[segment])
+        return ex * ex + ey * ey, float(arc)
+
+    def _updateProgress(self, position: Translation2d) -> float:
+        last_segment = len(self.path) - 2
+        segment = self._segment
+        best_sq, best_arc = self._projectOnto(segment, position)
+        while segment < last_segment:
+            next_sq, next_arc = self._projectOnto(segment + 1, position)
+            if next_sq > best_sq:
+                break
+            segment += 1
+            best_sq = next_sq
+            best_arc = next_arc
+        self._segment = segment
+        self._progress = max(self._progress, best_arc)
+        return self._progress
+
+    def _advanceLookahead(self) -> Tuple[float, int]:
+        """Moves the lookahead cursor forward to the lookahead point.
+
+        :returns: The arc length of the lookahead point, and its segment.
+        """
+        path = self.path
+        target = min(self._progress + self.lookaheadDistance, path.getTotalDistance())
+        distances = path.distances
+        last_segment = len(path) - 2
+        segment = max(self._lookahead_segment, self._segment)
+        while segment < last_segment and distances[segment + 1] < target:
+            segment += 1
+        self._lookahead_segment = segment
+        return target, segment
+
+    def getLookaheadPoint(self) -> Translation2d:
+        """Returns the point being steered towards."""
+        target, segment = self._advanceLookahead()
+        return self.path.sample(target, segment)
+
+    def getLookaheadHeading(self) -> Rotation2d:
+        """Returns the path heading at the lookahead point.
+
+        The path must have been created with headings.
+        """
+        headings = self.path.headings
+        assert headings is not None, "The path has no headings"
+        target, segment = self._advanceLookahead()
+        distances = self.path.distances
+        start = distances[segment]
+        length = distances[segment + 1] - start
+        t = min(max((target - start) / length, 0.0), 1.0) if length > 0 else 1.0
+        heading = headings[segment]
+        return heading + (headings[segment + 1] - heading) * t
+
+    def calculate(self, currentPose: Pose2d) -> ChassisSpeeds:
+        """Returns the robot-relative chassis speeds to follow the path.
+
+        :param currentPose: The current field-relative pose of the robot.
+        """
+        position = currentPose.translation
+        progress = self._updateProgress(position)
+        target = self.getLookaheadPoint()
+
+        # The lookahead point in the robot's frame of reference.
+        local = (target - position).rotateBy(-currentPose.rotation)
+        distance = local.norm()
+        remaining = self.path.getTotalDistance() - progress
+        speed = self.speed * min(1.0, remaining / self.lookaheadDistance)
+
+        if not self.holonomic:
+            if distance < 1e-9:
+                return ChassisSpeeds()
+            curvature = 2 * local.y / (distance * distance)
+            return ChassisSpeeds(speed, 0, speed * curvature)
+
+        omega = 0.0
+        if self.path.headings is not None:
+            heading_error = self.getLookaheadHeading() - currentPose.rotation
+            omega = self.headingGain * heading_error.getRadians()
+
+        if distance < 1e-9:
+            return ChassisSpeeds(0, 0, omega)
+        return ChassisSpeeds(
+            speed * local.x / distance, speed * local.y / distance, omega
+        )
@@ -0,0 +1,163 @@
+import math
+import typing
+
+import numpy as np
+
+from .motionprofile import MotionProfile, Time
+
+
+class SCurveProfile(MotionProfile):
+    """A jerk-limited (S-curve) motion profile between two positions at rest.
+
+    The acceleration ramps up and down at the maximum jerk instead of
+    changing instantly as in a TrapezoidProfile, giving up to seven
+    phases of constant jerk. Each phase is evaluated in closed form, for
+    a single time or an array of times at once.
+    """
+
+    class Constraints(typing.NamedTuple):
+        #: Maximum velocity.
+        maxVelocity: float = 0
+        #: Maximum acceleration.
+        maxAcceleration: float = 0
+        #: Maximum jerk.
+        maxJerk: float = 0
+
+    class State(typing.NamedTuple):
+        #: Position, or arrays of positions for arrays of times.
+        position: Time = 0
+        #: Velocity, or arrays of velocities for arrays of times.
+        velocity: Time = 0
+        #: Acceleration, or arrays of accelerations for arrays of times.
+        acceleration: Time = 0
+
+    __slots__ = ("constraints", "_direction", "_start_times", "_start_states", "_jerks")
+
+    def __init__(self, constraints: Constraints, goal: float, initial: float = 0):
+        """Constructs an SCurveProfile.
+
+        :param constraints: The constraints on the profile.
+        :param goal: The position to stop at.
+        :param initial: The position to start from.
+        """
+        self.constraints = constraints
+        max_velocity, max_acceleration, max_jerk = constraints
+        distance = goal - initial
+        self._direction = direction = -1 if distance < 0 else 1
+        distance = abs(distance)
+
+        # Find the peak velocity, and the acceleration reached getting there.
+        velocity = self._peakVelocity(
+            distance, max_velocity, max_acceleration, max_jerk
+        )
+        if velocity * max_jerk >= max_acceleration * max_acceleration:
+            acceleration = max_acceleration
+        else:
+            acceleration = math.sqrt(velocity * max_jerk)
+
+        jerk_time = acceleration / max_jerk if acceleration > 0 else 0.0
+        constant_accel_time = (
+            velocity / acceleration - jerk_time if acceleration > 0 else 0.0
+        )
+        accel_distance = velocity * (2 * jerk_time + constant_accel_time) / 2
+        cruise_time = (
+            (distance - 2 * accel_distance) / velocity if velocity > 0 else 0.0
+        )
+
+        durations = (
+            jerk_time,
+            constant_accel_time,
+            jerk_time,
+            max(cruise_time, 0.0),
+            jerk_time,
+            constant_accel_time,
+            jerk_time,
+        )
+        jerks = np.array([1, 0, -1, 0, -1, 0, 1], dtype=float) * max_jerk
+
+        # Integrate the start state of each phase.
+        start_times = np.zeros(8)
+        start_states = np.zeros((8, 3))
+        position, velocity, acceleration = float(initial * direction), 0.0, 0.0
+        start_states[0] = position, velocity, acceleration
+        for i, dt in enumerate(durations):
+            jerk = jerks[i]
+            position += velocity * dt + acceleration * dt * dt / 2 + jerk * dt ** 3 / 6
+            velocity += acceleration * dt + jerk * dt * dt / 2
+            acceleration += jerk * dt
+            start_times[i + 1] = start_times[i] + dt
+            start_states[i + 1] = position, velocity, acceleration
+        # Remove the rounding error accumulated over the phases.
+        start_states[7] = goal * direction, 0.0, 0.0
+
+        self._start_times = start_times
+        self._start_states = start_states
+        self._jerks = np.append(jerks, 0.0)
+
+    @staticmethod
+    def _peakVelocity(
+        distance: float, max_velocity: float, max_acceleration: float, max_jerk: float
+    ) -> float:
+        """Returns the highest velocity reachable with time to stop in the distance."""
+
+        def stopping_distance(velocity: float) -> float:
+            # Twice the distance covered accelerating from rest to velocity.
+            if velocity * max_jerk >= max_acceleration * max_acceleration:
+                accel_time = velocity / max_acceleration + max_acceleration / max_jerk
+            else:
+                accel_time = 2 * math.sqrt(velocity / max_jerk)
+            return velocity * accel_time
+
+        if stopping_distance(max_velocity) <= distance:
+            return max_velocity
+
+        # The acceleration limit is reached: v^2/a + v a/j = d
+        ratio = max_acceleration / max_jerk
+        velocity = (
+            max_acceleration
+            * (-ratio + math.sqrt(ratio * ratio + 4 * distance / max_acceleration))
+            / 2
+        )
+        if velocity * max_jerk >= max_acceleration * max_acceleration:
+            return velocity
+
+        # The acceleration limit is never reached: 2 v sqrt(v/j) = d
+        return (distance * math.sqrt(max_jerk) / 2) ** (2 / 3)
+
+    def calculate(self, t: Time) -> State:
+        """Calculates the position, velocity and acceleration of the profile
+        at time t, where the beginning of the profile was at time t = 0.
+
+        :param t: The time since the beginning of the profile,
+                  or an array of times.
+
+        :returns: The state at time t, with arrays if t is an array.
+        """
+        t = np.asarray(t, dtype=float)
+        start_times = self._start_times
+        phase = np.clip(np.searchsorted(start_times, t, side="right") - 1, 0, 7)
+        dt = np.clip(t - start_times[phase], 0, None)
+        position, velocity, acceleration = self._start_states[phase].T
+        jerk = self._jerks[phase]
+
+        dt2 = dt * dt
+        position = (
+            position + velocity * dt + acceleration * dt2 / 2 + jerk * dt2 * dt / 6
+        )
+        velocity = velocity + acceleration * dt + jerk * dt2 / 2
+        acceleration = acceleration + jerk * dt
+
+        direction = self._direction
+        if position.ndim == 0:
+            return self.State(
+                float(position) * direction,
+                float(velocity) * direction,
+                float(acceleration) * direction,
+            )
+        return self.State(
+            position * direction, velocity * direction, acceleration * direction
+        )
+
+    def totalTime(self) -> float:
+        """Returns the total time the profile takes to reach the goal."""
+        return float(self._start_times[-1])
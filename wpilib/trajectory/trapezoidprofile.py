@@ -0,0 +1,169 @@
+import math
+import typing
+from typing import Optional
+
+import numpy as np
+
+from .motionprofile import MotionProfile, Time
+
+
+class TrapezoidProfile(MotionProfile):
+    """A trapezoid-shaped velocity profile.
+
+    While this class can be used for a profiled movement from start to
+    finish, the intended usage is to filter a reference's dynamics based
+    on trapezoidal velocity constraints. To compute the reference obeying
+    this constraint, do the following.
+
+    Initialization::
+
+        constraints = TrapezoidProfile.Constraints(kMaxV, kMaxA)
+        previous_ref = TrapezoidProfile.State(initial_reference, 0)
+
+    Run on update::
+
+        profile = TrapezoidProfile(constraints, unprofiled_ref, previous_ref)
+        previous_ref = profile.calculate(time_since_last_update)
+
+    where ``unprofiled_ref`` is free to change between calls. Note that
+    when the unprofiled reference is within the constraints, calculate()
+    returns the unprofiled reference unchanged.
+
+    :meth:`calculate` accepts either a single time or an array of times, so a
+    whole profile can be precomputed with a single vectorized call.
+    """
+
+    class Constraints(typing.NamedTuple):
+        #: Maximum velocity.
+        maxVelocity: float = 0
+        #: Maximum acceleration.
+        maxAcceleration: float = 0
+
+    class State(typing.NamedTuple):
+        #: Position, or arrays of positions for arrays of times.
+        position: Time = 0
+        #: Velocity, or arrays of velocities for arrays of times.
+        velocity: Time = 0
+
+    __slots__ = (
+        "constraints",
+        "_direction",
+        "_initial",
+        "_goal",
+        "_end_accel",
+        "_end_full_speed",
+        "_end_deccel",
+    )
+
+    def __init__(
+        self, constraints: Constraints, goal: State, initial: Optional[State] = None
+    ):
+        """Constructs a TrapezoidProfile.
+
+        :param constraints: The constraints on the profile, like maximum velocity.
+        :param goal: The desired state when the profile is complete.
+        :param initial: The initial state (usually the current state).
+                        Defaults to at rest at position zero.
+        """
+        if initial is None:
+            initial = self.State()
+        self._direction = -1 if initial.position > goal.position else 1
+        self.constraints = constraints
+        max_velocity, max_acceleration = constraints
+        initial = self._direct(initial)
+        goal = self._direct(goal)
+
+        if initial.velocity > max_velocity:
+            initial = self.State(initial.position, max_velocity)
+        self._initial = initial
+        self._goal = goal
+
+        # Deal with a possibly truncated motion profile (with nonzero initial or
+        # final velocity) by calculating the parameters as if the profile began
+        # and ended at zero velocity.
+        cutoff_begin = initial.velocity / max_acceleration
+        cutoff_dist_begin = cutoff_begin * cutoff_begin * max_acceleration / 2
+
+        cutoff_end = goal.velocity / max_acceleration
+        cutoff_dist_end = cutoff_end * cutoff_end * max_acceleration / 2
+
+        # Now we can calculate the parameters as if it was a full trapezoid
+        # instead of a truncated one.
+        full_trapezoid_dist = (
+            cutoff_dist_begin + (goal.position - initial.position) + cutoff_dist_end
+        )
+        acceleration_time = max_velocity / max_acceleration
+
+        full_speed_dist = (
+            full_trapezoid_dist
+            - acceleration_time * acceleration_time * max_acceleration
+        )
+
+        # Handle the case where the profile never reaches full speed.
+        if full_speed_dist < 0:
+            acceleration_time = math.sqrt(full_trapezoid_dist / max_acceleration)
+            full_speed_dist = 0
+
+        self._end_accel = acceleration_time - cutoff_begin
+        self._end_full_speed = self._end_accel + full_speed_dist / max_velocity
+        self._end_deccel = self._end_full_speed + acceleration_time - cutoff_end
+
+    def _direct(self, state: State) -> State:
+        direction = self._direction
+        return self.State(state.position * direction, state.velocity * direction)
+
+    def calculate(self, t: Time) -> State:
+        """Calculates the position and velocity of the profile at time t,
+        where the beginning of the profile was at time t = 0.
+
+        :param t: The time since the beginning of the profile,
+                  or an array of times.
+
+        :returns: The state at time t, with arrays if t is an array.
+        """
+        initial = self._initial
+        goal = self._goal
+        max_velocity, max_acceleration = self.constraints
+        end_accel = self._end_accel
+        end_full_speed = self._end_full_speed
+        end_deccel = self._end_deccel
+
+        t = np.asarray(t, dtype=float)
+        time_left = end_deccel - t
+        accel_position = (
+            initial.position + (initial.velocity + t * max_acceleration / 2) * t
+        )
+        cruise_position = (
+            initial.position
+            + (initial.velocity + end_accel * max_acceleration / 2) * end_accel
+            + max_velocity * (t - end_accel)
+        )
+        deccel_position = (
+            goal.position
+            - (goal.velocity + time_left * max_acceleration / 2) * time_left
+        )
+
+        conditions = [t < end_accel, t < end_full_speed, t <= end_deccel]
+        position = np.select(
+            conditions,
+            [accel_position, cruise_position, deccel_position],
+            goal.position,
+        )
+        velocity = np.select(
+            conditions,
+            [
+                initial.velocity + t * max_acceleration,
+                max_velocity,
+                goal.velocity + time_left * max_acceleration,
+            ],
+            goal.velocity,
+        )
+
+        direction = self._direction
+        if position.ndim == 0:
+            return self.State(float(position) * direction, float(velocity) * direction)
+        return self.State(position * direction, velocity * direction)
+
+    def totalTime(self) -> float:
+        """Returns the total time the profile takes to reach the goal."""
+        return self._end_deccel